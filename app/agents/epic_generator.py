@@ -6,30 +6,104 @@ CrewAI agent that generates Epics and Features from validated PI goals
 import re
 import time
 import random
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from collections import defaultdict
+from enum import IntEnum
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Mapping, Tuple
+from datetime import datetime, timezone
+
+# Default Epic acceptance criteria, shared (read-only) by every generated Epic
+_EPIC_ACCEPTANCE_CRITERIA = (
+    "All features are implemented and tested",
+    "Business requirements are met",
+    "Performance targets are achieved"
+)
+
+class EffortSize(IntEnum):
+    """T-shirt effort sizes; values index into EpicGeneratorAgent._EFFORT_POINTS"""
+    XS = 0
+    S = 1
+    M = 2
+    L = 3
+    XL = 4
+    XXL = 5
 
 class EpicGeneratorAgent:
     """
     CrewAI agent specialized in generating Epics and Features from PI goals
     """
     
-    def __init__(self):
+    # Upper bound on goals built concurrently per agent
+    MAX_CONCURRENT_GOALS = 8
+    
+    # Story points per EffortSize (mirrors effort_guidelines)
+    _EFFORT_POINTS = (1, 2, 3, 5, 8, 13)
+    
+    # Standard feature breakdown per Epic (read-only, shared by all instances)
+    _FEATURE_TEMPLATES = tuple(MappingProxyType(template) for template in (
+        {
+            'title': 'Requirements Analysis and Design',
+            'description': 'Analyze requirements and create technical design',
+            'acceptance_criteria': ('Requirements documented', 'Design approved'),
+            'effort_size': EffortSize.M
+        },
+        {
+            'title': 'Core Implementation',
+            'description': 'Implement core functionality',
+            'acceptance_criteria': ('Core features working', 'Unit tests passing'),
+            'effort_size': EffortSize.L
+        },
+        {
+            'title': 'User Interface Development',
+            'description': 'Create user interface components',
+            'acceptance_criteria': ('UI components created', 'Responsive design'),
+            'effort_size': EffortSize.M
+        },
+        {
+            'title': 'Integration and Testing',
+            'description': 'Integrate components and perform testing',
+            'acceptance_criteria': ('Integration complete', 'All tests passing'),
+            'effort_size': EffortSize.M
+        },
+        {
+            'title': 'Documentation and Deployment',
+            'description': 'Create documentation and deploy to production',
+            'acceptance_criteria': ('Documentation complete', 'Successfully deployed'),
+            'effort_size': EffortSize.S
+        }
+    ))
+    
+    def __init__(self, simulate_latency: float = 0.0, seed: Optional[int] = None):
         self.agent_name = "Epic Generator Agent"
         self.role = "Epic & Feature Architect"
         self.goal = "Generate structured Epics and Features from PI goals"
+        self.simulate_latency = simulate_latency
+        self._rng = random.Random(seed)  # Per-instance RNG; pass a seed for reproducible IDs
         self.backstory = "Expert in breaking down high-level goals into actionable development work"
         
-        # Team categories for assignment
+        # Team categories for assignment (dict order is the tie-break priority)
         self.team_categories = {
-            'Frontend': ['UI', 'UX', 'React', 'Angular', 'Vue', 'mobile', 'web', 'interface'],
-            'Backend': ['API', 'service', 'database', 'server', 'microservice', 'integration'],
-            'DevOps': ['deployment', 'infrastructure', 'CI/CD', 'monitoring', 'security'],
-            'QA': ['testing', 'quality', 'automation', 'validation', 'verification'],
-            'Data': ['analytics', 'reporting', 'data', 'metrics', 'dashboard'],
-            'Security': ['security', 'authentication', 'authorization', 'compliance']
+            'Frontend': frozenset(['ui', 'ux', 'react', 'angular', 'vue', 'mobile', 'web', 'interface']),
+            'Backend': frozenset(['api', 'service', 'database', 'server', 'microservice', 'integration']),
+            'DevOps': frozenset(['deployment', 'infrastructure', 'ci/cd', 'monitoring', 'security']),
+            'QA': frozenset(['testing', 'quality', 'automation', 'validation', 'verification']),
+            'Data': frozenset(['analytics', 'reporting', 'data', 'metrics', 'dashboard']),
+            'Security': frozenset(['security', 'authentication', 'authorization', 'compliance'])
         }
         
+        # Keyword -> team, first team wins for shared keywords (e.g. 'security')
+        self._keyword_to_team = {}
+        for team, keywords in self.team_categories.items():
+            for keyword in keywords:
+                self._keyword_to_team.setdefault(keyword, team)
+        self._team_rank = {team: rank for rank, team in enumerate(self.team_categories)}
+        
+        # Single keyword union in team order; the lookahead reports overlapping keywords too
+        self._team_keyword_re = re.compile(
+            '(?=(' + '|'.join(re.escape(keyword) for keyword in self._keyword_to_team) + '))'
+        )
+        
         # Effort estimation guidelines (story points)
         self.effort_guidelines = {
             'XS': {'points': 1, 'description': 'Simple configuration or minor UI change'},
@@ -39,31 +113,48 @@ class EpicGeneratorAgent:
             'XL': {'points': 8, 'description': 'Complex feature with significant integration'},
             'XXL': {'points': 13, 'description': 'Epic-level work requiring breakdown'}
         }
+        
+        # Action-verb patterns for Epic titles, in priority order (delivery verbs beat
+        # improvement verbs anywhere in the text, so they are kept as two searches)
+        self._action_patterns = tuple(
+            re.compile(p, re.IGNORECASE) for p in (
+                r'(implement|develop|create|build|establish|design)\s+([^.]+)',
+                r'(improve|enhance|optimize)\s+([^.]+)'
+            )
+        )
+        
+        # Template team assignments never change, so resolve them once
+        self._template_teams = tuple(
+            self._suggest_team_assignment(template['title']) for template in self._FEATURE_TEMPLATES
+        )
+        
+        # Per-goal workers live as long as the agent (threads are started on demand)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.MAX_CONCURRENT_GOALS, thread_name_prefix='epic-generator'
+        )
     
     def generate_epics_and_features(self, goals: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Main method to generate Epics and Features from validated goals
         """
         
-        # Simulate agent processing time
-        time.sleep(2)
+        # Optional demo latency (off by default)
+        if self.simulate_latency:
+            time.sleep(self.simulate_latency)
         
         generated_epics = []
         all_features = []
         
-        for goal in goals:
-            # Generate Epic from goal
-            epic = self._generate_epic_from_goal(goal)
-            
-            # Generate Features for the Epic
-            features = self._generate_features_for_epic(epic, goal)
-            
-            epic['features'] = features
-            epic['feature_count'] = len(features)
-            epic['total_effort'] = sum(f['effort_points'] for f in features)
-            
+        # Draw every Epic/Feature ID up front: unique per run and no RNG shared across threads
+        ids_per_goal = 1 + len(self._FEATURE_TEMPLATES[:5])
+        id_count = len(goals) * ids_per_goal
+        id_pool = self._rng.sample(range(1000, 1000 + max(9000, id_count)), id_count)
+        goal_ids = [id_pool[i:i + ids_per_goal] for i in range(0, id_count, ids_per_goal)]
+        
+        # Goals are independent, so build their Epics concurrently (map keeps goal order)
+        for epic in self._executor.map(self._build_epic, goals, goal_ids):
             generated_epics.append(epic)
-            all_features.extend(features)
+            all_features.extend(epic['features'])
         
         # Generate team assignments
         team_assignments = self._assign_teams_to_features(all_features)
@@ -82,10 +173,25 @@ class EpicGeneratorAgent:
                 'estimated_weeks': max(1, total_effort // 20),
                 'teams_involved': len(team_assignments)
             },
-            'generated_at': datetime.now().isoformat()
+            'generated_at': datetime.now(timezone.utc).isoformat()
         }
     
-    def _generate_epic_from_goal(self, goal: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_epic(self, goal: Dict[str, Any], ids: List[int]) -> Dict[str, Any]:
+        """Generate an Epic and its Features for a single goal from pre-drawn IDs"""
+        
+        # Generate Epic from goal
+        epic = self._generate_epic_from_goal(goal, ids[0])
+        
+        # Generate Features for the Epic
+        features = self._generate_features_for_epic(epic, goal, ids[1:])
+        
+        epic['features'] = features
+        epic['feature_count'] = len(features)
+        epic['total_effort'] = sum(f['effort_points'] for f in features)
+        
+        return epic
+    
+    def _generate_epic_from_goal(self, goal: Dict[str, Any], epic_number: int) -> Dict[str, Any]:
         """Generate an Epic from a PI goal"""
         
         goal_text = goal.get('text', goal.get('original_text', ''))
@@ -95,16 +201,12 @@ class EpicGeneratorAgent:
         epic_title = self._extract_epic_title(goal_text, goal_title)
         
         return {
-            'id': f"EPIC-{random.randint(1000, 9999)}",
+            'id': f"EPIC-{epic_number}",
             'title': epic_title,
             'description': goal_text[:200] + "..." if len(goal_text) > 200 else goal_text,
             'priority': goal.get('priority', 'Medium'),
             'category': goal.get('category', 'Business'),
-            'acceptance_criteria': [
-                "All features are implemented and tested",
-                "Business requirements are met",
-                "Performance targets are achieved"
-            ],
+            'acceptance_criteria': _EPIC_ACCEPTANCE_CRITERIA,
             'original_goal': goal_text,
             'status': 'To Do'
         }
@@ -116,13 +218,8 @@ class EpicGeneratorAgent:
             return goal_title[:60]
         
         # Look for action verbs
-        action_patterns = [
-            r'(implement|develop|create|build|establish|design)\s+([^.]+)',
-            r'(improve|enhance|optimize)\s+([^.]+)'
-        ]
-        
-        for pattern in action_patterns:
-            match = re.search(pattern, goal_text, re.IGNORECASE)
+        for pattern in self._action_patterns:
+            match = pattern.search(goal_text)
             if match:
                 action = match.group(1).title()
                 objective = match.group(2).strip()[:50]
@@ -130,7 +227,8 @@ class EpicGeneratorAgent:
         
         return "Epic: Business Objective Implementation"
     
-    def _generate_features_for_epic(self, epic: Dict[str, Any], goal: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _generate_features_for_epic(self, epic: Dict[str, Any], goal: Dict[str, Any],
+                                    feature_numbers: List[int]) -> List[Dict[str, Any]]:
         """Generate Features for an Epic"""
         
         features = []
@@ -141,80 +239,47 @@ class EpicGeneratorAgent:
         
         for i, template in enumerate(feature_templates[:5]):
             feature = {
-                'id': f"FEAT-{random.randint(1000, 9999)}",
+                'id': f"FEAT-{feature_numbers[i]}",
                 'epic_id': epic['id'],
                 'title': template['title'],
                 'description': template['description'],
                 'acceptance_criteria': template['acceptance_criteria'],
                 'priority': epic['priority'],
-                'effort_size': template['effort_size'],
-                'effort_points': self.effort_guidelines[template['effort_size']]['points'],
-                'assigned_team': self._suggest_team_assignment(template['title']),
+                'effort_size': template['effort_size'].name,
+                'effort_points': self._EFFORT_POINTS[template['effort_size']],
+                'assigned_team': self._template_teams[i],
                 'status': 'To Do'
             }
             features.append(feature)
         
         return features
     
-    def _get_feature_templates(self, goal_text: str, category: str) -> List[Dict[str, Any]]:
+    def _get_feature_templates(self, goal_text: str, category: str) -> Tuple[Mapping[str, Any], ...]:
         """Get feature templates based on goal content"""
         
-        templates = [
-            {
-                'title': 'Requirements Analysis and Design',
-                'description': 'Analyze requirements and create technical design',
-                'acceptance_criteria': ['Requirements documented', 'Design approved'],
-                'effort_size': 'M'
-            },
-            {
-                'title': 'Core Implementation',
-                'description': 'Implement core functionality',
-                'acceptance_criteria': ['Core features working', 'Unit tests passing'],
-                'effort_size': 'L'
-            },
-            {
-                'title': 'User Interface Development',
-                'description': 'Create user interface components',
-                'acceptance_criteria': ['UI components created', 'Responsive design'],
-                'effort_size': 'M'
-            },
-            {
-                'title': 'Integration and Testing',
-                'description': 'Integrate components and perform testing',
-                'acceptance_criteria': ['Integration complete', 'All tests passing'],
-                'effort_size': 'M'
-            },
-            {
-                'title': 'Documentation and Deployment',
-                'description': 'Create documentation and deploy to production',
-                'acceptance_criteria': ['Documentation complete', 'Successfully deployed'],
-                'effort_size': 'S'
-            }
-        ]
-        
-        return templates
+        return self._FEATURE_TEMPLATES
     
     def _suggest_team_assignment(self, feature_title: str) -> str:
         """Suggest team assignment based on feature content"""
         
-        title_lower = feature_title.lower()
+        matched_teams = {
+            self._keyword_to_team[match.group(1)]
+            for match in self._team_keyword_re.finditer(feature_title.lower())
+        }
         
-        for team, keywords in self.team_categories.items():
-            for keyword in keywords:
-                if keyword.lower() in title_lower:
-                    return team
+        if matched_teams:
+            # Earliest team in team_categories order wins, as with a sequential scan
+            return min(matched_teams, key=self._team_rank.__getitem__)
         
         return 'Backend'  # Default assignment
     
     def _assign_teams_to_features(self, features: List[Dict[str, Any]]) -> Dict[str, List[str]]:
         """Generate team assignments summary"""
         
-        team_assignments = {}
+        team_assignments = defaultdict(list)
         
+        # Team was classified once at feature creation; just group by it here
         for feature in features:
-            team = feature['assigned_team']
-            if team not in team_assignments:
-                team_assignments[team] = []
-            team_assignments[team].append(feature['title'])
+            team_assignments[feature['assigned_team']].append(feature['title'])
         
-        return team_assignments
+        return dict(team_assignments)
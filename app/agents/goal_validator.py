@@ -6,8 +6,25 @@ CrewAI agent that validates and improves PI goals using SMART criteria
 import re
 import time
 import random
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from bisect import bisect_right
+from collections import Counter
+from itertools import islice
+from typing import Dict, List, Any, Iterator, Optional, Set, Tuple
+from datetime import datetime, timezone
+
+def _fuse_patterns(named_patterns: Dict[str, re.Pattern]) -> re.Pattern:
+    """
+    Fuse compiled patterns into one named-group lookahead alternation (one scan per text).
+    Lookaheads keep a match from consuming text another pattern needs (e.g. '$400 days'),
+    and each pattern keeps its own case sensitivity through a scoped inline flag.
+    """
+    return re.compile('|'.join(
+        f"(?=(?P<{name}>(?{'i' if pattern.flags & re.IGNORECASE else ''}:{pattern.pattern})))"
+        for name, pattern in named_patterns.items()
+    ))
+
+# Criterion fields holding lowercase keyword sets
+KEYWORD_FIELDS = ('keywords', 'anti_keywords', 'warning_keywords', 'contexts')
 
 class GoalValidatorAgent:
     """
@@ -15,40 +32,90 @@ class GoalValidatorAgent:
     Uses SMART criteria (Specific, Measurable, Achievable, Relevant, Time-bound)
     """
     
-    def __init__(self):
+    # Overall recommendation issued when more than half of the goals fail a criterion
+    _COMMON_ISSUE_RECOMMENDATIONS = (
+        ('specific', "Focus on making goals more specific and actionable"),
+        ('measurable', "Add quantifiable metrics and KPIs to all goals"),
+        ('time_bound', "Establish clear deadlines and milestones for all goals"),
+        ('relevant', "Clearly articulate business value and impact for each goal")
+    )
+    
+    def __init__(self, simulate_latency: float = 0.0):
         self.agent_name = "Goal Validator Agent"
         self.role = "SMART Goals Analyst"
         self.goal = "Validate and improve PI goals from documents"
+        self.simulate_latency = simulate_latency
         self.backstory = "Expert in SMART goal methodology and PI planning best practices"
         
         # SMART criteria definitions
         self.smart_criteria = {
             'specific': {
                 'description': 'Goal is clear and well-defined',
-                'keywords': ['implement', 'develop', 'create', 'build', 'establish', 'achieve'],
-                'anti_keywords': ['improve', 'enhance', 'better', 'optimize', 'increase']
+                'keywords': frozenset(['implement', 'develop', 'create', 'build', 'establish', 'achieve']),
+                'anti_keywords': frozenset(['improve', 'enhance', 'better', 'optimize', 'increase'])
             },
             'measurable': {
                 'description': 'Goal has quantifiable success criteria',
-                'keywords': ['%', 'percent', 'number', 'count', 'metric', 'kpi', 'score', 'rating'],
-                'patterns': [r'\d+%', r'\d+\.\d+', r'\$\d+', r'\d+\s*(seconds?|minutes?|hours?|days?|weeks?)']
+                'keywords': frozenset(['%', 'percent', 'number', 'count', 'metric', 'kpi', 'score', 'rating']),
+                'compiled_patterns': [
+                    re.compile(p) for p in
+                    (r'\d+%', r'\d+\.\d+', r'\$\d+', r'\d+\s*(seconds?|minutes?|hours?|days?|weeks?)')
+                ]
             },
             'achievable': {
                 'description': 'Goal is realistic and attainable',
-                'keywords': ['realistic', 'feasible', 'attainable', 'possible'],
-                'warning_keywords': ['revolutionary', 'groundbreaking', '100%', 'perfect', 'eliminate all']
+                'keywords': frozenset(['realistic', 'feasible', 'attainable', 'possible']),
+                'warning_keywords': frozenset(['revolutionary', 'groundbreaking', '100%', 'perfect', 'eliminate all'])
             },
             'relevant': {
                 'description': 'Goal aligns with business objectives',
-                'keywords': ['business value', 'revenue', 'customer', 'user', 'efficiency', 'cost'],
-                'contexts': ['business', 'customer', 'user experience', 'performance', 'security']
+                'keywords': frozenset(['business value', 'revenue', 'customer', 'user', 'efficiency', 'cost']),
+                'contexts': frozenset(['business', 'customer', 'user experience', 'performance', 'security'])
             },
             'time_bound': {
                 'description': 'Goal has clear timeline and deadlines',
-                'keywords': ['by', 'within', 'deadline', 'timeline', 'end of', 'complete by'],
-                'patterns': [r'by\s+\w+\s+\d{4}', r'within\s+\d+\s+\w+', r'end\s+of\s+\w+']
+                'keywords': frozenset(['by', 'within', 'deadline', 'timeline', 'end of', 'complete by']),
+                'compiled_patterns': [
+                    re.compile(p, re.IGNORECASE) for p in
+                    (r'by\s+\w+\s+\d{4}', r'within\s+\d+\s+\w+', r'end\s+of\s+\w+')
+                ]
             }
         }
+        
+        # Fuse every criterion's patterns into one regex, and gather every keyword into one
+        # shared vocabulary; each criterion keeps the names of its own pattern groups
+        named_patterns = {}
+        vocabulary = set()
+        for name, criterion in self.smart_criteria.items():
+            group_names = []
+            for i, pattern in enumerate(criterion.get('compiled_patterns', ())):
+                group_names.append(f'{name}_{i}')
+                named_patterns[f'{name}_{i}'] = pattern
+            criterion['pattern_names'] = frozenset(group_names)
+            for field in KEYWORD_FIELDS:
+                vocabulary.update(criterion.get(field, ()))
+        self._smart_pattern_re = _fuse_patterns(named_patterns)
+        
+        # One lookahead scan finds every vocabulary term. Terms matching at the same
+        # position are prefixes of one another, so the shortest is tried first and its longer
+        # extensions (e.g. 'business' -> 'business value') are confirmed with startswith.
+        ordered_terms = sorted(vocabulary, key=len)
+        self._vocabulary_re = re.compile('(?=(' + '|'.join(re.escape(t) for t in ordered_terms) + '))')
+        self._term_extensions = {
+            term: tuple(other for other in ordered_terms if other != term and other.startswith(term))
+            for term in ordered_terms
+        }
+        
+        # Precompiled text-processing patterns (compiled once, reused per goal)
+        self._anchor_types = ('goal_numbered', 'objective_numbered', 'goal', 'objective')
+        self._goal_anchor_re = re.compile(
+            r'(?P<goal_numbered>GOAL\s+\d+:)|(?P<objective_numbered>OBJECTIVE\s+\d+:)'
+            r'|(?P<goal>Goal:)|(?P<objective>Objective:)',
+            re.IGNORECASE
+        )
+        self._split_re = re.compile(r'\n\s*\n|\d+\.\s+')
+        self._ws_re = re.compile(r'\s+')
+        self._title_re = re.compile(r'(?:GOAL\s+\d+:|Goal:)?\s*([^\n]+)', re.IGNORECASE)
     
     def validate_goals(self, text_content: str) -> Dict[str, Any]:
         """
@@ -61,18 +128,19 @@ class GoalValidatorAgent:
             Dictionary containing validation results and improved goals
         """
         
-        # Simulate agent processing time
-        time.sleep(1)
+        # Optional demo latency (off by default)
+        if self.simulate_latency:
+            time.sleep(self.simulate_latency)
         
         # Extract individual goals from text
-        goals = self._extract_goals(text_content)
+        goals = list(islice(self._extract_goals(text_content), 10))  # Limit to 10 goals max
         
         # Validate each goal against SMART criteria
         validated_goals = []
         total_smart_score = 0
         
-        for i, goal_text in enumerate(goals):
-            goal_analysis = self._analyze_single_goal(goal_text, i + 1)
+        for i, (goal_text, goal_scan) in enumerate(zip(goals, self._scan_goals(goals))):
+            goal_analysis = self._analyze_single_goal(goal_text, i + 1, *goal_scan)
             validated_goals.append(goal_analysis)
             total_smart_score += goal_analysis['smart_score']
         
@@ -87,49 +155,85 @@ class GoalValidatorAgent:
             'smart_score': overall_smart_score,
             'quality_level': quality_level,
             'recommendations': self._generate_overall_recommendations(validated_goals),
-            'processed_at': datetime.now().isoformat()
+            'processed_at': datetime.now(timezone.utc).isoformat()
         }
     
-    def _extract_goals(self, text_content: str) -> List[str]:
-        """Extract individual goals from text content"""
-        
-        # Look for common goal patterns
-        goal_patterns = [
-            r'GOAL\s+\d+:.*?(?=GOAL\s+\d+:|$)',
-            r'OBJECTIVE\s+\d+:.*?(?=OBJECTIVE\s+\d+:|$)',
-            r'Goal:.*?(?=Goal:|$)',
-            r'Objective:.*?(?=Objective:|$)'
-        ]
-        
-        goals = []
-        
-        for pattern in goal_patterns:
-            matches = re.findall(pattern, text_content, re.DOTALL | re.IGNORECASE)
-            goals.extend([match.strip() for match in matches])
-        
-        # If no structured goals found, try to split by common separators
-        if not goals:
-            # Split by double newlines or numbered sections
-            potential_goals = re.split(r'\n\s*\n|\d+\.\s+', text_content)
-            goals = [goal.strip() for goal in potential_goals if len(goal.strip()) > 50]
+    def _extract_goals(self, text_content: str) -> Iterator[str]:
+        """Yield cleaned individual goals from text content, lazily"""
+        
+        # Locate every goal anchor in one linear pass, bucketed by anchor type
+        anchor_starts = {anchor_type: [] for anchor_type in self._anchor_types}
+        for match in self._goal_anchor_re.finditer(text_content):
+            anchor_starts[match.lastgroup].append(match.start())
+        
+        if any(anchor_starts.values()):
+            # Each goal runs from its anchor to the next anchor of the same type (or end of text)
+            goals = (
+                text_content[start:end]
+                for starts in anchor_starts.values()
+                for start, end in zip(starts, starts[1:] + [len(text_content)])
+            )
+        else:
+            # No structured goals found: split by double newlines or numbered sections
+            goals = (
+                goal for goal in self._split_re.split(text_content)
+                if len(goal.strip()) > 50
+            )
         
         # Clean up goals
-        cleaned_goals = []
         for goal in goals:
             # Remove extra whitespace and normalize
-            cleaned_goal = re.sub(r'\s+', ' ', goal.strip())
+            cleaned_goal = self._ws_re.sub(' ', goal.strip())
             if len(cleaned_goal) > 20:  # Minimum goal length
-                cleaned_goals.append(cleaned_goal)
-        
-        return cleaned_goals[:10]  # Limit to 10 goals max
+                yield cleaned_goal
     
-    def _analyze_single_goal(self, goal_text: str, goal_number: int) -> Dict[str, Any]:
+    def _join_goals(self, texts: List[str]) -> Tuple[str, List[int]]:
+        """Join texts with NUL separators, returning the joined text and each text's start offset"""
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        return '\x00'.join(texts), starts
+    
+    def _scan_goals(self, goals: List[str]) -> List[Tuple[str, Set[str], Set[str]]]:
+        """
+        Scan all goals for vocabulary terms and SMART patterns in one regex pass each.
+        Goals are joined with NUL separators (no term or pattern can match across one) and every
+        hit is credited to its goal by bisecting the goal start offsets.
+        Returns (text_lower, terms, pattern_hits) per goal.
+        """
+        lowered = [goal.lower() for goal in goals]
+        scans = [(text_lower, set(), set()) for text_lower in lowered]
+        
+        # SMART patterns run on the original text (they carry their own case flags)
+        joined, starts = self._join_goals(goals)
+        for match in self._smart_pattern_re.finditer(joined):
+            scans[bisect_right(starts, match.start()) - 1][2].add(match.lastgroup)
+        
+        # Keywords run on the lowercased text; case-folding can change lengths, hence new offsets
+        joined, starts = self._join_goals(lowered)
+        for match in self._vocabulary_re.finditer(joined):
+            term = match.group(1)
+            found = scans[bisect_right(starts, match.start()) - 1][1]
+            found.add(term)
+            for longer in self._term_extensions[term]:
+                if joined.startswith(longer, match.start()):
+                    found.add(longer)
+        
+        return scans
+    
+    def _analyze_single_goal(self, goal_text: str, goal_number: int, text_lower: str,
+                             terms: Set[str], pattern_hits: Set[str]) -> Dict[str, Any]:
         """Analyze a single goal against SMART criteria"""
         
         # Extract goal title
-        title_match = re.search(r'(?:GOAL\s+\d+:|Goal:)?\s*([^\n]+)', goal_text, re.IGNORECASE)
+        title_match = self._title_re.search(goal_text)
         title = title_match.group(1).strip() if title_match else f"Goal {goal_number}"
         
+        # Goals are whitespace-normalized, so single spaces separate the words
+        word_count = goal_text.count(' ') + 1
+        
         # Analyze against each SMART criterion
         smart_assessment = {}
         issues = []
@@ -137,7 +241,7 @@ class GoalValidatorAgent:
         smart_score = 0
         
         # Specific
-        specific_score = self._check_specific(goal_text)
+        specific_score = self._check_specific(goal_text, text_lower, terms, pattern_hits, word_count)
         smart_assessment['specific'] = specific_score > 0.4
         if not smart_assessment['specific']:
             issues.append("Goal lacks specificity - too vague or general")
@@ -145,7 +249,7 @@ class GoalValidatorAgent:
         smart_score += specific_score * 20
         
         # Measurable
-        measurable_score = self._check_measurable(goal_text)
+        measurable_score = self._check_measurable(goal_text, text_lower, terms, pattern_hits)
         smart_assessment['measurable'] = measurable_score > 0.3
         if not smart_assessment['measurable']:
             issues.append("Goal lacks measurable success criteria")
@@ -153,7 +257,7 @@ class GoalValidatorAgent:
         smart_score += measurable_score * 20
         
         # Achievable
-        achievable_score = self._check_achievable(goal_text)
+        achievable_score = self._check_achievable(goal_text, text_lower, terms, pattern_hits)
         smart_assessment['achievable'] = achievable_score > 0.3
         if not smart_assessment['achievable']:
             issues.append("Goal may be unrealistic or overly ambitious")
@@ -161,7 +265,7 @@ class GoalValidatorAgent:
         smart_score += achievable_score * 20
         
         # Relevant
-        relevant_score = self._check_relevant(goal_text)
+        relevant_score = self._check_relevant(goal_text, text_lower, terms, pattern_hits)
         smart_assessment['relevant'] = relevant_score > 0.3
         if not smart_assessment['relevant']:
             issues.append("Goal lacks clear business relevance or value")
@@ -169,7 +273,7 @@ class GoalValidatorAgent:
         smart_score += relevant_score * 20
         
         # Time-bound
-        time_bound_score = self._check_time_bound(goal_text)
+        time_bound_score = self._check_time_bound(goal_text, text_lower, terms, pattern_hits)
         smart_assessment['time_bound'] = time_bound_score > 0.3
         if not smart_assessment['time_bound']:
             issues.append("Goal lacks clear timeline or deadline")
@@ -189,45 +293,38 @@ class GoalValidatorAgent:
             'recommendations': recommendations
         }
     
-    def _check_specific(self, goal_text: str) -> float:
+    def _check_specific(self, goal_text: str, text_lower: str, terms: Set[str], pattern_hits: Set[str],
+                        word_count: int) -> float:
         """Check if goal is specific"""
         score = 0.0
-        text_lower = goal_text.lower()
+        criterion = self.smart_criteria['specific']
         
         # Check for specific action words
-        specific_words = self.smart_criteria['specific']['keywords']
-        for word in specific_words:
-            if word in text_lower:
-                score += 0.2
+        for word in criterion['keywords'] & terms:
+            score += 0.2
         
         # Penalize vague words
-        vague_words = self.smart_criteria['specific']['anti_keywords']
-        for word in vague_words:
-            if word in text_lower:
-                score -= 0.1
+        for word in criterion['anti_keywords'] & terms:
+            score -= 0.1
         
         # Check for detailed descriptions
-        if len(goal_text.split()) > 20:
+        if word_count > 20:
             score += 0.2
         
         return min(1.0, max(0.0, score))
     
-    def _check_measurable(self, goal_text: str) -> float:
+    def _check_measurable(self, goal_text: str, text_lower: str, terms: Set[str], pattern_hits: Set[str]) -> float:
         """Check if goal is measurable"""
         score = 0.0
-        text_lower = goal_text.lower()
+        criterion = self.smart_criteria['measurable']
         
         # Check for measurement keywords
-        measure_words = self.smart_criteria['measurable']['keywords']
-        for word in measure_words:
-            if word in text_lower:
-                score += 0.2
+        for word in criterion['keywords'] & terms:
+            score += 0.2
         
         # Check for numeric patterns
-        patterns = self.smart_criteria['measurable']['patterns']
-        for pattern in patterns:
-            if re.search(pattern, goal_text):
-                score += 0.3
+        for pattern in criterion['pattern_names'] & pattern_hits:
+            score += 0.3
         
         # Check for success criteria section
         if 'success criteria' in text_lower or 'metrics' in text_lower:
@@ -235,64 +332,52 @@ class GoalValidatorAgent:
         
         return min(1.0, max(0.0, score))
     
-    def _check_achievable(self, goal_text: str) -> float:
+    def _check_achievable(self, goal_text: str, text_lower: str, terms: Set[str], pattern_hits: Set[str]) -> float:
         """Check if goal is achievable"""
         score = 0.7  # Default to achievable unless red flags
-        text_lower = goal_text.lower()
+        criterion = self.smart_criteria['achievable']
         
         # Check for warning words that suggest unrealistic goals
-        warning_words = self.smart_criteria['achievable']['warning_keywords']
-        for word in warning_words:
-            if word in text_lower:
-                score -= 0.2
+        for word in criterion['warning_keywords'] & terms:
+            score -= 0.2
         
         # Check for realistic language
-        realistic_words = self.smart_criteria['achievable']['keywords']
-        for word in realistic_words:
-            if word in text_lower:
-                score += 0.1
+        for word in criterion['keywords'] & terms:
+            score += 0.1
         
         return min(1.0, max(0.0, score))
     
-    def _check_relevant(self, goal_text: str) -> float:
+    def _check_relevant(self, goal_text: str, text_lower: str, terms: Set[str], pattern_hits: Set[str]) -> float:
         """Check if goal is relevant to business"""
         score = 0.0
-        text_lower = goal_text.lower()
+        criterion = self.smart_criteria['relevant']
         
         # Check for business relevance keywords
-        relevant_words = self.smart_criteria['relevant']['keywords']
-        for word in relevant_words:
-            if word in text_lower:
-                score += 0.2
+        for word in criterion['keywords'] & terms:
+            score += 0.2
         
         # Check for business value statement
         if 'business value' in text_lower or 'impact' in text_lower:
             score += 0.3
         
         # Check for context alignment
-        contexts = self.smart_criteria['relevant']['contexts']
-        for context in contexts:
-            if context in text_lower:
-                score += 0.1
+        for word in criterion['contexts'] & terms:
+            score += 0.1
         
         return min(1.0, max(0.0, score))
     
-    def _check_time_bound(self, goal_text: str) -> float:
+    def _check_time_bound(self, goal_text: str, text_lower: str, terms: Set[str], pattern_hits: Set[str]) -> float:
         """Check if goal is time-bound"""
         score = 0.0
-        text_lower = goal_text.lower()
+        criterion = self.smart_criteria['time_bound']
         
         # Check for time-related keywords
-        time_words = self.smart_criteria['time_bound']['keywords']
-        for word in time_words:
-            if word in text_lower:
-                score += 0.2
+        for word in criterion['keywords'] & terms:
+            score += 0.2
         
         # Check for time patterns
-        patterns = self.smart_criteria['time_bound']['patterns']
-        for pattern in patterns:
-            if re.search(pattern, goal_text, re.IGNORECASE):
-                score += 0.4
+        for pattern in criterion['pattern_names'] & pattern_hits:
+            score += 0.4
         
         # Check for PI-specific timeline
         if 'pi' in text_lower or 'program increment' in text_lower:
@@ -304,7 +389,7 @@ class GoalValidatorAgent:
         """Generate an improved version of the goal"""
         
         # Extract the core objective
-        title_match = re.search(r'(?:GOAL\s+\d+:|Goal:)?\s*([^\n]+)', original_goal, re.IGNORECASE)
+        title_match = self._title_re.search(original_goal)
         core_objective = title_match.group(1).strip() if title_match else "Achieve objective"
         
         # Build improved goal components
@@ -359,29 +444,18 @@ class GoalValidatorAgent:
         
         recommendations = []
         
-        # Analyze common issues across goals
-        all_issues = []
-        for goal in validated_goals:
-            all_issues.extend(goal['issues'])
-        
-        # Count issue frequency
-        issue_counts = {}
-        for issue in all_issues:
-            issue_type = issue.split(' - ')[0] if ' - ' in issue else issue
-            issue_counts[issue_type] = issue_counts.get(issue_type, 0) + 1
+        # Count failed criteria across goals in one pass (each failure is one issue)
+        failure_counts = Counter(
+            criterion
+            for goal in validated_goals
+            for criterion, passed in goal['smart_assessment'].items()
+            if not passed
+        )
         
         # Generate recommendations based on common issues
-        if issue_counts.get("Goal lacks specificity", 0) > len(validated_goals) * 0.5:
-            recommendations.append("Focus on making goals more specific and actionable")
-        
-        if issue_counts.get("Goal lacks measurable success criteria", 0) > len(validated_goals) * 0.5:
-            recommendations.append("Add quantifiable metrics and KPIs to all goals")
-        
-        if issue_counts.get("Goal lacks clear timeline", 0) > len(validated_goals) * 0.5:
-            recommendations.append("Establish clear deadlines and milestones for all goals")
-        
-        if issue_counts.get("Goal lacks clear business relevance", 0) > len(validated_goals) * 0.5:
-            recommendations.append("Clearly articulate business value and impact for each goal")
+        for criterion, recommendation in self._COMMON_ISSUE_RECOMMENDATIONS:
+            if failure_counts[criterion] > len(validated_goals) * 0.5:
+                recommendations.append(recommendation)
         
         # Add general recommendations
         recommendations.extend([
@@ -2,9 +2,59 @@
 Reusable file upload components for PI Planning Dashboard
 """
 
+import codecs
 import streamlit as st
-from typing import List, Optional, Dict, Any
-from pathlib import Path
+from typing import IO, List, Optional, Dict, Any, Tuple, Union
+
+# Valid extensions for each content type ('any' accepts every file type)
+_VALID_EXTENSIONS = {
+    'document': ('.docx', '.doc', '.pdf', '.txt', '.rtf'),
+    'spreadsheet': ('.xlsx', '.xls', '.csv', '.ods'),
+    'image': ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg'),
+    'any': ()
+}
+
+# Extension -> (magic bytes, error message) for formats with a known file signature
+_FILE_SIGNATURES = {
+    '.pdf': (b'%PDF', 'Invalid PDF file format'),
+    '.docx': (b'PK', 'Invalid Office document format'),
+    '.xlsx': (b'PK', 'Invalid Office document format')
+}
+
+def _file_extension(name: str) -> str:
+    """Lowercased file extension including the dot, matching Path(name).suffix.lower()"""
+    i = name.rfind('.')
+    return name[i:].lower() if 0 < i < len(name) - 1 else ''
+
+# Bytes of CSV content hashed into the preview cache key
+_CSV_PREVIEW_KEY_BYTES = 1 << 20
+
+# Bounding box for image previews
+_IMAGE_PREVIEW_SIZE = (800, 800)
+
+# Drag-drop area styling, built once at import
+_DRAG_DROP_CSS = """
+    <style>
+    .upload-area {
+        border: 2px dashed #cccccc;
+        border-radius: 10px;
+        padding: 2rem;
+        text-align: center;
+        background-color: #f8f9fa;
+        margin: 1rem 0;
+        transition: all 0.3s ease;
+    }
+    .upload-area:hover {
+        border-color: #1f77b4;
+        background-color: #e8f4f8;
+    }
+    .upload-icon {
+        font-size: 3rem;
+        color: #666;
+        margin-bottom: 1rem;
+    }
+    </style>
+    """
 
 def render_file_uploader(
     label: str,
@@ -53,7 +103,7 @@ def render_file_uploader(
             st.metric("File Size", f"{file_size_mb:.1f}MB")
         
         with col3:
-            file_type = Path(uploaded_file.name).suffix.lower()
+            file_type = _file_extension(uploaded_file.name)
             st.metric("File Type", file_type)
         
         return uploaded_file
@@ -80,28 +130,7 @@ def render_drag_drop_area(
     """
     
     # Custom CSS for drag-drop styling
-    st.markdown("""
-    <style>
-    .upload-area {
-        border: 2px dashed #cccccc;
-        border-radius: 10px;
-        padding: 2rem;
-        text-align: center;
-        background-color: #f8f9fa;
-        margin: 1rem 0;
-        transition: all 0.3s ease;
-    }
-    .upload-area:hover {
-        border-color: #1f77b4;
-        background-color: #e8f4f8;
-    }
-    .upload-icon {
-        font-size: 3rem;
-        color: #666;
-        margin-bottom: 1rem;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_DRAG_DROP_CSS, unsafe_allow_html=True)
     
     # Upload area
     st.markdown(f"""
@@ -127,6 +156,9 @@ def validate_file_content(uploaded_file, expected_content_type: str) -> Dict[str
     """
     Validate file content based on expected type
     
+    Reads the file signature from the upload's buffer without moving its file pointer,
+    so callers need not (and should not rely on) re-seeking afterwards.
+    
     Args:
         uploaded_file: Streamlit uploaded file object
         expected_content_type: Expected content type ('document', 'spreadsheet', 'image')
@@ -138,18 +170,10 @@ def validate_file_content(uploaded_file, expected_content_type: str) -> Dict[str
     if uploaded_file is None:
         return {'valid': False, 'error': 'No file provided'}
     
-    file_extension = Path(uploaded_file.name).suffix.lower()
-    
-    # Define valid extensions for each content type
-    valid_extensions = {
-        'document': ['.docx', '.doc', '.pdf', '.txt', '.rtf'],
-        'spreadsheet': ['.xlsx', '.xls', '.csv', '.ods'],
-        'image': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg'],
-        'any': []  # Accept any file type
-    }
+    file_extension = _file_extension(uploaded_file.name)
     
     if expected_content_type != 'any':
-        expected_extensions = valid_extensions.get(expected_content_type, [])
+        expected_extensions = _VALID_EXTENSIONS.get(expected_content_type, ())
         
         if file_extension not in expected_extensions:
             return {
@@ -159,22 +183,40 @@ def validate_file_content(uploaded_file, expected_content_type: str) -> Dict[str
     
     # Additional validation based on file content
     try:
-        # Read first few bytes to validate file signature
-        file_bytes = uploaded_file.read(1024)
-        uploaded_file.seek(0)  # Reset file pointer
+        # Peek at the first few bytes to validate the file signature. Slicing the
+        # in-memory buffer copies only those bytes and leaves the file pointer untouched.
+        with uploaded_file.getbuffer() as buffer:
+            file_bytes = bytes(buffer[:8])
         
         # Basic file signature validation
-        if expected_content_type == 'document':
-            if file_extension == '.pdf' and not file_bytes.startswith(b'%PDF'):
-                return {'valid': False, 'error': 'Invalid PDF file format'}
-            elif file_extension in ['.docx', '.xlsx'] and not file_bytes.startswith(b'PK'):
-                return {'valid': False, 'error': 'Invalid Office document format'}
+        signature = _FILE_SIGNATURES.get(file_extension)
+        if signature and not file_bytes.startswith(signature[0]):
+            return {'valid': False, 'error': signature[1]}
         
         return {'valid': True, 'message': 'File validation successful'}
     
     except Exception as e:
         return {'valid': False, 'error': f'File validation error: {str(e)}'}
 
+@st.cache_data(show_spinner=False)
+def _load_csv_preview(name: str, size: int, head: bytes, _uploaded_file) -> Tuple[Any, int]:
+    """
+    Parse the first 10 rows of an uploaded CSV and count its total rows
+    
+    The leading underscore keeps Streamlit from hashing the file object itself;
+    name, size and the first MB of content form the cache key instead.
+    """
+    import pandas as pd
+    df = pd.read_csv(_uploaded_file, nrows=10, engine='c')  # Parse only the preview rows
+    _uploaded_file.seek(0)  # Reset file pointer
+    
+    # Count rows by scanning lines instead of parsing the whole file
+    # (quoted fields spanning several lines would be over-counted)
+    total_rows = max(0, sum(1 for _ in _uploaded_file) - 1)
+    _uploaded_file.seek(0)
+    
+    return df, total_rows
+
 def display_file_preview(uploaded_file, max_preview_size: int = 500) -> None:
     """
     Display a preview of the uploaded file content
@@ -187,16 +229,21 @@ def display_file_preview(uploaded_file, max_preview_size: int = 500) -> None:
     if uploaded_file is None:
         return
     
-    file_extension = Path(uploaded_file.name).suffix.lower()
+    file_extension = _file_extension(uploaded_file.name)
     
     st.markdown("### 👀 File Preview")
     
     try:
         if file_extension == '.txt':
             # Text file preview
-            content = uploaded_file.read().decode('utf-8')
+            # Read only enough bytes for the preview plus one character
+            # (UTF-8 needs at most 4 bytes per character)
+            raw = uploaded_file.read(4 * (max_preview_size + 1))
             uploaded_file.seek(0)  # Reset file pointer
             
+            # Incremental decoding holds back a multi-byte character cut off at the end
+            content = codecs.getincrementaldecoder('utf-8')(errors='replace').decode(raw)
+            
             preview_content = content[:max_preview_size]
             if len(content) > max_preview_size:
                 preview_content += "..."
@@ -204,17 +251,25 @@ def display_file_preview(uploaded_file, max_preview_size: int = 500) -> None:
             st.text_area("File content preview", preview_content, height=200, disabled=True)
         
         elif file_extension == '.csv':
-            # CSV file preview
-            import pandas as pd
-            df = pd.read_csv(uploaded_file)
-            uploaded_file.seek(0)  # Reset file pointer
+            # CSV file preview (cached across reruns, keyed on name, size and first MB)
+            with uploaded_file.getbuffer() as buffer:
+                head = bytes(buffer[:_CSV_PREVIEW_KEY_BYTES])
+            df, total_rows = _load_csv_preview(uploaded_file.name, uploaded_file.size, head, uploaded_file)
             
-            st.dataframe(df.head(10), use_container_width=True)
-            st.info(f"Showing first 10 rows of {len(df)} total rows")
+            st.dataframe(df, use_container_width=True)
+            st.info(f"Showing first 10 rows of {total_rows} total rows")
         
         elif file_extension in ['.jpg', '.jpeg', '.png', '.gif', '.bmp']:
-            # Image preview
-            st.image(uploaded_file, caption=uploaded_file.name, use_column_width=True)
+            # Image preview (Pillow ships with Streamlit). Downsample before display so a
+            # huge upload is never decoded at full resolution on the server.
+            from PIL import Image
+            image = Image.open(uploaded_file)  # Reads the header only
+            if Image.MAX_IMAGE_PIXELS and image.width * image.height > Image.MAX_IMAGE_PIXELS:
+                st.warning(f"Image is too large to preview ({image.width}x{image.height} pixels)")
+            else:
+                image.thumbnail(_IMAGE_PREVIEW_SIZE)  # Uses JPEG draft mode to decode at reduced scale
+                st.image(image, caption=uploaded_file.name, use_column_width=True)
+            uploaded_file.seek(0)  # Reset file pointer
         
         else:
             # Generic file info
@@ -223,18 +278,25 @@ def display_file_preview(uploaded_file, max_preview_size: int = 500) -> None:
     except Exception as e:
         st.warning(f"Could not generate preview: {str(e)}")
 
-def create_download_link(data, filename: str, mime_type: str = "application/octet-stream") -> None:
+def create_download_link(
+    data: Union[str, bytes, bytearray, memoryview, IO[bytes]],
+    filename: str,
+    mime_type: str = "application/octet-stream"
+) -> None:
     """
     Create a download link for generated data
     
     Args:
-        data: Data to download (bytes or string)
+        data: Data to download. Strings, bytes and binary file objects (e.g. an
+            incrementally written BytesIO) are handed to Streamlit as-is, which
+            encodes strings as UTF-8 itself; no extra copy is made here.
         filename: Name for the downloaded file
         mime_type: MIME type for the file
     """
     
-    if isinstance(data, str):
-        data = data.encode('utf-8')
+    if isinstance(data, (bytearray, memoryview)):
+        # Streamlit only accepts str, bytes or file-like objects
+        data = bytes(data)
     
     st.download_button(
         label=f"📥 Download {filename}",
@@ -244,7 +306,12 @@ def create_download_link(data, filename: str, mime_type: str = "application/octe
         use_container_width=True
     )
 
-def render_file_upload_progress(current_step: int, total_steps: int, step_name: str) -> None:
+def render_file_upload_progress(
+    current_step: int,
+    total_steps: int,
+    step_name: str,
+    placeholder: Optional[Any] = None
+) -> Any:
     """
     Render a progress indicator for file upload/processing
     
@@ -252,15 +319,28 @@ def render_file_upload_progress(current_step: int, total_steps: int, step_name:
         current_step: Current step number
         total_steps: Total number of steps
         step_name: Name of the current step
+        placeholder: Placeholder returned by a previous call in the same script run;
+            passing it back updates the existing indicator in place
+    
+    Returns:
+        The st.empty() placeholder holding the indicator
     """
     
     progress = current_step / total_steps
     
-    st.markdown("### 📊 Processing Progress")
-    st.progress(progress)
-    st.markdown(f"**Step {current_step} of {total_steps}:** {step_name}")
+    # Placeholders belong to a single script run, so they are reused via the return
+    # value rather than kept in session_state across reruns
+    if placeholder is None:
+        placeholder = st.empty()
+    
+    with placeholder.container():
+        st.markdown("### 📊 Processing Progress")
+        st.progress(progress)
+        st.markdown(f"**Step {current_step} of {total_steps}:** {step_name}")
+        
+        if current_step < total_steps:
+            st.info("Please wait while we process your file...")
+        else:
+            st.success("✅ Processing complete!")
     
-    if current_step < total_steps:
-        st.info("Please wait while we process your file...")
-    else:
-        st.success("✅ Processing complete!")
+    return placeholder
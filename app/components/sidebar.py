@@ -4,129 +4,120 @@ Provides navigation and progress tracking across all pages
 """
 
 import streamlit as st
+from types import MappingProxyType
 from typing import Dict, List
 
+# Initial status of every workflow step (copied into session state, never mutated)
+DEFAULT_WORKFLOW_STATUS = MappingProxyType({
+    'jira_wipe': 'pending',
+    'goals_upload': 'pending',
+    'epics_generation': 'pending',
+    'review_push': 'pending',
+    'backlog_analysis': 'pending',
+    'dependency_check': 'pending'
+})
+
+# Initial session statistics shown in the sidebar
+DEFAULT_SESSION_STATS = MappingProxyType({
+    'goals_processed': 0,
+    'epics_generated': 0,
+    'stories_analyzed': 0,
+    'dependencies_found': 0
+})
+
+# Workflow steps shown in the sidebar, in order: (key, title, page, description)
+WORKFLOW_STEPS = (
+    ('jira_wipe', '🗑️ JIRA Cleanup', 'pages/1_🗑️_Wipe_JIRA.py', 'Clean project data'),
+    ('goals_upload', '📄 Upload Goals', 'pages/2_📄_Upload_Goals.py', 'Upload PI goals document'),
+    ('epics_generation', '⚡ Generate Epics', 'pages/3_⚡_Generate_Epics.py', 'AI-generated Epics & Features'),
+    ('review_push', '📊 Review & Push', 'pages/4_📊_Review_Push.py', 'Review and push to JIRA'),
+    ('backlog_analysis', '🔍 Analyze Backlog', 'pages/5_🔍_Analyze_Backlog.py', 'Story quality analysis'),
+    ('dependency_check', '🔗 Dependencies', 'pages/6_🔗_Dependency_Check.py', 'Team dependency mapping')
+)
+
+# Status -> badge HTML (anything unknown renders as pending)
+_STATUS_BADGES = {
+    'complete': '<span class="status-badge status-complete">✅ Complete</span>',
+    'progress': '<span class="status-badge status-progress">🔄 In Progress</span>',
+    'pending': '<span class="status-badge status-pending">⏳ Pending</span>'
+}
+
+# Status -> plain-text icon for widget labels, which cannot render badge HTML
+_STATUS_ICONS = {
+    'complete': '✅',
+    'progress': '🔄',
+    'pending': '⏳'
+}
+
 def get_workflow_status() -> Dict[str, str]:
     """Get the current workflow status from session state"""
     if 'workflow_status' not in st.session_state:
-        st.session_state.workflow_status = {
-            'jira_wipe': 'pending',
-            'goals_upload': 'pending',
-            'epics_generation': 'pending',
-            'review_push': 'pending',
-            'backlog_analysis': 'pending',
-            'dependency_check': 'pending'
-        }
+        st.session_state.workflow_status = dict(DEFAULT_WORKFLOW_STATUS)
     return st.session_state.workflow_status
 
 def update_workflow_status(step: str, status: str):
-    """Update the status of a workflow step"""
-    workflow_status = get_workflow_status()
-    workflow_status[step] = status
-    st.session_state.workflow_status = workflow_status
+    """Update the status of a workflow step (in place, no session_state reassignment)"""
+    get_workflow_status()[step] = status
 
 def get_status_badge(status: str) -> str:
     """Return HTML for status badge"""
-    if status == 'complete':
-        return '<span class="status-badge status-complete">✅ Complete</span>'
-    elif status == 'progress':
-        return '<span class="status-badge status-progress">🔄 In Progress</span>'
-    else:
-        return '<span class="status-badge status-pending">⏳ Pending</span>'
+    return _STATUS_BADGES.get(status, _STATUS_BADGES['pending'])
+
+def _queue_navigation():
+    """Radio callback: remember the selected step so the next rerun switches to it"""
+    st.session_state['_nav_target'] = st.session_state['sidebar_nav']
 
 def render_sidebar():
     """Render the main sidebar with navigation and progress tracking"""
     
     with st.sidebar:
-        st.markdown("# 🎯 PI Planning")
-        st.markdown("### Workflow Progress")
+        st.markdown("# 🎯 PI Planning\n\n### Workflow Progress")
+        
+        # Look up session state once per render
+        session_state = st.session_state
         
         # Get current workflow status
         status = get_workflow_status()
         
-        # Workflow steps with status
-        workflow_steps = [
-            {
-                'key': 'jira_wipe',
-                'title': '🗑️ JIRA Cleanup',
-                'page': 'pages/1_🗑️_Wipe_JIRA.py',
-                'description': 'Clean project data'
-            },
-            {
-                'key': 'goals_upload',
-                'title': '📄 Upload Goals',
-                'page': 'pages/2_📄_Upload_Goals.py',
-                'description': 'Upload PI goals document'
-            },
-            {
-                'key': 'epics_generation',
-                'title': '⚡ Generate Epics',
-                'page': 'pages/3_⚡_Generate_Epics.py',
-                'description': 'AI-generated Epics & Features'
-            },
-            {
-                'key': 'review_push',
-                'title': '📊 Review & Push',
-                'page': 'pages/4_📊_Review_Push.py',
-                'description': 'Review and push to JIRA'
-            },
-            {
-                'key': 'backlog_analysis',
-                'title': '🔍 Analyze Backlog',
-                'page': 'pages/5_🔍_Analyze_Backlog.py',
-                'description': 'Story quality analysis'
-            },
-            {
-                'key': 'dependency_check',
-                'title': '🔗 Dependencies',
-                'page': 'pages/6_🔗_Dependency_Check.py',
-                'description': 'Team dependency mapping'
-            }
-        ]
-        
-        # Render workflow steps
-        for i, step in enumerate(workflow_steps, 1):
-            step_status = status.get(step['key'], 'pending')
-            
-            # Create expandable section for each step
-            with st.expander(f"{i}. {step['title']}", expanded=False):
-                st.markdown(f"**Status:** {get_status_badge(step_status)}", unsafe_allow_html=True)
-                st.markdown(f"*{step['description']}*")
-                
-                if st.button(f"Go to {step['title']}", key=f"nav_{step['key']}", use_container_width=True):
-                    st.switch_page(step['page'])
-        
-        st.markdown("---")
-        
-        # Configuration section
-        st.markdown("### ⚙️ Configuration")
-        
-        # JIRA connection status
-        jira_connected = st.session_state.get('jira_connected', False)
+        # One radio navigates between all steps; the status icon prefixes each label
+        st.radio(
+            "Go to step",
+            options=range(len(WORKFLOW_STEPS)),
+            index=None,
+            format_func=lambda i: (
+                f"{_STATUS_ICONS.get(status.get(WORKFLOW_STEPS[i][0]), _STATUS_ICONS['pending'])} "
+                f"{i + 1}. {WORKFLOW_STEPS[i][1]}"
+            ),
+            key='sidebar_nav',
+            on_change=_queue_navigation,
+            label_visibility='collapsed'
+        )
+        
+        # Switch only on the rerun that follows a user selection
+        nav_target = session_state.pop('_nav_target', None)
+        if nav_target is not None:
+            st.switch_page(WORKFLOW_STEPS[nav_target][2])
+        
+        # Configuration section: connection statuses
+        jira_connected = session_state.get('jira_connected', False)
         jira_status = "🟢 Connected" if jira_connected else "🔴 Disconnected"
-        st.markdown(f"**JIRA:** {jira_status}")
-        
-        # MCP servers status
-        mcp_status = st.session_state.get('mcp_servers_active', 0)
-        st.markdown(f"**MCP Servers:** {mcp_status}/3 Active")
-        
-        # AI agents status
-        agents_ready = st.session_state.get('agents_ready', False)
+        mcp_status = session_state.get('mcp_servers_active', 0)
+        agents_ready = session_state.get('agents_ready', False)
         agents_status = "🟢 Ready" if agents_ready else "🟡 Initializing"
-        st.markdown(f"**AI Agents:** {agents_status}")
-        
-        st.markdown("---")
         
-        # Quick stats
-        st.markdown("### 📊 Quick Stats")
+        # Configuration and Quick Stats headings go out as one markdown element
+        st.markdown(
+            f"---\n\n"
+            f"### ⚙️ Configuration\n\n"
+            f"**JIRA:** {jira_status}\n\n"
+            f"**MCP Servers:** {mcp_status}/3 Active\n\n"
+            f"**AI Agents:** {agents_status}\n\n"
+            f"---\n\n"
+            f"### 📊 Quick Stats"
+        )
         
         # Session statistics
-        stats = st.session_state.get('session_stats', {
-            'goals_processed': 0,
-            'epics_generated': 0,
-            'stories_analyzed': 0,
-            'dependencies_found': 0
-        })
+        stats = session_state.get('session_stats', DEFAULT_SESSION_STATS)
         
         col1, col2 = st.columns(2)
         with col1:
@@ -137,36 +128,23 @@ def render_sidebar():
             st.metric("Epics", stats['epics_generated'])
             st.metric("Dependencies", stats['dependencies_found'])
         
-        st.markdown("---")
-        
         # Help and support
-        st.markdown("### 🆘 Help & Support")
+        st.markdown("---\n\n### 🆘 Help & Support")
         
         if st.button("📖 View Documentation", use_container_width=True):
             st.info("Check the README.md file for detailed documentation and troubleshooting guides.")
         
         if st.button("🔄 Reset Workflow", use_container_width=True):
             # Reset workflow status
-            st.session_state.workflow_status = {
-                'jira_wipe': 'pending',
-                'goals_upload': 'pending',
-                'epics_generation': 'pending',
-                'review_push': 'pending',
-                'backlog_analysis': 'pending',
-                'dependency_check': 'pending'
-            }
-            st.session_state.session_stats = {
-                'goals_processed': 0,
-                'epics_generated': 0,
-                'stories_analyzed': 0,
-                'dependencies_found': 0
-            }
+            session_state.workflow_status = dict(DEFAULT_WORKFLOW_STATUS)
+            session_state.session_stats = dict(DEFAULT_SESSION_STATS)
             st.success("Workflow reset successfully!")
             st.rerun()
         
         # Version info
-        st.markdown("---")
         st.markdown("""
+        ---
+        
         <div style="text-align: center; font-size: 0.8rem; color: #666;">
             PI Planning Dashboard v1.0<br>
             Powered by CrewAI & MCP
@@ -186,15 +164,26 @@ def render_page_header(title: str, description: str, step_number: int):
     </div>
     """, unsafe_allow_html=True)
 
-def render_progress_indicator(current_step: int, total_steps: int = 6):
-    """Render a progress indicator showing current step"""
+def render_progress_indicator(current_step: int, total_steps: int = 6, placeholder=None):
+    """
+    Render a progress indicator showing current step
+    
+    Returns the st.empty() placeholder; pass it back on later calls within the same
+    script run to update the indicator in place instead of adding a new one.
+    """
     progress = current_step / total_steps
     
-    st.markdown("### 📈 Workflow Progress")
-    st.progress(progress)
-    st.markdown(f"**Step {current_step} of {total_steps}** ({int(progress * 100)}% complete)")
+    if placeholder is None:
+        placeholder = st.empty()
+    
+    with placeholder.container():
+        st.markdown("### 📈 Workflow Progress")
+        st.progress(progress)
+        st.markdown(f"**Step {current_step} of {total_steps}** ({int(progress * 100)}% complete)")
+        
+        # Show next step hint
+        if current_step < total_steps:
+            next_step = current_step + 1
+            st.info(f"💡 **Next:** Step {next_step} - Continue to the next phase of your PI Planning workflow.")
     
-    # Show next step hint
-    if current_step < total_steps:
-        next_step = current_step + 1
-        st.info(f"💡 **Next:** Step {next_step} - Continue to the next phase of your PI Planning workflow.")
+    return placeholder
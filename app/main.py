@@ -10,10 +10,14 @@ from pathlib import Path
 
 # Add the app directory to Python path for imports
 app_dir = Path(__file__).parent
-sys.path.insert(0, str(app_dir))
+if str(app_dir) not in sys.path:  # Streamlit re-executes this script on every rerun
+    sys.path.insert(0, str(app_dir))
 
 from components.sidebar import render_sidebar
-from utils.config import load_config
+from utils.config import load_config, apply_upload_size_limit
+
+# Reject oversized uploads at the uploader instead of after buffering them
+apply_upload_size_limit()
 
 # Page configuration
 st.set_page_config(
@@ -23,14 +27,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-def main():
-    """Main application entry point"""
-    
-    # Load configuration
-    config = load_config()
-    
-    # Custom CSS for better styling and text contrast (dark mode compatible)
-    st.markdown("""
+# Custom CSS for better styling and text contrast (dark mode compatible).
+# Built once at import; Streamlit drops elements that a rerun does not emit,
+# so the block itself is still sent on every run.
+MAIN_CSS = """
     <style>
     /* Ensure proper text contrast for dark backgrounds */
     .stApp {
@@ -98,7 +98,16 @@ def main():
         color: #000000;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def main():
+    """Main application entry point"""
+    
+    # Load configuration
+    config = load_config()
+    
+    # Custom CSS for better styling and text contrast (dark mode compatible)
+    st.markdown(MAIN_CSS, unsafe_allow_html=True)
     
     # Render sidebar
     render_sidebar()
@@ -4,17 +4,13 @@ Clean JIRA project data to prepare for new PI Planning cycle
 """
 
 import streamlit as st
-import sys
+import asyncio
 import time
-from pathlib import Path
-
-# Add the app directory to Python path for imports
-app_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(app_dir))
 
+# components/ and utils/ resolve via app/, which `streamlit run app/main.py` puts on sys.path
 from components.sidebar import render_sidebar, render_page_header, render_progress_indicator, update_workflow_status
 from utils.jira_api import JIRAClient
-from utils.config import get_jira_config, is_demo_mode
+from utils.config import get_jira_config, is_demo_mode, load_config
 
 # Page configuration
 st.set_page_config(
@@ -23,6 +19,60 @@ st.set_page_config(
     layout="wide"
 )
 
+# Project counts shown above the cleanup form: (summary key, label)
+PROJECT_METRICS = (
+    ('epics', 'Epics'),
+    ('stories', 'Stories'),
+    ('tasks', 'Tasks'),
+    ('bugs', 'Bugs')
+)
+
+# Cleanup options that touch the same issues (deleting a parent also deletes its children),
+# run one after another: children before parents, labels on whatever issues remain
+ISSUE_CLEANUP_ORDER = ('subtasks', 'tasks', 'bugs', 'stories', 'epics', 'labels')
+
+@st.cache_resource(show_spinner=False)
+def get_shared_jira_client(config_items: tuple) -> JIRAClient:
+    """Share one JIRAClient (and its pooled HTTP connection) per JIRA configuration"""
+    return JIRAClient(dict(config_items))
+
+def get_jira_client(config_items: tuple) -> JIRAClient:
+    """
+    Return the JIRA client for this session
+    
+    Real-mode clients are shared across sessions; a client working on mock data is kept in
+    the session instead, since cleanups and creates change that data for whoever holds it.
+    """
+    shared_client = get_shared_jira_client(config_items)
+    if not shared_client.uses_mock_data:
+        return shared_client
+    
+    session_client = st.session_state.get('jira_mock_client')
+    if session_client is None or session_client[0] != config_items:
+        session_client = (config_items, JIRAClient(dict(config_items)))
+        st.session_state.jira_mock_client = session_client
+    return session_client[1]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_project_summary(project_key: str, last_cleanup_ts: float, app_version: str, _jira_client: JIRAClient) -> dict:
+    """
+    Fetch the project summary once per project instead of on every rerun
+    
+    Cached for a minute, tagged with the session's last cleanup time (so deleting anything
+    refetches) and the app version (so a deploy never serves a summary from older code).
+    """
+    return _jira_client.get_project_summary()
+
+def check_jira_connection(jira_client: JIRAClient, ttl: float = 30.0) -> bool:
+    """Return the JIRA connection status, re-checking at most once per `ttl` seconds per session"""
+    checked_at = st.session_state.get('jira_connection_checked_at', 0.0)
+    if 'jira_connected' in st.session_state and time.monotonic() - checked_at < ttl:
+        return st.session_state.jira_connected
+    
+    st.session_state.jira_connected = jira_client.is_connected()
+    st.session_state.jira_connection_checked_at = time.monotonic()
+    return st.session_state.jira_connected
+
 def main():
     """Main page function"""
     
@@ -39,37 +89,40 @@ def main():
     # Progress indicator
     render_progress_indicator(current_step=1)
     
+    # Already cleaned: skip the JIRA connection check, summary fetch and form
+    if st.session_state.get('cleanup_completed'):
+        render_completion_view()
+        return
+    
     # Initialize JIRA client
     jira_config = get_jira_config()
-    jira_client = JIRAClient(jira_config)
+    jira_client = get_jira_client(tuple(sorted(jira_config.items())))
     
     # Connection status
     st.markdown("### 🔌 JIRA Connection Status")
     
+    connected = check_jira_connection(jira_client)
+    
+    # One element per column, written straight to each column
     col1, col2, col3 = st.columns(3)
     
-    with col1:
-        if jira_client.is_connected():
-            st.success("✅ Connected to JIRA")
-            st.session_state.jira_connected = True
-        else:
-            st.error("❌ Not connected to JIRA")
-            st.session_state.jira_connected = False
+    if connected:
+        col1.success("✅ Connected to JIRA")
+    else:
+        col1.error("❌ Not connected to JIRA")
     
-    with col2:
-        st.info(f"**Server:** {jira_config['server']}")
+    col2.info(f"**Server:** {jira_config['server']}")
     
-    with col3:
-        if is_demo_mode():
-            st.warning("🎭 Demo Mode Active")
-        else:
-            st.info(f"**Project:** {jira_config['project_key']}")
+    if is_demo_mode():
+        col3.warning("🎭 Demo Mode Active")
+    else:
+        col3.info(f"**Project:** {jira_config['project_key']}")
     
     # Main cleanup interface
     st.markdown("---")
     st.markdown("### 🧹 Cleanup Options")
     
-    if not jira_client.is_connected() and not is_demo_mode():
+    if not connected and not is_demo_mode():
         st.error("""
         **JIRA Connection Required**
         
@@ -83,26 +136,28 @@ def main():
         """)
         return
     
-    # Get current project data
-    with st.spinner("Loading current project data..."):
-        project_data = jira_client.get_project_summary()
-    
-    # Display current project state
+    # Current project state: placeholders first, filled once the form is on screen
     st.markdown("### 📊 Current Project State")
     
-    col1, col2, col3, col4 = st.columns(4)
+    metric_slots = {}
+    for column, (key, label) in zip(st.columns(len(PROJECT_METRICS)), PROJECT_METRICS):
+        metric_slots[key] = column.empty()
+        metric_slots[key].metric(label, "…")
     
-    with col1:
-        st.metric("Epics", project_data.get('epics', 0))
+    # Nothing in the form depends on the counts, so don't make it wait for JIRA
+    render_cleanup_form(jira_client, jira_config)
     
-    with col2:
-        st.metric("Stories", project_data.get('stories', 0))
-    
-    with col3:
-        st.metric("Tasks", project_data.get('tasks', 0))
-    
-    with col4:
-        st.metric("Bugs", project_data.get('bugs', 0))
+    project_data = load_project_summary(
+        jira_config['project_key'],
+        st.session_state.get('last_cleanup_ts', 0.0),
+        load_config()['version'],
+        jira_client
+    )
+    for key, label in PROJECT_METRICS:
+        metric_slots[key].metric(label, project_data.get(key, 0), help="Approximate count; may lag very recent changes")
+
+def render_cleanup_form(jira_client: JIRAClient, jira_config: dict):
+    """Render the cleanup form, run the cleanup on submit and offer the next step"""
     
     # Cleanup form
     st.markdown("---")
@@ -175,21 +230,95 @@ def main():
                 'workflows': reset_workflows
             }
             
-            if not any(cleanup_options.values()):
+            selected_options = [option for option, should_cleanup in cleanup_options.items() if should_cleanup]
+            
+            if not selected_options:
                 st.warning("Please select at least one cleanup option.")
                 return
             
             # Execute cleanup
-            execute_cleanup(jira_client, cleanup_options)
+            execute_cleanup(jira_client, selected_options)
     
     # Navigation button outside form (only show if cleanup was successful)
-    if 'cleanup_completed' in st.session_state and st.session_state.cleanup_completed:
+    if st.session_state.get('cleanup_completed'):
         st.markdown("---")
-        if st.button("📄 Continue to Upload Goals", use_container_width=True):
-            st.switch_page("pages/2_📄_Upload_Goals.py")
+        render_continue_button()
+
+def render_continue_button():
+    """Button to the next workflow step (same key wherever it's drawn, so a click survives the rerun)"""
+    if st.button("📄 Continue to Upload Goals", key="continue_to_goals", use_container_width=True):
+        st.switch_page("pages/2_📄_Upload_Goals.py")
 
-def execute_cleanup(jira_client: JIRAClient, cleanup_options: dict):
-    """Execute the JIRA cleanup process"""
+def render_completion_view():
+    """Compact view once cleanup is done: no JIRA calls, just the next step or a restart"""
+    st.success("🎉 JIRA cleanup completed successfully!")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        render_continue_button()
+    
+    with col2:
+        if st.button("🔄 Start Over", use_container_width=True):
+            st.session_state.cleanup_completed = False
+            # Re-tag rather than reset, so a summary cached under an older tag can't resurface
+            st.session_state.last_cleanup_ts = time.time()
+            update_workflow_status('jira_wipe', 'pending')
+            st.rerun()
+
+async def run_cleanup_sequence(jira_client: JIRAClient, option_names: list, updates: asyncio.Queue):
+    """Run cleanup options one after another, forwarding their updates and turning exceptions into error results"""
+    for option_name in option_names:
+        try:
+            async for update in jira_client.cleanup_items_stream(option_name):
+                updates.put_nowait((option_name, update))
+        except Exception as e:
+            updates.put_nowait((option_name, {'success': False, 'error': str(e)}))
+
+async def run_cleanup_options(jira_client: JIRAClient, option_names: list, progress_bar, status_text) -> dict:
+    """
+    Run cleanup options, advancing the progress bar as issues are deleted
+    
+    Issue options run in ISSUE_CLEANUP_ORDER as one sequence; the other options (components,
+    versions, workflows) touch no issues and run alongside it.
+    """
+    updates = asyncio.Queue()
+    issue_options = [option_name for option_name in ISSUE_CLEANUP_ORDER if option_name in option_names]
+    sequences = [issue_options] if issue_options else []
+    sequences.extend([option_name] for option_name in option_names if option_name not in ISSUE_CLEANUP_ORDER)
+    workers = [
+        asyncio.ensure_future(run_cleanup_sequence(jira_client, sequence, updates))
+        for sequence in sequences
+    ]
+    
+    # Fraction complete per option; the bar shows their average
+    completion = dict.fromkeys(option_names, 0.0)
+    outcomes = {}
+    shown_percent = 0
+    
+    while len(outcomes) < len(option_names):
+        option_name, update = await updates.get()
+        
+        if 'success' in update:
+            # Final result for this option
+            outcomes[option_name] = update
+            completion[option_name] = 1.0
+            status_text.text(f"Finished {option_name}... ({len(outcomes)}/{len(option_names)})")
+        else:
+            completion[option_name] = update['done'] / update['total']
+        
+        # Per-issue updates can number in the thousands; only send a delta when the bar moves
+        percent = int(100 * sum(completion.values()) / len(completion))
+        if percent != shown_percent:
+            shown_percent = percent
+            progress_bar.progress(percent)
+            if 'success' not in update:
+                status_text.text(f"Deleting {option_name}... ({update['done']}/{update['total']})")
+    
+    return outcomes
+
+def execute_cleanup(jira_client: JIRAClient, selected_options: list):
+    """Execute the JIRA cleanup process for the selected option names"""
     
     st.markdown("---")
     st.markdown("### 🚀 Executing Cleanup")
@@ -198,11 +327,11 @@ def execute_cleanup(jira_client: JIRAClient, cleanup_options: dict):
     update_workflow_status('jira_wipe', 'progress')
     
     # Progress tracking
-    total_steps = sum(1 for option in cleanup_options.values() if option)
-    current_step = 0
+    total_steps = len(selected_options)
     
     progress_bar = st.progress(0)
     status_text = st.empty()
+    status_text.text(f"Processing {total_steps} cleanup options...")
     
     results = {
         'success': [],
@@ -210,41 +339,29 @@ def execute_cleanup(jira_client: JIRAClient, cleanup_options: dict):
         'skipped': []
     }
     
-    # Execute each cleanup option
-    for option_name, should_cleanup in cleanup_options.items():
-        if not should_cleanup:
-            continue
-        
-        current_step += 1
-        progress = current_step / total_steps
-        progress_bar.progress(progress)
-        
-        status_text.text(f"Processing {option_name}... ({current_step}/{total_steps})")
-        
-        try:
-            # Simulate cleanup process with realistic delays
-            time.sleep(1)  # Simulate API call delay
-            
-            result = jira_client.cleanup_items(option_name)
-            
-            if result['success']:
-                results['success'].append({
-                    'option': option_name,
-                    'count': result['count'],
-                    'message': result['message']
-                })
-            else:
-                results['errors'].append({
-                    'option': option_name,
-                    'error': result['error']
-                })
+    # Options on overlapping issues run in sequence; see run_cleanup_options
+    outcomes = asyncio.run(run_cleanup_options(jira_client, selected_options, progress_bar, status_text))
+    
+    # Collect results in the order the options were selected
+    for option_name in selected_options:
+        result = outcomes[option_name]
         
-        except Exception as e:
+        if result['success']:
+            results['success'].append({
+                'option': option_name,
+                'count': result['count'],
+                'message': result['message']
+            })
+        else:
             results['errors'].append({
                 'option': option_name,
-                'error': str(e)
+                'error': result['error']
             })
     
+    # Anything deleted makes the cached project summary stale
+    if results['success']:
+        st.session_state.last_cleanup_ts = time.time()
+    
     # Display results
     progress_bar.progress(1.0)
     status_text.text("Cleanup completed!")
@@ -4,24 +4,25 @@ Upload and validate PI goals from Word documents using AI agents
 """
 
 import streamlit as st
-import sys
+import asyncio
+import hashlib
+import json
+import re
 import time
 from pathlib import Path
-from typing import Dict, List, Any
-
-# Add the app directory to Python path for imports
-app_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(app_dir))
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape
 
+# components/ and utils/ resolve via app/, which `streamlit run app/main.py` puts on sys.path
 from components.sidebar import render_sidebar, render_page_header, render_progress_indicator, update_workflow_status
 from components.file_uploader import render_file_uploader
 from agents.goal_validator import GoalValidatorAgent
 from utils.file_handlers import DocumentProcessor
-from utils.config import get_file_upload_config, save_session_data, load_session_data, load_config
-import openai
+from utils.config import get_file_upload_config, save_session_data, load_session_data, load_config, apply_upload_size_limit
 import io
-from docx import Document
-from docx.shared import Inches
+
+# Reject oversized uploads at the uploader instead of after buffering them
+apply_upload_size_limit()
 
 # Page configuration
 st.set_page_config(
@@ -30,6 +31,69 @@ st.set_page_config(
     layout="wide"
 )
 
+# Demo document generation settings (all part of the cache key)
+DEMO_MODEL = load_config()['demo_generation_model']
+DEMO_MAX_TOKENS = 2000
+DEMO_TEMPERATURE = 0.7
+DEMO_SYSTEM_PROMPT = "You are a business analyst creating PI planning documents. Generate realistic, detailed content."
+DEMO_PROMPTS = {
+    'good': """
+                Generate a comprehensive PI (Program Increment) goals document for a fictional e-commerce company's mobile app improvement initiative. 
+
+                Create exactly 4 SMART goals using this format for each goal:
+
+                GOAL 1: [Specific Action Verb] [What exactly will be accomplished]
+                
+                Success Criteria:
+                - Achieve [specific number/percentage] improvement in [metric]
+                - Complete implementation by [specific date within 12 weeks]
+                - Deliver measurable business value of [specific amount/percentage]
+                - Meet performance targets of [specific KPI numbers]
+                
+                Business Relevance: [How this directly impacts revenue/customers/efficiency]
+                Timeline: Complete by end of PI (Week 12) with milestones at Week 4 and Week 8
+
+                Example structure:
+                GOAL 1: Implement mobile app checkout optimization system
+                Success Criteria:
+                - Reduce checkout abandonment rate by 25% (from current 40% to 30%)
+                - Increase mobile conversion rate by 15% 
+                - Complete development and testing by Week 10 of PI
+                - Generate additional $500K monthly revenue through improved conversions
+                Business Relevance: Directly improves customer experience and increases mobile revenue
+                Timeline: Complete by Week 12 with beta testing in Week 8
+
+                Make each goal follow this exact pattern with:
+                - Specific action verbs (implement, develop, create, establish, build)
+                - Exact percentages and numbers for all metrics
+                - Clear deadlines within the 12-week PI timeframe
+                - Quantified business impact
+                - Realistic but ambitious targets
+
+                Include 4 goals covering: performance optimization, user experience improvement, payment processing, and security enhancement.
+                """,
+    'poor': """
+                Generate a poorly written PI goals document for a fictional company that has common issues:
+                
+                Create 3-4 goals that have these problems:
+                - Vague and non-specific language
+                - No measurable metrics or unclear success criteria
+                - Unrealistic timelines or no timelines at all
+                - Missing business context
+                - Unclear stakeholder responsibilities
+                - No risk considerations
+                - Ambiguous language like "improve", "enhance", "better"
+                
+                Make this document demonstrate typical problems that would fail SMART criteria validation.
+                Include goals like "Make the app better", "Improve user experience", "Fix performance issues" without specifics.
+                """
+}
+
+# Client-side retries (with exponential backoff) for rate-limited demo requests
+DEMO_MAX_RETRIES = 5
+# Stored demo drafts are reused for a day, in memory and on disk alike
+DEMO_CACHE_TTL = 86400
+
 def main():
     """Main page function"""
     
@@ -61,15 +125,21 @@ def main():
     This helps you test the system without needing to create your own documents.
     """)
     
-    col1, col2 = st.columns(2)
+    fresh_draft = st.checkbox("🔄 Generate a fresh draft", help="Ignore the cached example and ask the AI again")
+    
+    col1, col2, col3 = st.columns(3)
     
     with col1:
         if st.button("✅ Generate Good Example", use_container_width=True, help="Generate a document that meets all SMART criteria"):
-            generate_demo_document("good")
+            generate_demo_documents(["good"], fresh=fresh_draft)
     
     with col2:
         if st.button("❌ Generate Poor Example", use_container_width=True, help="Generate a document with common issues"):
-            generate_demo_document("poor")
+            generate_demo_documents(["poor"], fresh=fresh_draft)
+    
+    with col3:
+        if st.button("⚖️ Generate Both", use_container_width=True, help="Generate both examples at once"):
+            generate_demo_documents(["good", "poor"], fresh=fresh_draft)
     
     st.markdown("---")
     
@@ -89,23 +159,28 @@ def main():
     - Timeline and milestones
     """)
     
-    # File uploader
-    uploaded_file = st.file_uploader(
-        "Choose your PI goals document",
+    # File uploader (several documents are validated together)
+    uploaded_files = st.file_uploader(
+        "Choose your PI goals document(s)",
         type=['docx', 'doc', 'pdf', 'txt'],
+        accept_multiple_files=True,
         help=f"Maximum file size: {upload_config['max_size'] // 1024 // 1024}MB"
     )
     
-    if uploaded_file is not None:
+    if uploaded_files:
         # Display file info
-        st.success(f"✅ File uploaded: **{uploaded_file.name}** ({uploaded_file.size:,} bytes)")
+        for uploaded_file in uploaded_files:
+            st.success(f"✅ File uploaded: **{uploaded_file.name}** ({uploaded_file.size:,} bytes)")
         
-        # Process the document
-        process_document(uploaded_file)
+        # Process the document(s)
+        if len(uploaded_files) == 1:
+            process_document(uploaded_files[0])
+        else:
+            process_documents(uploaded_files)
     
     # Display previously processed goals if available
     processed_goals = load_session_data('processed_goals')
-    if processed_goals and not uploaded_file:
+    if processed_goals and not uploaded_files:
         st.markdown("---")
         st.markdown("### 📋 Previously Processed Goals")
         
@@ -113,6 +188,43 @@ def main():
         
         display_processed_goals(processed_goals)
 
+@st.cache_resource(show_spinner=False)
+def get_goal_agent() -> GoalValidatorAgent:
+    """Share one GoalValidatorAgent (its compiled SMART patterns are built in __init__)"""
+    return GoalValidatorAgent()
+
+@st.cache_resource(show_spinner=False)
+def get_document_processor() -> DocumentProcessor:
+    """Share one stateless DocumentProcessor"""
+    return DocumentProcessor()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def extract_document_text(file_bytes: bytes, filename: str) -> Tuple[str, str]:
+    """
+    Extract text from document bytes; Streamlit keys the cache on the content itself
+    
+    Returns the text and its SHA-256, so the text is encoded for hashing once per document
+    rather than on every rerun.
+    """
+    document = io.BytesIO(file_bytes)
+    document.name = filename
+    text = get_document_processor().extract_text(document)
+    return text, hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def extract_document_texts(documents: Tuple[Tuple[bytes, str], ...]) -> List[Tuple[str, str]]:
+    """
+    Batch form of extract_document_text: (file bytes, filename) pairs are parsed in parallel
+    and each comes back as its text and SHA-256, in input order
+    """
+    files = []
+    for file_bytes, filename in documents:
+        document = io.BytesIO(file_bytes)
+        document.name = filename
+        files.append(document)
+    texts = get_document_processor().extract_many(files)
+    return [(text, hashlib.sha256(text.encode('utf-8')).hexdigest()) for text in texts]
+
 def process_document(uploaded_file):
     """Process the uploaded document and extract goals"""
     
@@ -123,12 +235,9 @@ def process_document(uploaded_file):
     update_workflow_status('goals_upload', 'progress')
     
     with st.spinner("Processing document..."):
-        # Initialize document processor
-        doc_processor = DocumentProcessor()
-        
         try:
-            # Extract text from document
-            extracted_text = doc_processor.extract_text(uploaded_file)
+            # Extract text from document (parsed once per unique file content)
+            extracted_text, text_sha = extract_document_text(uploaded_file.getvalue(), uploaded_file.name)
             
             if not extracted_text.strip():
                 st.error("No text could be extracted from the document. Please check the file format.")
@@ -140,27 +249,106 @@ def process_document(uploaded_file):
                 st.text_area("Document content", extracted_text, height=200, disabled=True)
             
             # Process with AI agent
-            process_with_ai_agent(extracted_text, uploaded_file.name)
+            process_with_ai_agent(extracted_text, uploaded_file.name, text_sha)
             
         except Exception as e:
             st.error(f"Error processing document: {str(e)}")
             update_workflow_status('goals_upload', 'pending')
 
-def process_with_ai_agent(text_content: str, filename: str):
+def process_documents(uploaded_files: List[Any]):
+    """Process several uploaded documents: one analysis tab per file, one combined goal list"""
+    
+    st.markdown("---")
+    st.markdown("### 🔍 Document Processing")
+    
+    # Update workflow status
+    update_workflow_status('goals_upload', 'progress')
+    
+    # Extract every document up front, in parallel (parsed and hashed once per unique upload set)
+    with st.spinner("Extracting text..."):
+        try:
+            extracted_texts = extract_document_texts(tuple((uploaded_file.getvalue(), uploaded_file.name)
+                                                           for uploaded_file in uploaded_files))
+        except Exception as e:
+            st.error(f"Error processing documents: {str(e)}")
+            return
+    
+    # Keyed by upload index, like the tabs, so uploads sharing a filename each keep their analysis
+    analyses = {}
+    filenames = []
+    texts = []
+    tabs = st.tabs([uploaded_file.name for uploaded_file in uploaded_files])
+    
+    for index, (tab, uploaded_file, (extracted_text, text_sha)) in enumerate(zip(tabs, uploaded_files, extracted_texts)):
+        with tab:
+            with st.spinner(f"Processing {uploaded_file.name}..."):
+                try:
+                    if not extracted_text.strip():
+                        st.error("No text could be extracted from the document. Please check the file format.")
+                        continue
+                    
+                    with st.expander("View extracted text", expanded=False):
+                        st.text_area("Document content", extracted_text, height=200, disabled=True,
+                                     key=f"document_content_{index}")
+                    
+                    # Validate (once per unique content)
+                    analysis_result = validate_document_goals(text_sha, extracted_text)
+                    
+                except Exception as e:
+                    st.error(f"Error processing document: {str(e)}")
+                    continue
+            
+            render_goal_analysis(analysis_result)
+            analyses[index] = analysis_result
+            filenames.append(uploaded_file.name)
+            texts.append(extracted_text)
+    
+    goals = [goal for analysis_result in analyses.values() for goal in analysis_result.get('goals', [])]
+    if goals:
+        finalize_goals(goals, ", ".join(filenames), "\n\n".join(texts), analyses)
+    else:
+        st.warning("No clear goals were identified in the documents. Please review the content and try again.")
+        update_workflow_status('goals_upload', 'pending')
+
+# Stored goal validations expire after an hour, in memory and on disk alike
+VALIDATION_CACHE_TTL = 3600
+
+def validation_cache_file(text_sha: str) -> Path:
+    """On-disk location of a stored goal validation (per app version, so rule changes rescore)"""
+    return load_config()['data_dir'] / 'validate_cache' / f"{load_config()['version']}-{text_sha}.json"
+
+@st.cache_data(ttl=VALIDATION_CACHE_TTL, max_entries=64, show_spinner=False)
+def validate_document_goals(text_sha: str, _text_content: str) -> Dict[str, Any]:
+    """
+    Goal validation for a document's text, keyed on its SHA-256 rather than the text itself
+    
+    Reruns (e.g. editing a goal's priority) reuse the result from memory, and restarts reuse
+    the copy stored under data/validate_cache/ until it is an hour old.
+    """
+    cache_file = validation_cache_file(text_sha)
+    try:
+        if time.time() - cache_file.stat().st_mtime < VALIDATION_CACHE_TTL:
+            return json.loads(cache_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        pass
+    
+    analysis_result = get_goal_agent().validate_goals(_text_content)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(analysis_result), encoding='utf-8')
+    except (OSError, TypeError):
+        pass  # Caching is best effort
+    return analysis_result
+
+def process_with_ai_agent(text_content: str, filename: str, text_sha: str):
     """Process the extracted text with Goal Validator Agent"""
     
     st.markdown("#### 🤖 AI Agent Analysis")
     
-    # Initialize Goal Validator Agent
-    goal_agent = GoalValidatorAgent()
-    
     with st.spinner("AI agent is analyzing your goals..."):
         try:
-            # Simulate agent processing time
-            time.sleep(2)
-            
-            # Process goals with AI agent
-            analysis_result = goal_agent.validate_goals(text_content)
+            # Process goals with AI agent (once per unique document text)
+            analysis_result = validate_document_goals(text_sha, text_content)
             
             # Display results
             display_agent_analysis(analysis_result, filename)
@@ -172,6 +360,18 @@ def process_with_ai_agent(text_content: str, filename: str):
 def display_agent_analysis(analysis_result: Dict[str, Any], filename: str):
     """Display the results of AI agent analysis"""
     
+    render_goal_analysis(analysis_result)
+    
+    goals = analysis_result.get('goals', [])
+    if goals:
+        finalize_goals(goals, filename, analysis_result.get('original_text', ''), analysis_result)
+    else:
+        st.warning("No clear goals were identified in the document. Please review the content and try again.")
+        update_workflow_status('goals_upload', 'pending')
+
+def render_goal_analysis(analysis_result: Dict[str, Any]):
+    """Display the assessment metrics and per-goal SMART breakdown of one analysis"""
+    
     st.markdown("#### 📊 Analysis Results")
     
     # Overall assessment
@@ -228,112 +428,116 @@ def display_agent_analysis(analysis_result: Dict[str, Any], filename: str):
                         st.markdown("**Recommendations:**")
                         for rec in goal['recommendations']:
                             st.info(f"💡 {rec}")
-        
-        # Allow user to edit goals
-        st.markdown("---")
-        st.markdown("#### ✏️ Edit and Finalize Goals")
-        
-        edited_goals = edit_goals_interface(goals)
-        
-        # Save processed goals
+
+def finalize_goals(goals: List[Dict[str, Any]], filename: str, original_text: str, analysis_result: Any):
+    """Let the user edit the validated goals, then save them and complete the step"""
+    
+    # Allow user to edit goals
+    st.markdown("---")
+    st.markdown("#### ✏️ Edit and Finalize Goals")
+    
+    edited_goals = edit_goals_interface(goals)
+    
+    # Save processed goals, only when the edits actually changed them (reruns that merely
+    # redraw the page would otherwise re-save, and in debug mode re-serialize, everything)
+    goals_hash = hashlib.sha256(
+        json.dumps([filename, edited_goals], sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest()
+    if st.session_state.get('_last_goals_hash') != goals_hash:
         processed_data = {
             'filename': filename,
-            'original_text': analysis_result.get('original_text', ''),
+            'original_text': original_text,
             'goals': edited_goals,
             'analysis_result': analysis_result,
             'processed_at': time.time()
         }
-        
         save_session_data('processed_goals', processed_data)
-        
-        # Update session statistics
-        if 'session_stats' not in st.session_state:
-            st.session_state.session_stats = {
-                'goals_processed': 0,
-                'epics_generated': 0,
-                'stories_analyzed': 0,
-                'dependencies_found': 0
-            }
-        
-        st.session_state.session_stats['goals_processed'] = len(edited_goals)
-        
-        # Mark step as complete
-        update_workflow_status('goals_upload', 'complete')
-        
-        st.success("🎉 Goals processed and validated successfully!")
-        
-        # Next step guidance
-        st.info("""
-        **✅ Step 2 Complete!**
-        
-        Your PI goals have been validated and improved by AI agents.
-        
-        **Next Step:** Generate Epics and Features from your validated goals.
-        """)
-        
-        if st.button("⚡ Continue to Generate Epics", use_container_width=True):
-            st.switch_page("pages/3_⚡_Generate_Epics.py")
+        st.session_state['_last_goals_hash'] = goals_hash
     
-    else:
-        st.warning("No clear goals were identified in the document. Please review the content and try again.")
-        update_workflow_status('goals_upload', 'pending')
+    # Update session statistics
+    session_stats = st.session_state.setdefault('session_stats', {
+        'goals_processed': 0,
+        'epics_generated': 0,
+        'stories_analyzed': 0,
+        'dependencies_found': 0
+    })
+    session_stats['goals_processed'] = len(edited_goals)
+    
+    # Mark step as complete
+    update_workflow_status('goals_upload', 'complete')
+    
+    st.success("🎉 Goals processed and validated successfully!")
+    
+    # Next step guidance
+    st.info("""
+    **✅ Step 2 Complete!**
+    
+    Your PI goals have been validated and improved by AI agents.
+    
+    **Next Step:** Generate Epics and Features from your validated goals.
+    """)
+    
+    if st.button("⚡ Continue to Generate Epics", use_container_width=True):
+        st.switch_page("pages/3_⚡_Generate_Epics.py")
+
+GOAL_PRIORITIES = ['High', 'Medium', 'Low']
+GOAL_CATEGORIES = ['Business', 'Technical', 'User Experience', 'Performance', 'Security', 'Other']
 
 def edit_goals_interface(goals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Provide interface for editing goals"""
     
-    edited_goals = []
-    
     st.info("Review and edit the AI-improved goals below. You can modify the text to better match your requirements.")
     
-    for i, goal in enumerate(goals):
-        st.markdown(f"**Goal {i + 1}:**")
-        
-        # Editable goal text
-        improved_text = goal.get('improved_version', goal.get('original_text', ''))
-        
-        edited_text = st.text_area(
-            f"Goal {i + 1} text:",
-            value=improved_text,
-            height=100,
-            key=f"goal_edit_{i}"
-        )
-        
-        # Additional metadata
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            priority = st.selectbox(
-                f"Priority for Goal {i + 1}:",
-                options=['High', 'Medium', 'Low'],
-                index=0,
-                key=f"priority_{i}"
-            )
-        
-        with col2:
-            category = st.selectbox(
-                f"Category for Goal {i + 1}:",
-                options=['Business', 'Technical', 'User Experience', 'Performance', 'Security', 'Other'],
-                index=0,
-                key=f"category_{i}"
-            )
-        
-        # Build edited goal
-        edited_goal = {
+    # One editable grid (a single widget) instead of a text area and two selectboxes per goal
+    rows = [
+        {
             'title': goal.get('title', f'Goal {i + 1}'),
-            'text': edited_text,
-            'priority': priority,
-            'category': category,
+            'text': goal.get('improved_version', goal.get('original_text', '')),
+            'priority': GOAL_PRIORITIES[0],
+            'category': GOAL_CATEGORIES[0]
+        }
+        for i, goal in enumerate(goals)
+    ]
+    
+    # Key the editor on the goals so a different document starts from a clean grid
+    goals_key = hashlib.sha256(json.dumps(rows, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+    edited_rows = st.data_editor(
+        rows,
+        column_config={
+            'title': st.column_config.TextColumn("Goal", disabled=True),
+            'text': st.column_config.TextColumn("Goal text", width="large", required=True),
+            'priority': st.column_config.SelectboxColumn("Priority", options=GOAL_PRIORITIES, required=True),
+            'category': st.column_config.SelectboxColumn("Category", options=GOAL_CATEGORIES, required=True)
+        },
+        num_rows="fixed",
+        hide_index=True,
+        use_container_width=True,
+        key=f"goals_editor_{goals_key}"
+    )
+    
+    # Build edited goals (editable columns from the grid, analysis fields from the originals)
+    return [
+        {
+            'title': row['title'],
+            'text': row['text'],
+            'priority': row['priority'],
+            'category': row['category'],
             'original_text': goal.get('original_text', ''),
             'smart_assessment': goal.get('smart_assessment', {}),
             'issues': goal.get('issues', []),
             'recommendations': goal.get('recommendations', [])
         }
-        
-        edited_goals.append(edited_goal)
-        
-        st.markdown("---")
-    
-    return edited_goals
+        for goal, row in zip(goals, edited_rows)
+    ]
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def summarize_goals(goal_labels: tuple) -> tuple:
+    """(goal count, high priority count, distinct categories) from (priority, category) pairs"""
+    return (
+        len(goal_labels),
+        sum(1 for priority, _ in goal_labels if priority == 'High'),
+        len({category for _, category in goal_labels})
+    )
 
 def display_processed_goals(processed_data: Dict[str, Any]):
     """Display previously processed goals"""
@@ -343,30 +547,29 @@ def display_processed_goals(processed_data: Dict[str, Any]):
     
     st.info(f"**Source:** {filename}")
     
-    # Summary metrics
+    # Summary metrics (computed once per set of goal labels, not on every rerun)
+    goal_count, high_priority, category_count = summarize_goals(
+        tuple((g.get('priority'), g.get('category', 'Other')) for g in goals)
+    )
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.metric("Goals", len(goals))
+        st.metric("Goals", goal_count)
     
     with col2:
-        high_priority = sum(1 for g in goals if g.get('priority') == 'High')
         st.metric("High Priority", high_priority)
     
     with col3:
-        categories = set(g.get('category', 'Other') for g in goals)
-        st.metric("Categories", len(categories))
+        st.metric("Categories", category_count)
     
     # Goal list
     for i, goal in enumerate(goals, 1):
         with st.expander(f"Goal {i}: {goal.get('title', 'Untitled')}", expanded=False):
             st.write(goal.get('text', ''))
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                st.write(f"**Priority:** {goal.get('priority', 'Medium')}")
-            with col2:
-                st.write(f"**Category:** {goal.get('category', 'Other')}")
+            st.markdown(
+                f"**Priority:** {goal.get('priority', 'Medium')} &nbsp;&nbsp;|&nbsp;&nbsp; "
+                f"**Category:** {goal.get('category', 'Other')}"
+            )
     
     # Action buttons
     col1, col2 = st.columns(2)
@@ -380,10 +583,116 @@ def display_processed_goals(processed_data: Dict[str, Any]):
             # Clear processed goals
             if 'processed_goals' in st.session_state:
                 del st.session_state['processed_goals']
+            st.session_state.pop('_last_goals_hash', None)
             st.rerun()
 
-def generate_demo_document(quality_type: str):
-    """Generate a demo PI goals document using OpenAI"""
+def demo_cache_key(prompt: str) -> str:
+    """Exact-match cache key for a demo generation request"""
+    request = {
+        'model': DEMO_MODEL,
+        'system': DEMO_SYSTEM_PROMPT,
+        'prompt': prompt,
+        'max_tokens': DEMO_MAX_TOKENS,
+        'temperature': DEMO_TEMPERATURE
+    }
+    return hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
+
+def demo_cache_file(cache_key: str) -> Path:
+    """On-disk location of a cached demo generation"""
+    return load_config()['data_dir'] / 'llm_cache' / f'{cache_key}.json'
+
+def store_demo_content(cache_key: str, content: str) -> None:
+    """Persist a demo generation so it survives restarts"""
+    cache_file = demo_cache_file(cache_key)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({'content': content}), encoding='utf-8')
+    except OSError:
+        pass  # Caching is best effort
+
+async def request_demo_completions(prompts: List[str], api_key: str,
+                                   on_text: Optional[Callable[[int, str], None]] = None) -> List[str]:
+    """
+    Ask OpenAI for several demo documents concurrently (uncached)
+    
+    Responses are streamed; on_text(prompt index, text so far) is called as tokens arrive.
+    """
+    # Imported on demand; only demo generation needs it
+    import openai
+    
+    # The client itself retries 429s and transient errors with exponential backoff
+    client = openai.AsyncOpenAI(api_key=api_key, max_retries=DEMO_MAX_RETRIES)
+    
+    async def complete(index: int, prompt: str) -> str:
+        stream = await client.chat.completions.create(
+            model=DEMO_MODEL,
+            messages=[
+                {"role": "system", "content": DEMO_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=DEMO_MAX_TOKENS,
+            temperature=DEMO_TEMPERATURE,
+            stream=True
+        )
+        parts = []
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                parts.append(delta)
+                if on_text:
+                    on_text(index, "".join(parts))
+        return "".join(parts)
+    
+    try:
+        return await asyncio.gather(*(complete(index, prompt) for index, prompt in enumerate(prompts)))
+    finally:
+        await client.close()
+
+@st.cache_data(ttl=DEMO_CACHE_TTL, show_spinner=False)
+def load_demo_content(prompt: str) -> str:
+    """
+    Stored demo document text for a prompt
+    
+    The prompts are static, so repeat clicks reuse the first generation: from memory for a
+    day, and from data/llm_cache/ across restarts while the file is under a day old. Raises
+    when nothing fresh is stored, so misses are never cached.
+    """
+    cache_file = demo_cache_file(demo_cache_key(prompt))
+    if time.time() - cache_file.stat().st_mtime >= DEMO_CACHE_TTL:
+        raise KeyError(prompt)
+    return json.loads(cache_file.read_text(encoding='utf-8'))['content']
+
+def generate_demo_contents(prompts: List[str], api_key: str, fresh: bool = False,
+                           on_text: Optional[Callable[[int, str], None]] = None) -> List[str]:
+    """
+    Demo document text for each prompt; all cache misses are generated in one concurrent batch
+    
+    on_text(prompt index, text so far) only fires for prompts that are actually generated.
+    """
+    contents = {}
+    if not fresh:
+        for prompt in prompts:
+            try:
+                contents[prompt] = load_demo_content(prompt)
+            except (OSError, ValueError, KeyError):
+                pass
+    
+    missing = [index for index, prompt in enumerate(prompts) if prompt not in contents]
+    if missing:
+        relay = (lambda i, text: on_text(missing[i], text)) if on_text else None
+        generated = asyncio.run(request_demo_completions([prompts[i] for i in missing], api_key, relay))
+        for index, content in zip(missing, generated):
+            store_demo_content(demo_cache_key(prompts[index]), content)
+            contents[prompts[index]] = content
+    
+    if fresh:
+        # New drafts replaced the stored ones; drop the in-memory copies
+        load_demo_content.clear()
+    
+    return [contents[prompt] for prompt in prompts]
+
+def generate_demo_documents(quality_types: List[str], fresh: bool = False):
+    """Generate demo PI goals documents using OpenAI (cached unless `fresh` is set)"""
     
     config = load_config()
     openai_api_key = config.get('openai_api_key')
@@ -392,100 +701,46 @@ def generate_demo_document(quality_type: str):
         st.error("OpenAI API key not configured. Please set OPENAI_API_KEY in your environment.")
         return
     
-    # Set up OpenAI client
-    openai.api_key = openai_api_key
-    
+    titles = " & ".join(quality_type.title() for quality_type in quality_types)
     st.markdown("---")
-    st.markdown(f"### 🤖 Generating {quality_type.title()} Example Document")
+    st.markdown(f"### 🤖 Generating {titles} Example Document{'s' if len(quality_types) > 1 else ''}")
+    
+    # Freshly generated text streams into these as it arrives (cached drafts skip them)
+    live_previews = [st.empty() for _ in quality_types]
     
-    with st.spinner("AI is generating a sample PI goals document..."):
+    with st.spinner("AI is generating sample PI goals documents..."):
         try:
-            if quality_type == "good":
-                prompt = """
-                Generate a comprehensive PI (Program Increment) goals document for a fictional e-commerce company's mobile app improvement initiative. 
-
-                Create exactly 4 SMART goals using this format for each goal:
-
-                GOAL 1: [Specific Action Verb] [What exactly will be accomplished]
-                
-                Success Criteria:
-                - Achieve [specific number/percentage] improvement in [metric]
-                - Complete implementation by [specific date within 12 weeks]
-                - Deliver measurable business value of [specific amount/percentage]
-                - Meet performance targets of [specific KPI numbers]
-                
-                Business Relevance: [How this directly impacts revenue/customers/efficiency]
-                Timeline: Complete by end of PI (Week 12) with milestones at Week 4 and Week 8
-
-                Example structure:
-                GOAL 1: Implement mobile app checkout optimization system
-                Success Criteria:
-                - Reduce checkout abandonment rate by 25% (from current 40% to 30%)
-                - Increase mobile conversion rate by 15% 
-                - Complete development and testing by Week 10 of PI
-                - Generate additional $500K monthly revenue through improved conversions
-                Business Relevance: Directly improves customer experience and increases mobile revenue
-                Timeline: Complete by Week 12 with beta testing in Week 8
-
-                Make each goal follow this exact pattern with:
-                - Specific action verbs (implement, develop, create, establish, build)
-                - Exact percentages and numbers for all metrics
-                - Clear deadlines within the 12-week PI timeframe
-                - Quantified business impact
-                - Realistic but ambitious targets
-
-                Include 4 goals covering: performance optimization, user experience improvement, payment processing, and security enhancement.
-                """
-            else:  # poor quality
-                prompt = """
-                Generate a poorly written PI goals document for a fictional company that has common issues:
-                
-                Create 3-4 goals that have these problems:
-                - Vague and non-specific language
-                - No measurable metrics or unclear success criteria
-                - Unrealistic timelines or no timelines at all
-                - Missing business context
-                - Unclear stakeholder responsibilities
-                - No risk considerations
-                - Ambiguous language like "improve", "enhance", "better"
-                
-                Make this document demonstrate typical problems that would fail SMART criteria validation.
-                Include goals like "Make the app better", "Improve user experience", "Fix performance issues" without specifics.
-                """
-            
-            # Call OpenAI API
-            response = openai.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a business analyst creating PI planning documents. Generate realistic, detailed content."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=2000,
-                temperature=0.7
+            contents = generate_demo_contents(
+                [DEMO_PROMPTS[quality_type] for quality_type in quality_types],
+                openai_api_key,
+                fresh,
+                on_text=lambda index, text: live_previews[index].text(text)
             )
             
-            generated_content = response.choices[0].message.content
-            
-            # Display the generated document
-            st.success(f"✅ Generated {quality_type} example document!")
-            
-            # Show document preview
-            st.markdown("#### 📄 Generated Document Preview")
-            with st.expander("View generated document", expanded=True):
-                st.text_area("Generated content", generated_content, height=400, disabled=True)
+            for live_preview in live_previews:
+                live_preview.empty()
             
-            # Create Word document for download
-            word_doc = create_word_document(generated_content, quality_type)
-            
-            # Download button
-            st.markdown("#### 💾 Download Document")
-            st.download_button(
-                label=f"📥 Download {quality_type.title()} Example as Word Document",
-                data=word_doc,
-                file_name=f"PI_Goals_{quality_type.title()}_Example.docx",
-                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                use_container_width=True
-            )
+            for quality_type, generated_content in zip(quality_types, contents):
+                # Display the generated document
+                st.success(f"✅ Generated {quality_type} example document!")
+                
+                # Show document preview
+                st.markdown(f"#### 📄 Generated {quality_type.title()} Document Preview")
+                with st.expander("View generated document", expanded=True):
+                    st.text_area("Generated content", generated_content, height=400, disabled=True, key=f"demo_preview_{quality_type}")
+                
+                # Create Word document for download
+                word_doc = create_word_document(generated_content, quality_type)
+                
+                # Download button
+                st.markdown("#### 💾 Download Document")
+                st.download_button(
+                    label=f"📥 Download {quality_type.title()} Example as Word Document",
+                    data=word_doc,
+                    file_name=f"PI_Goals_{quality_type.title()}_Example.docx",
+                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                    use_container_width=True
+                )
             
             st.info("""
             **💡 Next Steps:**
@@ -498,10 +753,49 @@ def generate_demo_document(quality_type: str):
             st.error(f"Error generating document: {str(e)}")
             st.info("Please check your OpenAI API key configuration.")
 
+# Demo content blocks are separated by blank lines; a block is a heading when it starts
+# with markdown-ish markers (captured without them) or is short and all caps
+_PARA_SPLIT_RE = re.compile(r'\n\n+')
+_HEADING_RE = re.compile(r'[#*]+\s*(?P<h>.*)', re.DOTALL)
+
+def _iter_paragraphs(content: str) -> Iterator[str]:
+    """Yield the stripped, non-empty blank-line separated blocks of content lazily"""
+    start = 0
+    for separator in _PARA_SPLIT_RE.finditer(content):
+        block = content[start:separator.start()].strip()
+        if block:
+            yield block
+        start = separator.end()
+    block = content[start:].strip()
+    if block:
+        yield block
+
+# Run content python-docx turns into <w:tab/> / <w:br/> instead of <w:t> text
+_RUN_CONTROL_RE = re.compile(r'([\t\n\r])')
+_RUN_CONTROL_XML = {'\t': '<w:tab/>', '\n': '<w:br/>', '\r': '<w:br/>'}
+
+def _paragraph_xml(text: str, style_id: Optional[str] = None) -> str:
+    """Serialize one paragraph the way python-docx's add_paragraph() would"""
+    run_xml = []
+    for piece in _RUN_CONTROL_RE.split(text):
+        if piece in _RUN_CONTROL_XML:
+            run_xml.append(_RUN_CONTROL_XML[piece])
+        elif piece:
+            space = ' xml:space="preserve"' if piece != piece.strip() else ''
+            run_xml.append(f'<w:t{space}>{escape(piece)}</w:t>')
+    style_xml = f'<w:pPr><w:pStyle w:val="{style_id}"/></w:pPr>' if style_id else ''
+    body_xml = f'<w:r>{"".join(run_xml)}</w:r>' if run_xml else ''
+    return f'<w:p>{style_xml}{body_xml}</w:p>'
+
+@st.cache_data(show_spinner=False, max_entries=16)
 def create_word_document(content: str, quality_type: str) -> bytes:
-    """Create a Word document from the generated content"""
+    """Create a Word document from the generated content (built once per content/type)"""
     
-    # Create a new Document
+    # Create a new Document (python-docx is only needed for demo documents)
+    from docx import Document
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
     doc = Document()
     
     # Add title
@@ -513,21 +807,28 @@ def create_word_document(content: str, quality_type: str) -> bytes:
     # Add a line break
     doc.add_paragraph()
     
-    # Split content into paragraphs and add to document
-    paragraphs = content.split('\n\n')
-    
-    for paragraph in paragraphs:
-        if paragraph.strip():
-            # Check if it's a heading (starts with #, *, or is all caps)
-            if (paragraph.strip().startswith('#') or 
-                paragraph.strip().startswith('*') or 
-                (paragraph.strip().isupper() and len(paragraph.strip()) < 100)):
-                # Add as heading
-                heading_text = paragraph.strip().lstrip('#*').strip()
-                doc.add_heading(heading_text, level=1)
-            else:
-                # Add as regular paragraph
-                doc.add_paragraph(paragraph.strip())
+    # Split content into paragraphs and serialize them all up front, then splice the
+    # parsed <w:p> elements into the body in one pass instead of one
+    # add_paragraph()/add_heading() round trip through the element tree per block
+    heading_style_id = doc.part.get_style_id('Heading 1', WD_STYLE_TYPE.PARAGRAPH)
+    xml_chunks = []
+    
+    for paragraph in _iter_paragraphs(content):
+        # Check if it's a heading (starts with #, *, or is all caps)
+        heading = _HEADING_RE.match(paragraph)
+        if heading:
+            xml_chunks.append(_paragraph_xml(heading.group('h'), heading_style_id))
+        elif paragraph.isupper() and len(paragraph) < 100:
+            xml_chunks.append(_paragraph_xml(paragraph, heading_style_id))
+        else:
+            # Add as regular paragraph
+            xml_chunks.append(_paragraph_xml(paragraph))
+    
+    if xml_chunks:
+        fragment = parse_xml(f'<w:body {nsdecls("w")}>{"".join(xml_chunks)}</w:body>')
+        section_properties = doc.element.body.sectPr
+        for p in list(fragment):
+            section_properties.addprevious(p)
     
     # Add footer
     doc.add_paragraph()
@@ -538,26 +839,16 @@ def create_word_document(content: str, quality_type: str) -> bytes:
     # Save to bytes
     doc_buffer = io.BytesIO()
     doc.save(doc_buffer)
-    doc_buffer.seek(0)
     
     return doc_buffer.getvalue()
 
-def create_mock_file(content: str, filename: str):
-    """Create a mock file object for processing generated content"""
-    
-    class MockFile:
-        def __init__(self, content: str, name: str):
-            self.content = content
-            self.name = name
-            self.size = len(content.encode('utf-8'))
-        
-        def read(self):
-            return self.content.encode('utf-8')
-        
-        def getvalue(self):
-            return self.content.encode('utf-8')
-    
-    return MockFile(content, filename)
+def create_mock_file(content: str, filename: str) -> io.BytesIO:
+    """Create an uploaded-file stand-in (bytes encoded once, plus name/size) for generated content"""
+    data = content.encode('utf-8')
+    mock_file = io.BytesIO(data)
+    mock_file.name = filename
+    mock_file.size = len(data)
+    return mock_file
 
 if __name__ == "__main__":
     main()
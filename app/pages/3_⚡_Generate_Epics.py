@@ -4,21 +4,15 @@ Generate Epics and Features from validated PI goals using AI agents
 """
 
 import streamlit as st
-import sys
 import time
-import pandas as pd
 import io
-from pathlib import Path
-from typing import Dict, List, Any
-
-# Add the app directory to Python path for imports
-app_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(app_dir))
+import json
+from typing import Dict, List, Any, Optional
 
+# components/ and utils/ resolve via app/, which `streamlit run app/main.py` puts on sys.path
 from components.sidebar import render_sidebar, render_page_header, render_progress_indicator, update_workflow_status
 from agents.epic_generator import EpicGeneratorAgent
 from utils.config import load_session_data, save_session_data, load_config
-import openai
 
 # Page configuration
 st.set_page_config(
@@ -69,14 +63,19 @@ def main():
     goals = processed_goals['goals']
     st.markdown("### 📋 Source Goals Summary")
     
+    # Both counts in one pass over the goals
+    high_priority = 0
+    categories = set()
+    for goal in goals:
+        high_priority += goal.get('priority') == 'High'
+        categories.add(goal.get('category', 'Other'))
+    
     col1, col2, col3 = st.columns(3)
     with col1:
         st.metric("Total Goals", len(goals))
     with col2:
-        high_priority = sum(1 for g in goals if g.get('priority') == 'High')
         st.metric("High Priority", high_priority)
     with col3:
-        categories = set(g.get('category', 'Other') for g in goals)
         st.metric("Categories", len(categories))
     
     # Check if epics already generated
@@ -99,7 +98,8 @@ def main():
         """)
         
         if st.button("🚀 Generate Epics & Features", use_container_width=True, type="primary"):
-            generate_epics_and_features(goals)
+            # Use the fresh result directly; the Continue button below depends on it
+            generated_epics = generate_epics_and_features(goals)
     
     # Navigation buttons
     st.markdown("---")
@@ -116,8 +116,22 @@ def main():
             if not next_disabled:
                 st.info("Next step: Review & Push to JIRA (Coming Soon)")
 
-def generate_epics_and_features(goals: List[Dict[str, Any]]):
-    """Generate Epics and Features using AI agent"""
+@st.cache_resource(show_spinner=False)
+def get_epic_agent() -> EpicGeneratorAgent:
+    """Share one EpicGeneratorAgent (team/keyword tables are built in __init__)"""
+    return EpicGeneratorAgent()
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def generate_epics_cached(goals_json: str, revision: int) -> Dict[str, Any]:
+    """
+    Epics and Features for a set of goals, reused while the goals are unchanged
+    
+    Keyed on the goals' canonical JSON; revision (bumped by Regenerate) asks for a fresh draft.
+    """
+    return get_epic_agent().generate_epics_and_features(json.loads(goals_json))
+
+def generate_epics_and_features(goals: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Generate Epics and Features using AI agent (returns the result, or None on failure)"""
     
     st.markdown("---")
     st.markdown("### 🤖 AI Agent Processing")
@@ -125,27 +139,25 @@ def generate_epics_and_features(goals: List[Dict[str, Any]]):
     # Update workflow status
     update_workflow_status('epic_generation', 'progress')
     
+    session_state = st.session_state
+    
     with st.spinner("Epic Generator Agent is analyzing your goals and creating Epics & Features..."):
         try:
-            # Initialize Epic Generator Agent
-            epic_agent = EpicGeneratorAgent()
-            
-            # Generate epics and features
-            result = epic_agent.generate_epics_and_features(goals)
+            # Generate epics and features (cached on the goal content)
+            goals_json = json.dumps(goals, sort_keys=True, default=str)
+            result = generate_epics_cached(goals_json, session_state.get('epic_revision', 0))
             
             # Save results
             save_session_data('generated_epics', result)
             
             # Update session statistics
-            if 'session_stats' not in st.session_state:
-                st.session_state.session_stats = {
-                    'goals_processed': 0,
-                    'epics_generated': 0,
-                    'stories_analyzed': 0,
-                    'dependencies_found': 0
-                }
-            
-            st.session_state.session_stats['epics_generated'] = result['summary']['total_epics']
+            session_stats = session_state.setdefault('session_stats', {
+                'goals_processed': 0,
+                'epics_generated': 0,
+                'stories_analyzed': 0,
+                'dependencies_found': 0
+            })
+            session_stats['epics_generated'] = result['summary']['total_epics']
             
             # Mark step as complete
             update_workflow_status('epic_generation', 'complete')
@@ -154,10 +166,12 @@ def generate_epics_and_features(goals: List[Dict[str, Any]]):
             
             # Display results
             display_generated_epics(result)
+            return result
             
         except Exception as e:
             st.error(f"Error generating epics: {str(e)}")
             update_workflow_status('epic_generation', 'pending')
+            return None
 
 def display_generated_epics(result: Dict[str, Any]):
     """Display the generated epics and features"""
@@ -183,11 +197,10 @@ def display_generated_epics(result: Dict[str, Any]):
     if team_assignments:
         st.markdown("#### 👥 Team Assignments")
         
-        team_cols = st.columns(len(team_assignments))
-        for i, (team, features) in enumerate(team_assignments.items()):
-            with team_cols[i]:
-                st.markdown(f"**{team} Team**")
-                st.write(f"{len(features)} features")
+        team_counts = [(team, len(features)) for team, features in team_assignments.items()]
+        for team_col, (team, feature_count) in zip(st.columns(len(team_counts)), team_counts):
+            with team_col:
+                st.markdown(f"**{team} Team**  \n{feature_count} features")
     
     # Epics details
     epics = result.get('epics', [])
@@ -199,22 +212,23 @@ def display_generated_epics(result: Dict[str, Any]):
             
             col1, col2 = st.columns([2, 1])
             
+            # One markdown element per block instead of an st.write per line
             with col1:
                 st.markdown("**Description:**")
                 st.write(epic.get('description', 'No description'))
                 
-                st.markdown("**Acceptance Criteria:**")
                 criteria = epic.get('acceptance_criteria', [])
-                for criterion in criteria:
-                    st.write(f"• {criterion}")
+                st.markdown("\n".join(["**Acceptance Criteria:**", ""] + [f"- {criterion}" for criterion in criteria]))
             
             with col2:
-                st.markdown("**Epic Info:**")
-                st.write(f"**ID:** {epic.get('id', 'N/A')}")
-                st.write(f"**Priority:** {epic.get('priority', 'Medium')}")
-                st.write(f"**Category:** {epic.get('category', 'Business')}")
-                st.write(f"**Features:** {epic.get('feature_count', 0)}")
-                st.write(f"**Total Effort:** {epic.get('total_effort', 0)} points")
+                st.markdown("  \n".join([
+                    "**Epic Info:**",
+                    f"**ID:** {epic.get('id', 'N/A')}",
+                    f"**Priority:** {epic.get('priority', 'Medium')}",
+                    f"**Category:** {epic.get('category', 'Business')}",
+                    f"**Features:** {epic.get('feature_count', 0)}",
+                    f"**Total Effort:** {epic.get('total_effort', 0)} points"
+                ]))
             
             # Features for this epic
             features = epic.get('features', [])
@@ -228,19 +242,22 @@ def display_generated_epics(result: Dict[str, Any]):
                         feat_col1, feat_col2 = st.columns([3, 1])
                         
                         with feat_col1:
-                            st.write(feature.get('description', 'No description'))
+                            feature_lines = [feature.get('description', 'No description')]
                             
                             # Acceptance criteria
                             feat_criteria = feature.get('acceptance_criteria', [])
                             if feat_criteria:
-                                st.write("*Acceptance Criteria:*")
-                                for criterion in feat_criteria:
-                                    st.write(f"  • {criterion}")
+                                feature_lines += ["", "*Acceptance Criteria:*", ""]
+                                feature_lines += [f"- {criterion}" for criterion in feat_criteria]
+                            
+                            st.markdown("\n".join(feature_lines))
                         
                         with feat_col2:
-                            st.write(f"**Team:** {feature.get('assigned_team', 'TBD')}")
-                            st.write(f"**Size:** {feature.get('effort_size', 'M')}")
-                            st.write(f"**Points:** {feature.get('effort_points', 0)}")
+                            st.markdown("  \n".join([
+                                f"**Team:** {feature.get('assigned_team', 'TBD')}",
+                                f"**Size:** {feature.get('effort_size', 'M')}",
+                                f"**Points:** {feature.get('effort_points', 0)}"
+                            ]))
                         
                         st.markdown("---")
     
@@ -263,75 +280,91 @@ def display_generated_epics(result: Dict[str, Any]):
     
     with col2:
         if st.button("🔄 Regenerate Epics", use_container_width=True):
-            # Clear existing data
-            if 'generated_epics' in st.session_state:
-                del st.session_state['generated_epics']
+            # Clear existing data and skip the cached draft for these goals
+            session_state = st.session_state
+            session_state.pop('generated_epics', None)
+            session_state['epic_revision'] = session_state.get('epic_revision', 0) + 1
             st.rerun()
 
+# Excel export sheet columns
+EPIC_EXPORT_COLUMNS = (
+    'Epic ID', 'Epic Title', 'Description', 'Priority', 'Category', 'Status',
+    'Feature Count', 'Total Effort'
+)
+FEATURE_EXPORT_COLUMNS = (
+    'Epic ID', 'Feature ID', 'Feature Title', 'Description', 'Priority', 'Effort Size',
+    'Effort Points', 'Assigned Team', 'Status', 'Acceptance Criteria'
+)
+SUMMARY_EXPORT_COLUMNS = ('Metric', 'Value')
+
 def create_excel_export(result: Dict[str, Any]) -> bytes:
     """Create Excel export of epics and features"""
     
-    # Create DataFrames for epics and features
-    epics_data = []
-    features_data = []
-    
-    for epic in result.get('epics', []):
-        epics_data.append({
-            'Epic ID': epic.get('id', ''),
-            'Epic Title': epic.get('title', ''),
-            'Description': epic.get('description', ''),
-            'Priority': epic.get('priority', ''),
-            'Category': epic.get('category', ''),
-            'Status': epic.get('status', ''),
-            'Feature Count': epic.get('feature_count', 0),
-            'Total Effort': epic.get('total_effort', 0)
-        })
-        
-        # Add features for this epic
-        for feature in epic.get('features', []):
-            features_data.append({
-                'Epic ID': epic.get('id', ''),
-                'Feature ID': feature.get('id', ''),
-                'Feature Title': feature.get('title', ''),
-                'Description': feature.get('description', ''),
-                'Priority': feature.get('priority', ''),
-                'Effort Size': feature.get('effort_size', ''),
-                'Effort Points': feature.get('effort_points', 0),
-                'Assigned Team': feature.get('assigned_team', ''),
-                'Status': feature.get('status', ''),
-                'Acceptance Criteria': '; '.join(feature.get('acceptance_criteria', []))
-            })
+    import xlsxwriter  # Deferred: only the export needs it
     
-    # Create Excel file
+    summary = result.get('summary', {})
+    summary_rows = (
+        ('Total Epics', summary.get('total_epics', 0)),
+        ('Total Features', summary.get('total_features', 0)),
+        ('Total Story Points', summary.get('total_effort_points', 0)),
+        ('Estimated Weeks', summary.get('estimated_weeks', 0))
+    )
+    
+    # Create Excel file; constant_memory flushes each row as soon as the next one starts, and
+    # goal text is always written as plain strings (never formulas or links)
     output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        # Epics sheet
-        epics_df = pd.DataFrame(epics_data)
-        epics_df.to_excel(writer, sheet_name='Epics', index=False)
-        
-        # Features sheet
-        features_df = pd.DataFrame(features_data)
-        features_df.to_excel(writer, sheet_name='Features', index=False)
-        
-        # Summary sheet
-        summary_data = [{
-            'Metric': 'Total Epics',
-            'Value': result.get('summary', {}).get('total_epics', 0)
-        }, {
-            'Metric': 'Total Features',
-            'Value': result.get('summary', {}).get('total_features', 0)
-        }, {
-            'Metric': 'Total Story Points',
-            'Value': result.get('summary', {}).get('total_effort_points', 0)
-        }, {
-            'Metric': 'Estimated Weeks',
-            'Value': result.get('summary', {}).get('estimated_weeks', 0)
-        }]
+    workbook = xlsxwriter.Workbook(output, {
+        'constant_memory': True,
+        'strings_to_formulas': False,
+        'strings_to_urls': False
+    })
+    header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+    
+    # Epics/Features sheets only exist when there is something to put in them
+    epics = result.get('epics', [])
+    if epics:
+        epics_sheet = workbook.add_worksheet('Epics')
+        epics_sheet.write_row(0, 0, EPIC_EXPORT_COLUMNS, header_format)
+    if any(epic.get('features') for epic in epics):
+        features_sheet = workbook.add_worksheet('Features')
+        features_sheet.write_row(0, 0, FEATURE_EXPORT_COLUMNS, header_format)
+    
+    # One pass over the epics emits the Epics row and that epic's Features rows
+    feature_row = 0
+    for epic_row, epic in enumerate(epics, 1):
+        epic_id = epic.get('id', '')
+        epics_sheet.write_row(epic_row, 0, (
+            epic_id,
+            epic.get('title', ''),
+            epic.get('description', ''),
+            epic.get('priority', ''),
+            epic.get('category', ''),
+            epic.get('status', ''),
+            epic.get('feature_count', 0),
+            epic.get('total_effort', 0)
+        ))
         
-        summary_df = pd.DataFrame(summary_data)
-        summary_df.to_excel(writer, sheet_name='Summary', index=False)
+        for feature in epic.get('features', []):
+            feature_row += 1
+            features_sheet.write_row(feature_row, 0, (
+                epic_id,
+                feature.get('id', ''),
+                feature.get('title', ''),
+                feature.get('description', ''),
+                feature.get('priority', ''),
+                feature.get('effort_size', ''),
+                feature.get('effort_points', 0),
+                feature.get('assigned_team', ''),
+                feature.get('status', ''),
+                '; '.join(feature.get('acceptance_criteria', []))
+            ))
+    
+    summary_sheet = workbook.add_worksheet('Summary')
+    summary_sheet.write_row(0, 0, SUMMARY_EXPORT_COLUMNS, header_format)
+    for row_number, row in enumerate(summary_rows, 1):
+        summary_sheet.write_row(row_number, 0, row)
     
-    output.seek(0)
+    workbook.close()
     return output.getvalue()
 
 if __name__ == "__main__":
@@ -5,16 +5,54 @@ Handles environment variables, settings, and application configuration
 
 import os
 import json
+import math
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 import streamlit as st
+from streamlit import config as streamlit_config
 from dotenv import load_dotenv
 
+try:
+    import orjson  # Optional: faster (de)serialization of debug session files
+except ImportError:
+    orjson = None
+
 # Load environment variables from .env file
 load_dotenv()
 
+# Data directories this process has already created
+_ensured_dirs = set()
+
+# MCP config file -> (mtime_ns, parsed servers), so config reloads skip an unchanged file
+_mcp_servers_cache: Dict[Path, Any] = {}
+
+def _ensure_dirs(*dir_paths: Path) -> None:
+    """Create each directory once per process"""
+    for dir_path in dir_paths:
+        if dir_path not in _ensured_dirs:
+            dir_path.mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(dir_path)
+
+def _load_mcp_servers(mcp_config_path: Path) -> Dict[str, Any]:
+    """Servers from the MCP configuration file, reparsed only when the file changes"""
+    mtime_ns = mcp_config_path.stat().st_mtime_ns
+    cached = _mcp_servers_cache.get(mcp_config_path)
+    if cached is None or cached[0] != mtime_ns:
+        with open(mcp_config_path, 'r') as f:
+            cached = (mtime_ns, json.load(f).get('servers', {}))
+        _mcp_servers_cache[mcp_config_path] = cached
+    return cached[1]
+
+@st.cache_resource
 def load_config() -> Dict[str, Any]:
-    """Load application configuration from environment and config files"""
+    """
+    Load application configuration from environment and config files
+    
+    Cached for the process lifetime (environment, config files and data directories are
+    read/created once); the returned dict is shared, so treat it as read-only.
+    """
     
     # Get the project root directory
     project_root = Path(__file__).parent.parent.parent
@@ -29,12 +67,17 @@ def load_config() -> Dict[str, Any]:
         # API Keys and credentials
         'openai_api_key': os.getenv('OPENAI_API_KEY', ''),
         'anthropic_api_key': os.getenv('ANTHROPIC_API_KEY', ''),
+        'demo_generation_model': os.getenv('DEMO_GENERATION_MODEL', 'gpt-4o-mini'),
         
         # JIRA configuration
         'jira_server': os.getenv('JIRA_SERVER', 'https://your-company.atlassian.net'),
         'jira_user': os.getenv('JIRA_USER', ''),
         'jira_token': os.getenv('JIRA_TOKEN', ''),
         'jira_project_key': os.getenv('JIRA_PROJECT_KEY', 'PI'),
+        'jira_cleanup_concurrency': int(os.getenv('JIRA_CLEANUP_CONCURRENCY', '16')),
+        'jira_cleanup_rate_limit': float(os.getenv('JIRA_CLEANUP_RATE_LIMIT', '0')),
+        'jira_cache_ttl': float(os.getenv('JIRA_CACHE_TTL', '60')),
+        'jira_cache_stale_ttl': float(os.getenv('JIRA_CACHE_STALE_TTL', '600')),
         
         # MCP server configuration
         'mcp_servers': {
@@ -86,77 +129,106 @@ def load_config() -> Dict[str, Any]:
     mcp_config_path = project_root / 'config' / 'mcp_config.json'
     if mcp_config_path.exists():
         try:
-            with open(mcp_config_path, 'r') as f:
-                mcp_config = json.load(f)
-                config['mcp_servers'].update(mcp_config.get('servers', {}))
+            config['mcp_servers'].update(_load_mcp_servers(mcp_config_path))
         except Exception as e:
             st.warning(f"Could not load MCP configuration: {e}")
     
     # Ensure data directories exist
-    for dir_path in [config['data_dir'], config['uploads_dir'], 
-                     config['generated_dir'], config['examples_dir']]:
-        dir_path.mkdir(parents=True, exist_ok=True)
+    _ensure_dirs(config['data_dir'], config['uploads_dir'],
+                 config['generated_dir'], config['examples_dir'])
     
     return config
 
-def get_jira_config() -> Dict[str, str]:
-    """Get JIRA-specific configuration"""
-    config = load_config()
-    return {
-        'server': config['jira_server'],
-        'user': config['jira_user'],
-        'token': config['jira_token'],
-        'project_key': config['jira_project_key'],
-        'mock_mode': config['mock_jira']
-    }
+def reload_config() -> Dict[str, Any]:
+    """Drop the cached configuration (and everything derived from it) and build it again"""
+    global _config
+    load_config.clear()
+    get_jira_config.cache_clear()
+    is_demo_mode.cache_clear()
+    get_agent_config.cache_clear()
+    _config = load_config()
+    return _config
+
+@lru_cache(maxsize=1)
+def get_jira_config() -> Mapping[str, Any]:
+    """Get JIRA-specific configuration (built once; read-only since it is shared)"""
+    return MappingProxyType({
+        'server': _config['jira_server'],
+        'user': _config['jira_user'],
+        'token': _config['jira_token'],
+        'project_key': _config['jira_project_key'],
+        'cleanup_concurrency': _config['jira_cleanup_concurrency'],
+        'cleanup_rate_limit': _config['jira_cleanup_rate_limit'],
+        'cache_ttl': _config['jira_cache_ttl'],
+        'cache_stale_ttl': _config['jira_cache_stale_ttl'],
+        'mock_mode': _config['mock_jira']
+    })
 
 def get_mcp_config() -> Dict[str, Any]:
     """Get MCP server configuration"""
-    config = load_config()
-    return config['mcp_servers']
+    return _config['mcp_servers']
 
 def get_crewai_config() -> Dict[str, Any]:
     """Get CrewAI configuration"""
-    config = load_config()
-    return config['crewai']
+    return _config['crewai']
 
 def validate_api_keys() -> Dict[str, bool]:
     """Validate that required API keys are present"""
-    config = load_config()
     
     validation = {
-        'openai': bool(config['openai_api_key']),
-        'anthropic': bool(config['anthropic_api_key']),
-        'jira': bool(config['jira_user'] and config['jira_token']) or config['mock_jira']
+        'openai': bool(_config['openai_api_key']),
+        'anthropic': bool(_config['anthropic_api_key']),
+        'jira': bool(_config['jira_user'] and _config['jira_token']) or _config['mock_jira']
     }
     
     return validation
 
+@lru_cache(maxsize=1)
 def is_demo_mode() -> bool:
     """Check if application is running in demo mode"""
-    config = load_config()
-    return config['demo_mode']
+    return _config['demo_mode']
 
 def get_file_upload_config() -> Dict[str, Any]:
     """Get file upload configuration"""
-    config = load_config()
     return {
-        'max_size': config['upload_max_size'],
-        'allowed_extensions': config['allowed_extensions'],
-        'upload_dir': config['uploads_dir']
+        'max_size': _config['upload_max_size'],
+        'allowed_extensions': _config['allowed_extensions'],
+        'upload_dir': _config['uploads_dir']
     }
 
+def apply_upload_size_limit() -> None:
+    """
+    Apply the configured upload limit to Streamlit's server.maxUploadSize (in MB) so
+    oversized files are rejected by the uploader before they are buffered in memory
+    """
+    max_size_mb = max(1, math.ceil(get_file_upload_config()['max_size'] / (1024 * 1024)))
+    streamlit_config.set_option('server.maxUploadSize', max_size_mb)
+
+@st.cache_data(ttl=24 * 60 * 60, max_entries=32, show_spinner=False)
+def _load_session_file(path_str: str, mtime_ns: int) -> Any:
+    """
+    Parse a debug session file once per version (keyed on its modification time)
+    
+    Streamlit hands every caller its own copy of the cached value, so sessions never share it.
+    """
+    with open(path_str, 'rb') as f:
+        payload = f.read()
+    return orjson.loads(payload) if orjson is not None else json.loads(payload)
+
 def save_session_data(key: str, data: Any) -> None:
     """Save data to session state with persistence"""
     st.session_state[key] = data
     
     # Optionally save to file for persistence across sessions
-    config = load_config()
-    if config['debug']:
-        session_file = config['data_dir'] / f'session_{key}.json'
+    if _config['debug']:
+        session_file = _config['data_dir'] / f'session_{key}.json'
         try:
-            with open(session_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            if orjson is not None:
+                payload = orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+            else:
+                payload = json.dumps(data, default=str, separators=(',', ':')).encode('utf-8')
+            session_file.write_bytes(payload)
+            _load_session_file.clear()
         except Exception:
             pass  # Fail silently in production
 
@@ -166,22 +238,20 @@ def load_session_data(key: str, default: Any = None) -> Any:
         return st.session_state[key]
     
     # Try to load from file if in debug mode
-    config = load_config()
-    if config['debug']:
-        session_file = config['data_dir'] / f'session_{key}.json'
-        if session_file.exists():
-            try:
-                with open(session_file, 'r') as f:
-                    data = json.load(f)
-                    st.session_state[key] = data
-                    return data
-            except Exception:
-                pass
+    if _config['debug']:
+        session_file = _config['data_dir'] / f'session_{key}.json'
+        try:
+            data = _load_session_file(str(session_file), session_file.stat().st_mtime_ns)
+            st.session_state[key] = data
+            return data
+        except Exception:
+            pass
     
     return default
 
-def get_agent_config(agent_name: str) -> Dict[str, Any]:
-    """Get configuration for a specific agent"""
+@lru_cache(maxsize=8)
+def get_agent_config(agent_name: str) -> Mapping[str, Any]:
+    """Get configuration for a specific agent (built once per name; read-only since it is shared)"""
     crewai_config = get_crewai_config()
     
     # Agent-specific configurations
@@ -190,7 +260,7 @@ def get_agent_config(agent_name: str) -> Dict[str, Any]:
             'role': 'SMART Goals Analyst',
             'goal': 'Validate and improve PI goals from documents',
             'backstory': 'Expert in SMART goal methodology and PI planning best practices',
-            'tools': ['document_parser', 'goal_validator', 'smart_criteria_checker'],
+            'tools': ('document_parser', 'goal_validator', 'smart_criteria_checker'),
             'model': crewai_config['model'],
             'temperature': 0.1,  # Lower temperature for validation tasks
             'max_tokens': crewai_config['max_tokens']
@@ -199,7 +269,7 @@ def get_agent_config(agent_name: str) -> Dict[str, Any]:
             'role': 'Epic & Feature Architect',
             'goal': 'Generate structured Epics and Features from validated goals',
             'backstory': 'Experienced in breaking down high-level goals into actionable work items',
-            'tools': ['epic_generator', 'feature_creator', 'team_mapper'],
+            'tools': ('epic_generator', 'feature_creator', 'team_mapper'),
             'model': crewai_config['model'],
             'temperature': 0.3,  # Moderate creativity for generation
             'max_tokens': crewai_config['max_tokens']
@@ -208,7 +278,7 @@ def get_agent_config(agent_name: str) -> Dict[str, Any]:
             'role': 'Backlog Quality Auditor',
             'goal': 'Identify and improve poorly written user stories',
             'backstory': 'Quality assurance expert specializing in user story best practices',
-            'tools': ['story_analyzer', 'quality_checker', 'improvement_suggester'],
+            'tools': ('story_analyzer', 'quality_checker', 'improvement_suggester'),
             'model': crewai_config['model'],
             'temperature': 0.2,  # Low creativity for analysis
             'max_tokens': crewai_config['max_tokens']
@@ -217,14 +287,14 @@ def get_agent_config(agent_name: str) -> Dict[str, Any]:
             'role': 'Cross-Team Dependency Mapper',
             'goal': 'Identify team dependencies and potential blockers',
             'backstory': 'Systems thinking expert with deep understanding of team dynamics',
-            'tools': ['dependency_mapper', 'team_analyzer', 'risk_assessor'],
+            'tools': ('dependency_mapper', 'team_analyzer', 'risk_assessor'),
             'model': crewai_config['model'],
             'temperature': 0.1,  # Very low creativity for dependency analysis
             'max_tokens': crewai_config['max_tokens']
         }
     }
     
-    return agent_configs.get(agent_name, crewai_config)
+    return MappingProxyType(agent_configs.get(agent_name, crewai_config))
 
-# Initialize configuration on module import
+# Initialize configuration on module import (the helpers above read this singleton)
 _config = load_config()
@@ -4,131 +4,87 @@ Handles document processing, Excel generation, and file I/O operations
 """
 
 import io
+import os
+import codecs
 import json
-import pandas as pd
+import shutil
+import hashlib
+import zipfile
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
+from xml.etree import ElementTree
 
-class DocumentProcessor:
-    """Process various document formats and extract text content"""
-    
-    def __init__(self):
-        self.supported_formats = ['.docx', '.doc', '.pdf', '.txt', '.rtf']
-    
-    def extract_text(self, uploaded_file) -> str:
-        """
-        Extract text content from uploaded file
-        
-        Args:
-            uploaded_file: Streamlit uploaded file object
-            
-        Returns:
-            Extracted text content
-        """
-        
-        file_extension = Path(uploaded_file.name).suffix.lower()
-        
-        try:
-            if file_extension == '.txt':
-                return self._extract_from_txt(uploaded_file)
-            elif file_extension == '.docx':
-                return self._extract_from_docx(uploaded_file)
-            elif file_extension == '.doc':
-                return self._extract_from_doc(uploaded_file)
-            elif file_extension == '.pdf':
-                return self._extract_from_pdf(uploaded_file)
-            elif file_extension == '.rtf':
-                return self._extract_from_rtf(uploaded_file)
-            else:
-                raise ValueError(f"Unsupported file format: {file_extension}")
-        
-        except Exception as e:
-            # Fallback to mock content for demo purposes
-            return self._get_mock_content(uploaded_file.name)
-    
-    def _extract_from_txt(self, uploaded_file) -> str:
-        """Extract text from plain text file"""
-        try:
-            content = uploaded_file.read().decode('utf-8')
-            uploaded_file.seek(0)  # Reset file pointer
-            return content
-        except UnicodeDecodeError:
-            # Try different encodings
-            for encoding in ['latin-1', 'cp1252', 'iso-8859-1']:
-                try:
-                    uploaded_file.seek(0)
-                    content = uploaded_file.read().decode(encoding)
-                    uploaded_file.seek(0)
-                    return content
-                except UnicodeDecodeError:
-                    continue
-            raise ValueError("Could not decode text file")
-    
-    def _extract_from_docx(self, uploaded_file) -> str:
-        """Extract text from DOCX file"""
-        try:
-            # Try to import python-docx
-            from docx import Document
-            
-            # Create document from uploaded file
-            doc = Document(uploaded_file)
-            uploaded_file.seek(0)  # Reset file pointer
-            
-            # Extract text from paragraphs
-            text_content = []
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text_content.append(paragraph.text.strip())
-            
-            return '\n\n'.join(text_content)
-        
-        except ImportError:
-            # python-docx not available, return mock content
-            return self._get_mock_content(uploaded_file.name)
-        except Exception:
-            # Error processing DOCX, return mock content
-            return self._get_mock_content(uploaded_file.name)
-    
-    def _extract_from_doc(self, uploaded_file) -> str:
-        """Extract text from DOC file (legacy format)"""
-        # DOC format is complex and requires specialized libraries
-        # For demo purposes, return mock content
-        return self._get_mock_content(uploaded_file.name)
-    
-    def _extract_from_pdf(self, uploaded_file) -> str:
-        """Extract text from PDF file"""
-        try:
-            # Try to import PyPDF2 or pdfplumber
-            import PyPDF2
-            
-            pdf_reader = PyPDF2.PdfReader(uploaded_file)
-            uploaded_file.seek(0)  # Reset file pointer
-            
-            text_content = []
-            for page in pdf_reader.pages:
-                text = page.extract_text()
-                if text.strip():
-                    text_content.append(text.strip())
-            
-            return '\n\n'.join(text_content)
-        
-        except ImportError:
-            # PyPDF2 not available, return mock content
-            return self._get_mock_content(uploaded_file.name)
-        except Exception:
-            # Error processing PDF, return mock content
-            return self._get_mock_content(uploaded_file.name)
-    
-    def _extract_from_rtf(self, uploaded_file) -> str:
-        """Extract text from RTF file"""
-        # RTF format requires specialized parsing
-        # For demo purposes, return mock content
-        return self._get_mock_content(uploaded_file.name)
-    
-    def _get_mock_content(self, filename: str) -> str:
-        """Return mock PI goals content for demo purposes"""
-        return f"""
+try:
+    import cchardet  # Optional: C encoding detection for non-UTF-8 text uploads
+except ImportError:
+    cchardet = None
+
+try:
+    import orjson  # Optional: faster (de)serialization of saved JSON data
+except ImportError:
+    orjson = None
+
+try:
+    import pypdfium2 as pdfium  # Optional: native PDF text extraction
+except ImportError:
+    pdfium = None
+
+try:
+    import PyPDF2  # Optional: pure-Python PDF fallback when pypdfium2 is missing
+except ImportError:
+    PyPDF2 = None
+
+# WordprocessingML element tags used for DOCX text extraction
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY = f'{_W_NS}body'
+_W_P = f'{_W_NS}p'
+_W_R = f'{_W_NS}r'
+_W_T = f'{_W_NS}t'
+_W_HYPERLINK = f'{_W_NS}hyperlink'
+_W_BR = f'{_W_NS}br'
+_W_BR_TYPE = f'{_W_NS}type'
+
+# Run content -> text, as python-docx renders it (w:br handled separately: only line breaks count)
+_W_RUN_TEXT = {
+    f'{_W_NS}cr': '\n',
+    f'{_W_NS}tab': '\t',
+    f'{_W_NS}ptab': '\t',
+    f'{_W_NS}noBreakHyphen': '-'
+}
+
+_OFFICE_DOCUMENT_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+
+def _docx_run_text(run: ElementTree.Element) -> str:
+    """Text of a w:r element"""
+    parts = []
+    for child in run:
+        if child.tag == _W_T:
+            parts.append(child.text or '')
+        elif child.tag == _W_BR:
+            if child.get(_W_BR_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        elif child.tag in _W_RUN_TEXT:
+            parts.append(_W_RUN_TEXT[child.tag])
+    return ''.join(parts)
+
+def _docx_paragraph_text(paragraph: ElementTree.Element) -> str:
+    """Text of a w:p element: its runs plus the runs inside its hyperlinks, in order"""
+    parts = []
+    for child in paragraph:
+        if child.tag == _W_R:
+            parts.append(_docx_run_text(child))
+        elif child.tag == _W_HYPERLINK:
+            parts.extend(_docx_run_text(run) for run in child.iterfind(_W_R))
+    return ''.join(parts)
+
+# Demo goals document returned when a file's text cannot be extracted
+_MOCK_CONTENT_TEMPLATE = """
 PI Planning Goals - {filename}
 
 GOAL 1: Enhance User Authentication System
@@ -202,9 +158,205 @@ Priority: Low
 Business Value: Foundation for future integrations and third-party partnerships
 """
 
+class DocumentProcessor:
+    """Process various document formats and extract text content"""
+    
+    # Extracted texts kept per processor, keyed on (content digest, filename)
+    TEXT_CACHE_SIZE = 128
+    
+    def __init__(self):
+        self.supported_formats = ['.docx', '.doc', '.pdf', '.txt', '.rtf']
+        self._text_cache = OrderedDict()
+        self._text_cache_lock = threading.Lock()
+    
+    def extract_text(self, uploaded_file) -> str:
+        """
+        Extract text content from uploaded file
+        
+        Re-uploads of the same content are served from an LRU cache instead of being parsed
+        again. The filename is part of the key since the fallback content embeds it.
+        
+        Args:
+            uploaded_file: Streamlit uploaded file object
+            
+        Returns:
+            Extracted text content
+        """
+        
+        content = uploaded_file.read()
+        uploaded_file.seek(0)  # Reset file pointer
+        cache_key = (hashlib.blake2b(content, digest_size=16).digest(), uploaded_file.name)
+        
+        with self._text_cache_lock:
+            text = self._text_cache.get(cache_key)
+            if text is not None:
+                self._text_cache.move_to_end(cache_key)
+                return text
+        
+        text = self._extract_text_uncached(content, uploaded_file.name)
+        
+        with self._text_cache_lock:
+            self._text_cache[cache_key] = text
+            self._text_cache.move_to_end(cache_key)
+            while len(self._text_cache) > self.TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        return text
+    
+    def extract_many(self, uploaded_files: List[Any], max_workers: Optional[int] = None) -> List[str]:
+        """
+        Extract text from several uploaded files concurrently, in input order
+        
+        PDF and DOCX parsing run largely in native code (PDFium, zlib/expat) and scale with
+        threads; plain-text and mock formats are cheap enough that the pool adds nothing.
+        """
+        if len(uploaded_files) < 2:
+            return [self.extract_text(uploaded_file) for uploaded_file in uploaded_files]
+        
+        workers = max_workers or min(8, os.cpu_count() or 1, len(uploaded_files))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='document-extract') as executor:
+            return list(executor.map(self.extract_text, uploaded_files))
+    
+    def _extract_text_uncached(self, content: bytes, filename: str) -> str:
+        """Extract text from the file's bytes by dispatching on the file extension"""
+        
+        file_extension = Path(filename).suffix.lower()
+        
+        try:
+            if file_extension == '.txt':
+                return self._extract_from_txt(content, filename)
+            elif file_extension == '.docx':
+                return self._extract_from_docx(content, filename)
+            elif file_extension == '.doc':
+                return self._extract_from_doc(content, filename)
+            elif file_extension == '.pdf':
+                return self._extract_from_pdf(content, filename)
+            elif file_extension == '.rtf':
+                return self._extract_from_rtf(content, filename)
+            else:
+                raise ValueError(f"Unsupported file format: {file_extension}")
+        
+        except Exception as e:
+            # Fallback to mock content for demo purposes
+            return self._get_mock_content(filename)
+    
+    def _extract_from_txt(self, content: bytes, filename: str) -> str:
+        """Extract text from plain text file"""
+        try:
+            return content.decode('utf-8')
+        except UnicodeDecodeError:
+            # Detect the encoding in one pass; latin-1 decodes any byte sequence
+            encoding = (cchardet.detect(content)['encoding'] if cchardet is not None else None) or 'latin-1'
+            try:
+                codecs.lookup(encoding)
+            except LookupError:
+                # The detector can name encodings Python has no codec for
+                encoding = 'latin-1'
+            return content.decode(encoding, errors='replace')
+    
+    def _extract_from_docx(self, content: bytes, filename: str) -> str:
+        """
+        Extract text from DOCX file
+        
+        Reads the body paragraphs straight from the document XML, giving the same text as
+        python-docx's Document.paragraphs without building its object model.
+        """
+        try:
+            with zipfile.ZipFile(io.BytesIO(content)) as docx:
+                # The main document part is usually word/document.xml; the package rels say for sure
+                rels = ElementTree.fromstring(docx.read('_rels/.rels'))
+                part_name = next(
+                    rel.get('Target') for rel in rels if rel.get('Type') == _OFFICE_DOCUMENT_REL
+                ).lstrip('/')
+                document = ElementTree.fromstring(docx.read(part_name))
+            
+            # Extract text from top-level body paragraphs (each stripped once, no interim list)
+            paragraph_texts = (
+                _docx_paragraph_text(paragraph).strip()
+                for paragraph in document.find(_W_BODY).iterfind(_W_P)
+            )
+            return '\n\n'.join(text for text in paragraph_texts if text)
+        
+        except Exception:
+            # Error processing DOCX, return mock content
+            return self._get_mock_content(filename)
+    
+    def _extract_from_doc(self, content: bytes, filename: str) -> str:
+        """Extract text from DOC file (legacy format)"""
+        # DOC format is complex and requires specialized libraries
+        # For demo purposes, return mock content
+        return self._get_mock_content(filename)
+    
+    def _extract_from_pdf(self, content: bytes, filename: str) -> str:
+        """Extract text from PDF file (PDFium when pypdfium2 is installed, else PyPDF2)"""
+        if pdfium is None:
+            return self._extract_from_pdf_pypdf2(content, filename)
+        
+        try:
+            pdf = pdfium.PdfDocument(content)
+            try:
+                text_content = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    # PDFium ends lines with CRLF; normalize so paragraph splitting sees \n
+                    text = textpage.get_text_range().replace('\r\n', '\n').strip()
+                    textpage.close()
+                    page.close()
+                    if text:
+                        text_content.append(text)
+            finally:
+                pdf.close()
+            
+            return '\n\n'.join(text_content)
+        
+        except Exception:
+            # Error processing PDF, return mock content
+            return self._get_mock_content(filename)
+    
+    def _extract_from_pdf_pypdf2(self, content: bytes, filename: str) -> str:
+        """Extract text from PDF file with the pure-Python PyPDF2 parser"""
+        if PyPDF2 is None:
+            # PyPDF2 not available, return mock content
+            return self._get_mock_content(filename)
+        
+        try:
+            pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
+            
+            text_content = []
+            for page in pdf_reader.pages:
+                text = page.extract_text()
+                if text.strip():
+                    text_content.append(text.strip())
+            
+            return '\n\n'.join(text_content)
+        
+        except Exception:
+            # Error processing PDF, return mock content
+            return self._get_mock_content(filename)
+    
+    def _extract_from_rtf(self, content: bytes, filename: str) -> str:
+        """Extract text from RTF file"""
+        # RTF format requires specialized parsing
+        # For demo purposes, return mock content
+        return self._get_mock_content(filename)
+    
+    def _get_mock_content(self, filename: str) -> str:
+        """Return mock PI goals content for demo purposes"""
+        return _MOCK_CONTENT_TEMPLATE.format(filename=filename)
+
+# Cell strings pandas.read_excel reads as NaN by default, plus Excel's error values
+# (which pandas also reads as NaN)
+_EXCEL_NA_VALUES = frozenset({
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+    '#NULL!', '#DIV/0!', '#VALUE!', '#REF!', '#NAME?', '#NUM!'
+})
+
 class ExcelGenerator:
     """Generate Excel files for PI Planning data"""
     
+    # Rows sampled (from the top of each sheet) when sizing columns
+    WIDTH_SAMPLE_ROWS = 200
+    
     def __init__(self):
         self.default_columns = {
             'epics': ['Epic Key', 'Epic Name', 'Description', 'Business Value', 'Priority', 'Team', 'Status'],
@@ -227,78 +379,87 @@ class ExcelGenerator:
         if filename is None:
             filename = f"PI_Planning_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
         
-        # Create Excel writer object
-        output = io.BytesIO()
+        from openpyxl import Workbook  # Deferred: only Excel generation needs openpyxl
         
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            
-            # Create Epics sheet
-            if 'epics' in data and data['epics']:
-                epics_df = pd.DataFrame(data['epics'])
-                epics_df.to_excel(writer, sheet_name='Epics', index=False)
-                
-                # Format Epics sheet
-                self._format_worksheet(writer.sheets['Epics'], epics_df)
-            
-            # Create Features sheet
-            if 'features' in data and data['features']:
-                features_df = pd.DataFrame(data['features'])
-                features_df.to_excel(writer, sheet_name='Features', index=False)
-                
-                # Format Features sheet
-                self._format_worksheet(writer.sheets['Features'], features_df)
-            
-            # Create Stories sheet
-            if 'stories' in data and data['stories']:
-                stories_df = pd.DataFrame(data['stories'])
-                stories_df.to_excel(writer, sheet_name='Stories', index=False)
-                
-                # Format Stories sheet
-                self._format_worksheet(writer.sheets['Stories'], stories_df)
-            
-            # Create Summary sheet
-            summary_data = self._create_summary_data(data)
-            summary_df = pd.DataFrame(summary_data)
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
-            self._format_worksheet(writer.sheets['Summary'], summary_df)
+        # write_only streams each appended row out instead of building the workbook in memory
+        workbook = Workbook(write_only=True)
+        header_style = self._header_style()
         
-        output.seek(0)
+        # Epics, Features and Stories sheets (only when there is data), then the Summary
+        for kind, sheet_name in (('epics', 'Epics'), ('features', 'Features'), ('stories', 'Stories')):
+            if data.get(kind):
+                self._write_sheet(workbook, sheet_name, data[kind], header_style)
+        
+        self._write_sheet(workbook, 'Summary', self._create_summary_data(data), header_style)
+        
+        output = io.BytesIO()
+        workbook.save(output)
         return output.getvalue()
     
-    def _format_worksheet(self, worksheet, dataframe):
-        """Apply formatting to Excel worksheet"""
-        try:
-            from openpyxl.styles import Font, PatternFill, Alignment
-            from openpyxl.utils.dataframe import dataframe_to_rows
-            
-            # Header formatting
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            
-            # Apply header formatting
-            for cell in worksheet[1]:
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = Alignment(horizontal="center")
-            
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _header_style() -> Dict[str, Any]:
+        """Header cell style objects (immutable), created once and shared by every header cell"""
+        from openpyxl.styles import Font, PatternFill, Alignment
+        
+        return {
+            'font': Font(bold=True, color="FFFFFF"),
+            'fill': PatternFill(start_color="366092", end_color="366092", fill_type="solid"),
+            'alignment': Alignment(horizontal="center")
+        }
+    
+    @staticmethod
+    def _write_sheet(workbook, sheet_name: str, records: List[Dict[str, Any]], header_style: Dict[str, Any]):
+        """
+        Append a sheet with one column per record key (in first-seen order) and one row per record
         
-        except ImportError:
-            # openpyxl styling not available, skip formatting
-            pass
+        Column widths fit the longest header or value among the first WIDTH_SAMPLE_ROWS rows
+        (capped at 50), computed up front since a write-only sheet cannot be revisited.
+        """
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
+        
+        worksheet = workbook.create_sheet(title=sheet_name)
+        columns = list(dict.fromkeys(key for record in records for key in record))
+        rows = ExcelGenerator._record_rows(records, columns)
+        
+        # Auto-adjust column widths from a sample of the rows
+        sample = rows[:ExcelGenerator.WIDTH_SAMPLE_ROWS]
+        for i, column in enumerate(columns):
+            max_length = max(
+                [len(str(column))] + [len(str(row[i])) for row in sample if row[i] is not None]
+            )
+            worksheet.column_dimensions[get_column_letter(i + 1)].width = min(max_length + 2, 50)
+        
+        header = []
+        for column in columns:
+            cell = WriteOnlyCell(worksheet, value=column)
+            cell.font = header_style['font']
+            cell.fill = header_style['fill']
+            cell.alignment = header_style['alignment']
+            header.append(cell)
+        if header:
+            worksheet.append(header)
+        
+        for row in rows:
+            worksheet.append(row)
+    
+    @staticmethod
+    def _record_rows(records: List[Dict[str, Any]], columns: List[str]) -> List[tuple]:
+        """One value tuple per record in column order (None where a record lacks a column)"""
+        if len(columns) < 2:
+            # itemgetter with a single key returns the bare value rather than a tuple
+            return [tuple(record.get(column) for column in columns) for record in records]
+        
+        # Columns are the union of record keys, so a record with as many keys as there
+        # are columns has all of them and can be read with a single C-level call
+        get_row = itemgetter(*columns)
+        column_count = len(columns)
+        return [
+            get_row(record) if len(record) == column_count
+            else tuple(record.get(column) for column in columns)
+            for record in records
+        ]
     
     def _create_summary_data(self, data: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
         """Create summary data for the Excel file"""
@@ -308,10 +469,7 @@ class ExcelGenerator:
         # Epic summary
         epics = data.get('epics', [])
         if epics:
-            epic_priorities = {}
-            for epic in epics:
-                priority = epic.get('Priority', 'Medium')
-                epic_priorities[priority] = epic_priorities.get(priority, 0) + 1
+            epic_priorities = Counter(epic.get('Priority', 'Medium') for epic in epics)
             
             summary.append({
                 'Category': 'Epics',
@@ -324,7 +482,7 @@ class ExcelGenerator:
         # Feature summary
         features = data.get('features', [])
         if features:
-            total_story_points = sum(f.get('Story Points', 0) for f in features if f.get('Story Points'))
+            total_story_points = sum(filter(None, (f.get('Story Points') for f in features)))
             
             summary.append({
                 'Category': 'Features',
@@ -337,10 +495,7 @@ class ExcelGenerator:
         # Story summary
         stories = data.get('stories', [])
         if stories:
-            story_statuses = {}
-            for story in stories:
-                status = story.get('Status', 'To Do')
-                story_statuses[status] = story_statuses.get(status, 0) + 1
+            story_statuses = Counter(story.get('Status', 'To Do') for story in stories)
             
             summary.append({
                 'Category': 'Stories',
@@ -364,22 +519,89 @@ class ExcelGenerator:
         """
         
         try:
-            # Read Excel file
-            excel_data = pd.read_excel(uploaded_file, sheet_name=None)
+            if Path(getattr(uploaded_file, 'name', '')).suffix.lower() in ('.xlsx', '.xlsm'):
+                parsed_data = self._parse_xlsx_records(uploaded_file)
+            else:
+                parsed_data = self._parse_excel_records_with_pandas(uploaded_file)
             uploaded_file.seek(0)  # Reset file pointer
             
-            parsed_data = {}
-            
-            # Parse each sheet
-            for sheet_name, df in excel_data.items():
-                if sheet_name.lower() in ['epics', 'features', 'stories']:
-                    # Convert DataFrame to list of dictionaries
-                    parsed_data[sheet_name.lower()] = df.to_dict('records')
-            
             return parsed_data
         
         except Exception as e:
             raise ValueError(f"Error parsing Excel file: {str(e)}")
+    
+    @staticmethod
+    def _parse_xlsx_records(uploaded_file) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Read the Epics/Features/Stories sheets of an .xlsx file straight into records
+        
+        Gives the records pd.read_excel(...).to_dict('records') would, without building
+        DataFrames: rows are read as stored (the sheet's recorded dimensions are ignored, and
+        leading blank rows are kept, so the first row is always the header), the first row names
+        the columns (blank -> 'Unnamed: <i>', repeats -> '<name>.<n>'), trailing empty rows and
+        columns are dropped, and empty, NA-like and error cells read as NaN.
+        """
+        from openpyxl import load_workbook  # Deferred: only Excel parsing needs openpyxl
+        
+        workbook = load_workbook(uploaded_file, read_only=True, data_only=True, keep_links=False)
+        parsed_data = {}
+        nan = float('nan')
+        
+        try:
+            for worksheet in workbook.worksheets:
+                kind = worksheet.title.lower()
+                if kind not in ('epics', 'features', 'stories'):
+                    continue
+                
+                # Stored dimensions can be missing or stale; read every row that is actually there
+                worksheet.reset_dimensions()
+                rows = [list(row) for row in worksheet.iter_rows(values_only=True)]
+                for row in rows:
+                    while row and row[-1] is None:
+                        row.pop()
+                while rows and not rows[-1]:
+                    rows.pop()
+                
+                # Trailing columns with neither a header nor any values are not columns
+                width = max((len(row) for row in rows), default=0)
+                for row in rows:
+                    row.extend([None] * (width - len(row)))
+                header = rows.pop(0) if rows else []
+                columns = []
+                seen = {}
+                for i, name in enumerate(header):
+                    name = f'Unnamed: {i}' if name is None else name
+                    if name in seen:
+                        seen[name] += 1
+                        name = f'{name}.{seen[name]}'
+                    else:
+                        seen[name] = 0
+                    columns.append(name)
+                
+                parsed_data[kind] = [
+                    dict(zip(columns, (
+                        nan if value is None or (value.__class__ is str and value in _EXCEL_NA_VALUES) else value
+                        for value in row
+                    )))
+                    for row in rows
+                ]
+        finally:
+            workbook.close()
+        
+        return parsed_data
+    
+    @staticmethod
+    def _parse_excel_records_with_pandas(uploaded_file) -> Dict[str, List[Dict[str, Any]]]:
+        """Read the Epics/Features/Stories sheets of other spreadsheet formats (e.g. .xls) via pandas"""
+        import pandas as pd  # Deferred: only non-xlsx Excel parsing needs pandas
+        
+        # Only the planning sheets are parsed into DataFrames; any other sheets are never read
+        with pd.ExcelFile(uploaded_file) as excel_file:
+            return {
+                sheet_name.lower(): excel_file.parse(sheet_name).to_dict('records')
+                for sheet_name in excel_file.sheet_names
+                if sheet_name.lower() in ('epics', 'features', 'stories')
+            }
 
 class FileManager:
     """Manage file operations for the PI Planning Dashboard"""
@@ -389,10 +611,21 @@ class FileManager:
         self.uploads_dir = self.base_path / 'uploads'
         self.generated_dir = self.base_path / 'generated'
         self.examples_dir = self.base_path / 'examples'
+        self.validate_cache_dir = self.base_path / 'validate_cache'
+        self.llm_cache_dir = self.base_path / 'llm_cache'
+        
+        # Directories this manager has already created (cleanup never removes directories)
+        self._known_dirs = set()
         
         # Ensure directories exist
         for directory in [self.uploads_dir, self.generated_dir, self.examples_dir]:
+            self._ensure_dir(directory)
+    
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create directory once per manager; later saves skip the mkdir syscall"""
+        if directory not in self._known_dirs:
             directory.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(directory)
     
     def save_uploaded_file(self, uploaded_file, category: str = 'general') -> Path:
         """
@@ -408,16 +641,32 @@ class FileManager:
         
         # Create category subdirectory
         category_dir = self.uploads_dir / category
-        category_dir.mkdir(exist_ok=True)
+        self._ensure_dir(category_dir)
         
         # Generate unique filename
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"{timestamp}_{uploaded_file.name}"
         file_path = category_dir / filename
         
-        # Save file
+        # Save file in 1 MiB chunks; a disk-backed source is copied by the kernel (sendfile)
+        uploaded_file.seek(0)
         with open(file_path, 'wb') as f:
-            f.write(uploaded_file.getbuffer())
+            try:
+                source_fd = uploaded_file.fileno()
+            except (AttributeError, OSError):
+                source_fd = None  # In-memory upload (BytesIO)
+            
+            if source_fd is not None and hasattr(os, 'sendfile'):
+                size = os.fstat(source_fd).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(f.fileno(), source_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            else:
+                shutil.copyfileobj(uploaded_file, f, length=1 << 20)
+        uploaded_file.seek(0)
         
         return file_path
     
@@ -436,7 +685,7 @@ class FileManager:
         
         # Create category subdirectory
         category_dir = self.generated_dir / category
-        category_dir.mkdir(exist_ok=True)
+        self._ensure_dir(category_dir)
         
         # Save file
         file_path = category_dir / filename
@@ -450,26 +699,58 @@ class FileManager:
         file_path = self.base_path / filename
         
         if file_path.exists():
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            payload = file_path.read_bytes()
+            return orjson.loads(payload) if orjson is not None else json.loads(payload)
         
         return {}
     
     def save_json_data(self, data: Dict[str, Any], filename: str) -> None:
-        """Save data as JSON file"""
+        """
+        Save data as JSON file
+        
+        Written to a per-writer temporary sibling and renamed over the target, so readers
+        never see a partially written file (no fsync: a crash may lose the update, not the file).
+        """
         file_path = self.base_path / filename
         
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        # Serialized to one buffer and written in a single call
+        if orjson is not None:
+            payload = orjson.dumps(
+                data, default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS
+            )
+        else:
+            payload = json.dumps(data, indent=2, default=str).encode('utf-8')
+        
+        temp_path = file_path.with_name(f'.{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        try:
+            temp_path.write_bytes(payload)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
     
     def cleanup_old_files(self, days_old: int = 7) -> None:
         """Clean up files older than specified days"""
         cutoff_time = datetime.now().timestamp() - (days_old * 24 * 60 * 60)
         
-        for directory in [self.uploads_dir, self.generated_dir]:
-            for file_path in directory.rglob('*'):
-                if file_path.is_file() and file_path.stat().st_mtime < cutoff_time:
-                    try:
-                        file_path.unlink()
-                    except Exception:
-                        pass  # Ignore errors during cleanup
+        for directory in [self.uploads_dir, self.generated_dir, self.validate_cache_dir, self.llm_cache_dir]:
+            for entry in self._walk_files(directory):
+                try:
+                    if entry.stat().st_mtime < cutoff_time:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass  # Ignore errors during cleanup
+    
+    @classmethod
+    def _walk_files(cls, directory: Union[str, Path]):
+        """Yield os.DirEntry objects for the files under directory (file types come from readdir)"""
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from cls._walk_files(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            return  # Directory vanished or is unreadable
@@ -3,27 +3,164 @@ JIRA API Client for PI Planning Dashboard
 Handles JIRA integration with mock implementations for demo mode
 """
 
+import asyncio
+import bisect
+import copy
+import inspect
+import re
+import sys
 import time
 import random
-from typing import Dict, List, Any, Optional
+import threading
+from collections import deque
+from functools import cached_property, wraps
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Any, Optional
 from datetime import datetime, timedelta
 
+try:
+    import orjson  # Optional: faster encoding/decoding of JIRA REST payloads
+except ImportError:
+    orjson = None
+
+# Story quality checks (case-insensitive, so summaries and descriptions are never lowercased)
+_STORY_FORMAT_RE = re.compile('as a', re.IGNORECASE)
+_ACCEPTANCE_CRITERIA_RE = re.compile('acceptance criteria', re.IGNORECASE)
+
+# Story quality labels by score: below 50, from 50, from 70, from 90
+_QUALITY_THRESHOLDS = (50, 70, 90)
+_QUALITY_LABELS = ('Poor', 'Fair', 'Good', 'Excellent')
+
+# Story quality issue keyword -> recommendation, checked in order
+_STORY_RECOMMENDATIONS = (
+    ('format', 'Rewrite using: "As a [user type], I want [functionality] so that [benefit]"'),
+    ('acceptance criteria', 'Add clear acceptance criteria with Given/When/Then format'),
+    ('story points', 'Estimate story points using planning poker or similar technique'),
+    ('assignee', 'Assign to appropriate team member based on skills required'),
+    ('epic', 'Link to relevant Epic to show business context'),
+    ('summary', 'Adjust summary length to be clear and concise (10-100 characters)')
+)
+
+def _intern(value: Any) -> Any:
+    """Intern a string field value so repeated values (assignees, epic keys) share one object"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+def _ttl_cached(method=None, *, stale_while_revalidate: bool = False):
+    """
+    Reuse a read method's result for cache_ttl seconds per set of arguments
+    
+    Positional and keyword spellings of the same call (defaults included) share one entry.
+    With stale_while_revalidate, a result up to cache_stale_ttl old is still returned at once
+    while one background thread refetches it. Callers get a shallow copy: adding or removing
+    items of a returned list/dict leaves the cached one intact, but the items themselves are
+    shared and must be treated as read-only. Writes through the client call _invalidate_cache().
+    """
+    def decorate(method):
+        signature = inspect.signature(method)
+        
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (method.__name__,) + tuple(tuple(arg) if isinstance(arg, list) else arg
+                                             for arg in list(bound.arguments.values())[1:])
+            args, kwargs = bound.args[1:], bound.kwargs
+            cached = self._cache.get(key)
+            if cached is not None:
+                age = time.monotonic() - cached[0]
+                if age < self.cache_ttl:
+                    return copy.copy(cached[1])
+                if stale_while_revalidate and age < self.cache_stale_ttl:
+                    self._refresh_in_background(key, method, args, kwargs)
+                    return copy.copy(cached[1])
+            
+            result = self._fetch_and_cache(key, method, args, kwargs, self._cache_generation)
+            return copy.copy(result)
+        return wrapper
+    
+    return decorate(method) if method is not None else decorate
+
+class _RateLimiter:
+    """Token bucket shared by worker threads: at most `rate` acquisitions per second (0 = unlimited)"""
+    
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request may be sent"""
+        if self.rate <= 0:
+            return
+        
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
 class JIRAClient:
     """JIRA API client with mock implementation for demo purposes"""
     
-    def __init__(self, config: Dict[str, str]):
+    # Maximum issues accepted by one bulk-delete or bulk-edit request
+    BULK_ISSUE_LIMIT = 1000
+    
+    # Bulk requests run as server-side tasks: seconds between status polls, and the longest wait per task
+    BULK_TASK_POLL_INTERVAL = 1.0
+    BULK_TASK_TIMEOUT = 600.0
+    
+    # Maximum issues accepted by one bulk-create request
+    BULK_CREATE_LIMIT = 50
+    
+    # Issues requested per search page (JIRA caps it per server; key-only pages allow large ones)
+    SEARCH_BATCH_SIZE = 500
+    
+    # Cleanup options run at once per client (the page shares one client per process)
+    CLEANUP_WORKERS = 8
+    
+    def __init__(self, config: Dict[str, str], simulate_latency: bool = False):
         self.config = config
+        self.simulate_latency = simulate_latency
         self.mock_mode = config.get('mock_mode', True)
         self.server = config.get('server', '')
         self.user = config.get('user', '')
         self.token = config.get('token', '')
         self.project_key = config.get('project_key', 'PI')
+        self.cleanup_concurrency = max(1, int(config.get('cleanup_concurrency', 16)))
+        
+        self.cache_ttl = float(config.get('cache_ttl', 60))
+        self.cache_stale_ttl = max(self.cache_ttl, float(config.get('cache_stale_ttl', 600)))
+        
+        # Every cleanup request (per-item or bulk) takes a token first, across all workers
+        self._cleanup_limiter = _RateLimiter(float(config.get('cleanup_rate_limit', 0)))
         
-        # Mock data for demo mode
-        self.mock_data = self._initialize_mock_data()
+        # Read results by (method, arguments) -> (monotonic time, result); see _ttl_cached. The
+        # generation changes on every invalidation so in-flight refreshes don't store old data
+        self._cache: Dict[tuple, tuple] = {}
+        self._cache_generation = 0
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+        
+        # Real JIRA connection, opened on first use and reused for every call
+        self._jira = None
+        self._jira_lock = threading.Lock()
+        self._http = None
+        self._approximate_count_supported = True
+        
+        # Worker threads for streamed cleanups, shared by every session using this client
+        self._cleanup_executor = ThreadPoolExecutor(max_workers=self.CLEANUP_WORKERS, thread_name_prefix='jira-cleanup')
     
-    def _initialize_mock_data(self) -> Dict[str, Any]:
-        """Initialize mock JIRA data for demo purposes"""
+    @cached_property
+    def mock_data(self) -> Dict[str, Any]:
+        """Mock JIRA data for demo mode, built on first use (real-mode clients never build it)"""
+        now = datetime.now()
         return {
             'epics': [
                 {
@@ -31,21 +168,21 @@ class JIRAClient:
                     'summary': 'User Authentication System',
                     'status': 'To Do',
                     'assignee': 'john.doe@company.com',
-                    'created': datetime.now() - timedelta(days=30)
+                    'created': now - timedelta(days=30)
                 },
                 {
                     'key': 'PI-2',
                     'summary': 'Payment Processing Integration',
                     'status': 'In Progress',
                     'assignee': 'jane.smith@company.com',
-                    'created': datetime.now() - timedelta(days=25)
+                    'created': now - timedelta(days=25)
                 },
                 {
                     'key': 'PI-3',
                     'summary': 'Mobile App Performance Optimization',
                     'status': 'To Do',
                     'assignee': 'mike.johnson@company.com',
-                    'created': datetime.now() - timedelta(days=20)
+                    'created': now - timedelta(days=20)
                 }
             ],
             'stories': [
@@ -120,6 +257,103 @@ class JIRAClient:
             'labels': ['authentication', 'payment', 'performance', 'mobile', 'security']
         }
     
+    def _count_issues(self, jira, jql: str) -> int:
+        """
+        Count issues matching a JQL query without fetching any of them
+        
+        Uses JIRA Cloud's approximate-count endpoint (constant time, but may lag recent
+        changes slightly); servers without it fall back to a zero-result search's total.
+        """
+        if self._approximate_count_supported:
+            from jira.exceptions import JIRAError
+            
+            url = f"{self.server.rstrip('/')}/rest/api/3/search/approximate-count"
+            try:
+                return self._post_json(jira, url, {'jql': jql})['count']
+            except JIRAError as e:
+                if e.status_code not in (404, 405):
+                    raise
+                self._approximate_count_supported = False
+        
+        params = {'jql': jql, 'maxResults': 0, 'fields': 'key'}
+        return jira._get_json('search', params=params)['total']
+    
+    @staticmethod
+    def _post_json(jira, url: str, payload: Dict[str, Any]) -> Any:
+        """POST a JSON payload on the shared JIRA session and return the decoded response (orjson when available)"""
+        if orjson is None:
+            response = jira._session.post(url, json=payload)
+            return response.json() if response.content else None
+        
+        response = jira._session.post(url, data=orjson.dumps(payload), headers={'Content-Type': 'application/json'})
+        return orjson.loads(response.content) if response.content else None
+    
+    @staticmethod
+    def _get_json_url(jira, url: str) -> Any:
+        """GET an absolute URL on the shared JIRA session and return the decoded response (orjson when available)"""
+        response = jira._session.get(url)
+        if not response.content:
+            return None
+        return response.json() if orjson is None else orjson.loads(response.content)
+    
+    def _simulate_delay(self, low: float, high: float):
+        """Sleep like a real API call would, only when simulated latency is enabled"""
+        if self.simulate_latency:
+            time.sleep(random.uniform(low, high))
+    
+    async def _simulate_delay_async(self, low: float, high: float):
+        """Await like a real API call would (without blocking the loop), only when simulated latency is enabled"""
+        if self.simulate_latency:
+            await asyncio.sleep(random.uniform(low, high))
+    
+    def _get_jira(self):
+        """Return the shared JIRA connection, creating it on first use"""
+        with self._jira_lock:
+            if self._jira is None:
+                from jira import JIRA
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                
+                # Skip the serverInfo round trip at construction; nothing here needs it
+                jira = JIRA(server=self.server, basic_auth=(self.user, self.token), get_server_info=False)
+                
+                # Keep enough pooled keep-alive connections for concurrent cleanup deletes; retry
+                # dropped connections (JIRA's session already retries 429/503 responses itself)
+                adapter = HTTPAdapter(
+                    pool_connections=20,
+                    pool_maxsize=max(100, self.cleanup_concurrency),
+                    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=())
+                )
+                jira._session.mount('https://', adapter)
+                jira._session.mount('http://', adapter)
+                self._jira = jira
+            return self._jira
+    
+    def _get_http(self):
+        """
+        Return the shared httpx client used for high-volume per-issue calls
+        
+        Speaks HTTP/2 when the h2 package is installed, so concurrent requests share
+        one multiplexed connection instead of each needing its own.
+        """
+        with self._jira_lock:
+            if self._http is None:
+                import httpx
+                try:
+                    import h2  # noqa: F401
+                    http2 = True
+                except ImportError:
+                    http2 = False
+                
+                self._http = httpx.Client(
+                    base_url=self.server,
+                    auth=(self.user, self.token),
+                    http2=http2,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                    timeout=30.0
+                )
+            return self._http
+    
     def is_connected(self) -> bool:
         """Check if connected to JIRA"""
         if self.mock_mode:
@@ -129,14 +363,55 @@ class JIRAClient:
         # For now, return True if credentials are provided
         return bool(self.server and self.user and self.token)
     
+    def _invalidate_cache(self):
+        """Forget cached read results after anything in the project changes"""
+        self._cache_generation += 1
+        self._cache.clear()
+    
+    def _fetch_and_cache(self, key: tuple, method: Callable, args: tuple, kwargs: dict, generation: int) -> Any:
+        """Call a read method and cache its result, unless the cache was invalidated meanwhile"""
+        result = method(self, *args, **kwargs)
+        if self.cache_ttl > 0 and generation == self._cache_generation:
+            self._cache[key] = (time.monotonic(), result)
+        return result
+    
+    def _refresh_in_background(self, key: tuple, method: Callable, args: tuple, kwargs: dict):
+        """Refetch a stale cached result on a daemon thread (at most one refresh per key at a time)"""
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        
+        generation = self._cache_generation
+        
+        def refresh():
+            try:
+                self._fetch_and_cache(key, method, args, kwargs, generation)
+            except Exception as e:
+                print(f"Background refresh of {key[0]} failed: {e}")
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+        
+        threading.Thread(target=refresh, name=f'jira-refresh-{key[0]}', daemon=True).start()
+    
+    @cached_property
+    def uses_mock_data(self) -> bool:
+        """
+        Whether reads and cleanups use mock data: demo mode, or no usable JIRA credentials
+        
+        Fixed after construction; delete the attribute if server/user/token are changed.
+        Such a client mutates its own mock_data, so share it only within one session.
+        """
+        has_valid_credentials = bool(self.server and self.user and self.token and self.token != 'your-jira-api-token')
+        return self.mock_mode or not has_valid_credentials
+    
+    @_ttl_cached(stale_while_revalidate=True)
     def get_project_summary(self) -> Dict[str, int]:
         """Get summary of current project state"""
-        # Check if we have valid JIRA credentials
-        has_valid_credentials = bool(self.server and self.user and self.token and self.token != 'your-jira-api-token')
-        
-        if self.mock_mode or not has_valid_credentials:
-            # Simulate API delay
-            time.sleep(0.5)
+        if self.uses_mock_data:
+            # Optional demo API delay (off by default)
+            self._simulate_delay(0.5, 0.5)
             
             return {
                 'epics': len(self.mock_data['epics']),
@@ -147,37 +422,31 @@ class JIRAClient:
         
         # Real JIRA API call
         try:
-            from jira import JIRA
+            jira = self._get_jira()
             
-            # Connect to JIRA
-            jira = JIRA(server=self.server, basic_auth=(self.user, self.token))
+            # Count each issue type (JIRA has no group-by count, so this stays one query per type)
+            issue_types = {'epics': 'Epic', 'stories': 'Story', 'tasks': 'Task', 'bugs': 'Bug'}
             
-            # Get project issues
-            epics = jira.search_issues(f'project = {self.project_key} AND issuetype = Epic')
-            stories = jira.search_issues(f'project = {self.project_key} AND issuetype = Story')
-            tasks = jira.search_issues(f'project = {self.project_key} AND issuetype = Task')
-            bugs = jira.search_issues(f'project = {self.project_key} AND issuetype = Bug')
+            def count_issues(issue_type: str) -> int:
+                return self._count_issues(jira, f'project = {self.project_key} AND issuetype = {issue_type}')
             
-            return {
-                'epics': len(epics),
-                'stories': len(stories),
-                'tasks': len(tasks),
-                'bugs': len(bugs)
-            }
+            # Run the four counts concurrently so the summary costs one round trip
+            with ThreadPoolExecutor(max_workers=len(issue_types)) as executor:
+                counts = executor.map(count_issues, issue_types.values())
+                return dict(zip(issue_types, counts))
             
         except Exception as e:
             # If JIRA connection fails, return empty project
             print(f"JIRA connection failed: {e}")
             return {'epics': 0, 'stories': 0, 'tasks': 0, 'bugs': 0}
     
-    def cleanup_items(self, item_type: str) -> Dict[str, Any]:
-        """Clean up specific type of items"""
-        # Check if we have valid JIRA credentials
-        has_valid_credentials = bool(self.server and self.user and self.token and self.token != 'your-jira-api-token')
+    def cleanup_items(self, item_type: str, on_progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """Clean up specific type of items, reporting (deleted, total) issues to on_progress"""
+        self._invalidate_cache()
         
-        if self.mock_mode or not has_valid_credentials:
-            # Simulate API processing time
-            time.sleep(random.uniform(0.5, 2.0))
+        if self.uses_mock_data:
+            # Optional demo API processing time (off by default)
+            self._simulate_delay(0.5, 2.0)
             
             # Mock cleanup results
             cleanup_counts = {
@@ -213,10 +482,7 @@ class JIRAClient:
         
         # Real JIRA cleanup implementation
         try:
-            from jira import JIRA
-            
-            # Connect to JIRA
-            jira = JIRA(server=self.server, basic_auth=(self.user, self.token))
+            jira = self._get_jira()
             
             # Map item types to JIRA issue types
             issue_type_mapping = {
@@ -228,36 +494,54 @@ class JIRAClient:
             }
             
             if item_type in issue_type_mapping:
-                # Get all issues of this type
+                # Get all issues of this type (every page, keys only)
                 jql = f'project = {self.project_key} AND issuetype = "{issue_type_mapping[item_type]}"'
-                issues = jira.search_issues(jql)
+                issues = self._search_issue_keys(jira, jql)
                 
-                # Delete each issue
-                deleted_count = 0
-                for issue in issues:
-                    try:
-                        issue.delete()
-                        deleted_count += 1
-                    except Exception as e:
-                        print(f"Failed to delete {issue.key}: {e}")
+                # One bulk request per 1000 issues; servers without the bulk route
+                # fall back to concurrent per-issue deletes, bounded so they aren't flooded
+                deleted_count = self._bulk_issue_request(
+                    jira, 'bulk/issues/delete', issues, {'sendBulkNotification': False}, on_progress
+                )
+                if deleted_count is None:
+                    deleted_count = self._for_each_issue(self._delete_issue, issues, on_progress)
                 
+                failed_count = len(issues) - deleted_count
                 return {
                     'success': True,
                     'count': deleted_count,
-                    'message': f'Deleted {deleted_count} {item_type}'
+                    'message': f'Deleted {deleted_count} {item_type}' + (f', {failed_count} failed' if failed_count else '')
+                }
+            
+            elif item_type == 'labels':
+                # Get every labelled issue (every page, keys only)
+                jql = f'project = {self.project_key} AND labels is not EMPTY'
+                issues = self._search_issue_keys(jira, jql)
+                
+                # Bulk-edit labels away 1000 issues at a time, else per-issue edits
+                bulk_edit = {
+                    'selectedActions': ['labels'],
+                    'editedFieldsInput': {
+                        'labelsFields': [{'fieldId': 'labels', 'bulkEditMultiSelectFieldOption': 'REMOVE_ALL', 'labels': []}]
+                    },
+                    'sendBulkNotification': False
+                }
+                cleared_count = self._bulk_issue_request(jira, 'bulk/issues/fields', issues, bulk_edit, on_progress)
+                if cleared_count is None:
+                    cleared_count = self._for_each_issue(self._clear_labels, issues, on_progress)
+                
+                failed_count = len(issues) - cleared_count
+                return {
+                    'success': True,
+                    'count': cleared_count,
+                    'message': f'Cleared labels from {cleared_count} issues' + (f', {failed_count} failed' if failed_count else '')
                 }
             
             elif item_type == 'components':
-                # Delete project components
+                # Delete project components (concurrently, like issues)
                 project = jira.project(self.project_key)
                 components = jira.project_components(project)
-                deleted_count = len(components)
-                
-                for component in components:
-                    try:
-                        component.delete()
-                    except Exception as e:
-                        print(f"Failed to delete component {component.name}: {e}")
+                deleted_count = self._for_each_issue(self._delete_project_item, components, on_progress)
                 
                 return {
                     'success': True,
@@ -266,16 +550,10 @@ class JIRAClient:
                 }
             
             elif item_type == 'versions':
-                # Delete project versions
+                # Delete project versions (concurrently, like issues)
                 project = jira.project(self.project_key)
                 versions = jira.project_versions(project)
-                deleted_count = len(versions)
-                
-                for version in versions:
-                    try:
-                        version.delete()
-                    except Exception as e:
-                        print(f"Failed to delete version {version.name}: {e}")
+                deleted_count = self._for_each_issue(self._delete_project_item, versions, on_progress)
                 
                 return {
                     'success': True,
@@ -296,56 +574,171 @@ class JIRAClient:
                 'error': f'JIRA cleanup failed: {str(e)}'
             }
     
+    def _search_issue_keys(self, jira, jql: str) -> List[Any]:
+        """Every issue matching jql (keys only), fetched SEARCH_BATCH_SIZE per page instead of the default 50"""
+        issues = []
+        while True:
+            page = jira.search_issues(jql, startAt=len(issues), maxResults=self.SEARCH_BATCH_SIZE, fields='key')
+            issues.extend(page)
+            # The server may return fewer than requested per page; stop at its reported total
+            if not page or len(issues) >= page.total:
+                return issues
+    
+    def _bulk_issue_request(self, jira, endpoint: str, issues, payload: Dict[str, Any],
+                            on_progress: Optional[Callable[[int, int], None]] = None) -> Optional[int]:
+        """
+        Run a bulk operation for issues in batches of BULK_ISSUE_LIMIT keys
+        
+        Each batch becomes a server-side task, which is polled until it finishes. Returns the
+        number of issues the tasks report as succeeded, or None if the server doesn't offer
+        the endpoint.
+        """
+        from jira.exceptions import JIRAError
+        
+        api_url = f"{self.server.rstrip('/')}/rest/api/3"
+        keys = [issue.key for issue in issues]
+        succeeded = 0
+        
+        for start in range(0, len(keys), self.BULK_ISSUE_LIMIT):
+            batch_keys = keys[start:start + self.BULK_ISSUE_LIMIT]
+            self._cleanup_limiter.acquire()
+            try:
+                submitted = self._post_json(jira, f'{api_url}/{endpoint}', dict(payload, selectedIssueIdsOrKeys=batch_keys))
+            except JIRAError as e:
+                # Route missing (older Cloud or Server/DC) - only safe to fall back before any batch went out
+                if start == 0 and e.status_code in (404, 405):
+                    return None
+                raise
+            
+            task_id = (submitted or {}).get('taskId')
+            if task_id is None:
+                raise RuntimeError(f'{endpoint} returned no task to track')
+            
+            report = None
+            if on_progress:
+                report = lambda percent: on_progress(start + len(batch_keys) * percent // 100, len(keys))
+            succeeded += self._wait_for_bulk_task(jira, f'{api_url}/bulk/queue/{task_id}', report)
+        
+        return succeeded
+    
+    def _wait_for_bulk_task(self, jira, url: str, on_percent: Optional[Callable[[int], None]] = None) -> int:
+        """Poll a bulk task until it finishes, returning how many issues it processed successfully"""
+        deadline = time.monotonic() + self.BULK_TASK_TIMEOUT
+        while True:
+            task = self._get_json_url(jira, url) or {}
+            status = task.get('status')
+            if on_percent:
+                on_percent(task.get('progressPercent') or 0)
+            
+            if status not in ('ENQUEUED', 'RUNNING', 'CANCEL_REQUESTED'):
+                # COMPLETE, or a FAILED/CANCELLED/DEAD task that may still have processed some issues
+                return len(task.get('processedAccessibleIssues') or ())
+            if time.monotonic() > deadline:
+                raise RuntimeError(f'Bulk task still {status.lower()} after {self.BULK_TASK_TIMEOUT:.0f}s')
+            time.sleep(self.BULK_TASK_POLL_INTERVAL)
+    
+    def _for_each_issue(self, action: Callable[[Any], bool], issues,
+                        on_progress: Optional[Callable[[int, int], None]] = None) -> int:
+        """
+        Apply a per-item action (issues, components, versions) concurrently, returning the successes
+        
+        Bounded by cleanup_concurrency workers; the actions themselves take rate-limiter tokens.
+        """
+        succeeded = deque()
+        with ThreadPoolExecutor(max_workers=self.cleanup_concurrency) as executor:
+            for done, issue_succeeded in enumerate(executor.map(action, issues), 1):
+                succeeded.append(issue_succeeded)
+                if on_progress:
+                    on_progress(done, len(issues))
+        return sum(succeeded)
+    
+    def _clear_labels(self, issue) -> bool:
+        """Remove every label from a single issue, returning whether it succeeded"""
+        self._cleanup_limiter.acquire()
+        try:
+            issue.update(fields={'labels': []}, notify=False)
+            return True
+        except Exception as e:
+            print(f"Failed to clear labels on {issue.key}: {e}")
+            return False
+    
+    def _delete_issue(self, issue) -> bool:
+        """Delete a single issue, returning whether it succeeded"""
+        self._cleanup_limiter.acquire()
+        try:
+            self._get_http().delete(f"/rest/api/3/issue/{issue.key}").raise_for_status()
+            return True
+        except Exception as e:
+            print(f"Failed to delete {issue.key}: {e}")
+            return False
+    
+    def _delete_project_item(self, item) -> bool:
+        """Delete a single project component or version, returning whether it succeeded"""
+        self._cleanup_limiter.acquire()
+        try:
+            item.delete()
+            return True
+        except Exception as e:
+            print(f"Failed to delete {item.name}: {e}")
+            return False
+    
+    async def cleanup_items_stream(self, item_type: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Clean up specific type of items without blocking the event loop
+        
+        Yields {'done', 'total'} progress updates as issues are deleted, then the
+        cleanup_items result dict as the final item.
+        """
+        loop = asyncio.get_running_loop()
+        updates = asyncio.Queue()
+        
+        def report(done: int, total: int):
+            loop.call_soon_threadsafe(updates.put_nowait, {'done': done, 'total': total})
+        
+        cleanup = loop.run_in_executor(self._cleanup_executor, self.cleanup_items, item_type, report)
+        
+        # Relay progress until the cleanup finishes (its reports are queued before it completes)
+        while not cleanup.done():
+            next_update = asyncio.ensure_future(updates.get())
+            await asyncio.wait({next_update, cleanup}, return_when=asyncio.FIRST_COMPLETED)
+            if next_update.done():
+                yield next_update.result()
+            else:
+                next_update.cancel()
+        
+        while not updates.empty():
+            yield updates.get_nowait()
+        
+        yield cleanup.result()
+    
+    @_ttl_cached
     def get_all_issues(self, issue_types: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Get all issues from the project"""
+        return list(self.iter_all_issues(issue_types))
+    
+    def iter_all_issues(self, issue_types: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over the project's issues without building a combined list (for single-pass callers)"""
         if self.mock_mode:
-            all_issues = []
-            
             if not issue_types or 'Epic' in issue_types:
-                all_issues.extend(self.mock_data['epics'])
+                yield from self.mock_data['epics']
             
             if not issue_types or 'Story' in issue_types:
-                all_issues.extend(self.mock_data['stories'])
+                yield from self.mock_data['stories']
             
             if not issue_types or 'Task' in issue_types:
-                all_issues.extend(self.mock_data['tasks'])
+                yield from self.mock_data['tasks']
             
             if not issue_types or 'Bug' in issue_types:
-                all_issues.extend(self.mock_data['bugs'])
-            
-            return all_issues
+                yield from self.mock_data['bugs']
         
         # TODO: Implement real JIRA API call
-        return []
     
     def create_epic(self, epic_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new Epic in JIRA"""
         if self.mock_mode:
-            # Simulate API delay
-            time.sleep(random.uniform(0.5, 1.5))
-            
-            # Generate mock epic key
-            epic_key = f"{self.project_key}-{random.randint(100, 999)}"
-            
-            epic = {
-                'key': epic_key,
-                'summary': epic_data.get('summary', 'New Epic'),
-                'description': epic_data.get('description', ''),
-                'status': 'To Do',
-                'assignee': epic_data.get('assignee'),
-                'created': datetime.now(),
-                'labels': epic_data.get('labels', []),
-                'components': epic_data.get('components', [])
-            }
-            
-            # Add to mock data
-            self.mock_data['epics'].append(epic)
-            
-            return {
-                'success': True,
-                'key': epic_key,
-                'url': f"{self.server}/browse/{epic_key}"
-            }
+            # Optional demo API delay (off by default)
+            self._simulate_delay(0.5, 1.5)
+            return self._create_mock_epic(epic_data)
         
         # TODO: Implement real JIRA Epic creation
         return {
@@ -353,36 +746,47 @@ class JIRAClient:
             'error': 'Real JIRA Epic creation not implemented yet'
         }
     
+    async def acreate_epic(self, epic_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new Epic in JIRA without blocking the event loop"""
+        if self.mock_mode:
+            await self._simulate_delay_async(0.5, 1.5)
+            return self._create_mock_epic(epic_data)
+        
+        return self.create_epic(epic_data)
+    
+    def _create_mock_epic(self, epic_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add an Epic to the mock data"""
+        self._invalidate_cache()
+        
+        # Generate mock epic key
+        epic_key = f"{self.project_key}-{random.randint(100, 999)}"
+        
+        epic = {
+            'key': epic_key,
+            'summary': epic_data.get('summary', 'New Epic'),
+            'description': epic_data.get('description', ''),
+            'status': 'To Do',
+            'assignee': _intern(epic_data.get('assignee')),
+            'created': datetime.now(),
+            'labels': epic_data.get('labels', []),
+            'components': epic_data.get('components', [])
+        }
+        
+        # Add to mock data
+        self.mock_data['epics'].append(epic)
+        
+        return {
+            'success': True,
+            'key': epic_key,
+            'url': f"{self.server}/browse/{epic_key}"
+        }
+    
     def create_story(self, story_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new Story in JIRA"""
         if self.mock_mode:
-            # Simulate API delay
-            time.sleep(random.uniform(0.3, 1.0))
-            
-            # Generate mock story key
-            story_key = f"{self.project_key}-{random.randint(100, 999)}"
-            
-            story = {
-                'key': story_key,
-                'summary': story_data.get('summary', 'New Story'),
-                'description': story_data.get('description', ''),
-                'status': 'To Do',
-                'assignee': story_data.get('assignee'),
-                'epic': story_data.get('epic_key'),
-                'story_points': story_data.get('story_points'),
-                'created': datetime.now(),
-                'labels': story_data.get('labels', []),
-                'components': story_data.get('components', [])
-            }
-            
-            # Add to mock data
-            self.mock_data['stories'].append(story)
-            
-            return {
-                'success': True,
-                'key': story_key,
-                'url': f"{self.server}/browse/{story_key}"
-            }
+            # Optional demo API delay (off by default)
+            self._simulate_delay(0.3, 1.0)
+            return self._create_mock_story(story_data)
         
         # TODO: Implement real JIRA Story creation
         return {
@@ -390,43 +794,136 @@ class JIRAClient:
             'error': 'Real JIRA Story creation not implemented yet'
         }
     
+    async def acreate_story(self, story_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new Story in JIRA without blocking the event loop"""
+        if self.mock_mode:
+            await self._simulate_delay_async(0.3, 1.0)
+            return self._create_mock_story(story_data)
+        
+        return self.create_story(story_data)
+    
+    def _create_mock_story(self, story_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add a Story to the mock data"""
+        self._invalidate_cache()
+        
+        # Generate mock story key
+        story_key = f"{self.project_key}-{random.randint(100, 999)}"
+        
+        story = {
+            'key': story_key,
+            'summary': story_data.get('summary', 'New Story'),
+            'description': story_data.get('description', ''),
+            'status': 'To Do',
+            'assignee': _intern(story_data.get('assignee')),
+            'epic': _intern(story_data.get('epic_key')),
+            'story_points': story_data.get('story_points'),
+            'created': datetime.now(),
+            'labels': story_data.get('labels', []),
+            'components': story_data.get('components', [])
+        }
+        
+        # Add to mock data
+        self.mock_data['stories'].append(story)
+        
+        return {
+            'success': True,
+            'key': story_key,
+            'url': f"{self.server}/browse/{story_key}"
+        }
+    
     def bulk_create_issues(self, issues_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Create multiple issues in bulk"""
+        """Create multiple issues in bulk (call from synchronous code; async callers use abulk_create_issues)"""
+        return asyncio.run(self.abulk_create_issues(issues_data))
+    
+    async def abulk_create_issues(self, issues_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create multiple issues in bulk: one request per BULK_CREATE_LIMIT issues, batches in flight at once"""
+        batches = [
+            issues_data[start:start + self.BULK_CREATE_LIMIT]
+            for start in range(0, len(issues_data), self.BULK_CREATE_LIMIT)
+        ]
+        
         if self.mock_mode:
-            created_issues = []
-            errors = []
+            # One (optional) simulated round trip per batch, not per issue
+            await asyncio.gather(*(self._simulate_delay_async(0.5, 1.5) for _ in batches))
             
+            results = []
             for issue_data in issues_data:
-                issue_type = issue_data.get('issue_type', 'Story')
-                
                 try:
-                    if issue_type == 'Epic':
-                        result = self.create_epic(issue_data)
-                    else:
-                        result = self.create_story(issue_data)
-                    
-                    if result['success']:
-                        created_issues.append(result)
+                    if issue_data.get('issue_type', 'Story') == 'Epic':
+                        results.append(self._create_mock_epic(issue_data))
                     else:
-                        errors.append(result['error'])
-                
+                        results.append(self._create_mock_story(issue_data))
                 except Exception as e:
-                    errors.append(str(e))
-            
-            return {
-                'success': len(errors) == 0,
-                'created_count': len(created_issues),
-                'error_count': len(errors),
-                'created_issues': created_issues,
-                'errors': errors
-            }
+                    results.append({'success': False, 'error': str(e)})
+        else:
+            try:
+                jira = self._get_jira()
+                batch_results = await asyncio.gather(
+                    *(asyncio.to_thread(self._create_issue_batch, jira, batch) for batch in batches)
+                )
+            except Exception as e:
+                return {
+                    'success': False,
+                    'error': f'JIRA bulk creation failed: {str(e)}'
+                }
+            results = [result for batch_result in batch_results for result in batch_result]
+            self._invalidate_cache()
+        
+        created_issues = [result for result in results if result['success']]
+        errors = [result['error'] for result in results if not result['success']]
         
-        # TODO: Implement real JIRA bulk creation
         return {
-            'success': False,
-            'error': 'Real JIRA bulk creation not implemented yet'
+            'success': len(errors) == 0,
+            'created_count': len(created_issues),
+            'error_count': len(errors),
+            'created_issues': created_issues,
+            'errors': errors
         }
     
+    def _issue_update(self, issue_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create payload for one issue (REST v2, which takes plain-text descriptions)"""
+        issue_type = issue_data.get('issue_type', 'Story')
+        fields = {
+            'project': {'key': self.project_key},
+            'issuetype': {'name': issue_type},
+            'summary': issue_data.get('summary', f'New {issue_type}')
+        }
+        if issue_data.get('description'):
+            fields['description'] = issue_data['description']
+        if issue_data.get('labels'):
+            fields['labels'] = list(issue_data['labels'])
+        if issue_data.get('components'):
+            fields['components'] = [{'name': component} for component in issue_data['components']]
+        if issue_data.get('epic_key'):
+            fields['parent'] = {'key': issue_data['epic_key']}
+        return {'fields': fields}
+    
+    def _create_issue_batch(self, jira, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """POST one bulk-create request, returning a create result per issue in batch order"""
+        from jira.exceptions import JIRAError
+        
+        url = f"{self.server.rstrip('/')}/rest/api/2/issue/bulk"
+        try:
+            response = self._post_json(jira, url, {'issueUpdates': [self._issue_update(d) for d in batch]})
+        except JIRAError as e:
+            # The whole batch was rejected
+            return [{'success': False, 'error': f'Bulk create failed: {e.text or e}'}] * len(batch)
+        
+        # Created issues come back in request order, minus the failed elements
+        failed = {
+            error['failedElementNumber']: '; '.join(error.get('elementErrors', {}).get('errors', {}).values())
+            for error in response.get('errors', [])
+        }
+        created = iter(response.get('issues', []))
+        results = []
+        for index in range(len(batch)):
+            if index in failed:
+                results.append({'success': False, 'error': failed[index] or 'Issue rejected by JIRA'})
+            else:
+                key = next(created)['key']
+                results.append({'success': True, 'key': key, 'url': f"{self.server}/browse/{key}"})
+        return results
+    
     def analyze_story_quality(self, story: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze the quality of a user story"""
         issues = []
@@ -434,13 +931,13 @@ class JIRAClient:
         
         # Check story format
         summary = story.get('summary', '')
-        if not summary.lower().startswith('as a'):
+        if not _STORY_FORMAT_RE.match(summary):
             issues.append('Story does not follow "As a... I want... So that..." format')
             score -= 20
         
         # Check for acceptance criteria
         description = story.get('description', '')
-        if not description or 'acceptance criteria' not in description.lower():
+        if not description or not _ACCEPTANCE_CRITERIA_RE.search(description):
             issues.append('Missing acceptance criteria')
             score -= 15
         
@@ -468,14 +965,7 @@ class JIRAClient:
             score -= 5
         
         # Determine quality level
-        if score >= 90:
-            quality = 'Excellent'
-        elif score >= 70:
-            quality = 'Good'
-        elif score >= 50:
-            quality = 'Fair'
-        else:
-            quality = 'Poor'
+        quality = _QUALITY_LABELS[bisect.bisect_right(_QUALITY_THRESHOLDS, score)]
         
         return {
             'score': max(0, score),
@@ -484,26 +974,24 @@ class JIRAClient:
             'recommendations': self._get_story_recommendations(issues)
         }
     
+    def analyze_stories_bulk(self, stories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Analyze the quality of many user stories, in order"""
+        return [self.analyze_story_quality(story) for story in stories]
+    
     def _get_story_recommendations(self, issues: List[str]) -> List[str]:
         """Get recommendations based on story issues"""
         recommendations = []
         
         for issue in issues:
-            if 'format' in issue.lower():
-                recommendations.append('Rewrite using: "As a [user type], I want [functionality] so that [benefit]"')
-            elif 'acceptance criteria' in issue.lower():
-                recommendations.append('Add clear acceptance criteria with Given/When/Then format')
-            elif 'story points' in issue.lower():
-                recommendations.append('Estimate story points using planning poker or similar technique')
-            elif 'assignee' in issue.lower():
-                recommendations.append('Assign to appropriate team member based on skills required')
-            elif 'epic' in issue.lower():
-                recommendations.append('Link to relevant Epic to show business context')
-            elif 'summary' in issue.lower():
-                recommendations.append('Adjust summary length to be clear and concise (10-100 characters)')
+            issue_lower = issue.lower()
+            for keyword, recommendation in _STORY_RECOMMENDATIONS:
+                if keyword in issue_lower:
+                    recommendations.append(recommendation)
+                    break
         
         return recommendations
     
+    @_ttl_cached(stale_while_revalidate=True)
     def get_team_dependencies(self) -> List[Dict[str, Any]]:
         """Get team dependencies from JIRA data"""
         if self.mock_mode:
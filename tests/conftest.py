@@ -0,0 +1,11 @@
+"""
+Shared pytest setup for PI Planning Dashboard tests
+"""
+
+import sys
+from pathlib import Path
+
+# Make the app's packages importable as the pages import them (utils, components, agents)
+app_dir = Path(__file__).resolve().parent.parent / 'app'
+if str(app_dir) not in sys.path:
+    sys.path.insert(0, str(app_dir))
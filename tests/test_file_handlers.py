@@ -0,0 +1,84 @@
+"""
+Tests for Excel parsing in utils.file_handlers
+"""
+
+import io
+from datetime import datetime
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+openpyxl = pytest.importorskip('openpyxl')
+
+from utils.file_handlers import ExcelGenerator
+
+
+def _build_workbook(sheets):
+    """Build an .xlsx in memory from {sheet title: (first row, first column, rows)}"""
+    workbook = openpyxl.Workbook()
+    workbook.remove(workbook.active)
+    for title, (first_row, first_column, rows) in sheets.items():
+        worksheet = workbook.create_sheet(title)
+        for row_offset, row in enumerate(rows):
+            for column_offset, value in enumerate(row):
+                if value is not None:
+                    worksheet.cell(row=first_row + row_offset, column=first_column + column_offset, value=value)
+    
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    buffer.name = 'plan.xlsx'
+    return buffer
+
+
+def _assert_same_records(actual, expected):
+    """Compare record lists cell by cell, treating any two NaN-like values as equal"""
+    assert len(actual) == len(expected)
+    for actual_record, expected_record in zip(actual, expected):
+        assert list(actual_record) == list(expected_record)
+        for column, expected_value in expected_record.items():
+            actual_value = actual_record[column]
+            if pd.isna(expected_value):
+                assert pd.isna(actual_value), column
+            else:
+                assert actual_value == expected_value, column
+
+
+def test_parse_xlsx_records_matches_read_excel():
+    sheets = {
+        # Two leading blank rows, then a header row, blank cells, a blank row and NA-like strings
+        'Epics': (3, 1, [
+            ['Name', 'Points', 'Due', 'Note'],
+            ['Checkout', 5, datetime(2024, 1, 15), 'ready'],
+            ['Search', None, None, None],
+            [None, None, None, None],
+            ['Profile', 2.5, datetime(2024, 2, 1), 'NA'],
+            [None, 3, None, 'n/a']
+        ]),
+        # Blank leading column, blank and repeated header names
+        'Stories': (1, 2, [
+            ['Title', None, 'Title', 'Epic'],
+            ['Login', 'x', 'Login again', 'Checkout'],
+            ['Logout', None, None, None]
+        ]),
+        # Not a planning sheet: never parsed
+        'Notes': (1, 1, [['anything']])
+    }
+    buffer = _build_workbook(sheets)
+    
+    parsed = ExcelGenerator._parse_xlsx_records(buffer)
+    
+    assert sorted(parsed) == ['epics', 'stories']
+    for title in ('Epics', 'Stories'):
+        buffer.seek(0)
+        expected = pd.read_excel(buffer, sheet_name=title).to_dict('records')
+        _assert_same_records(parsed[title.lower()], expected)
+
+
+def test_parse_xlsx_records_blank_cells_are_nan():
+    buffer = _build_workbook({'Features': (1, 1, [['Name', 'Owner'], ['Payments', None]])})
+    
+    records = ExcelGenerator._parse_xlsx_records(buffer)['features']
+    
+    assert records[0]['Name'] == 'Payments'
+    owner = records[0]['Owner']
+    assert owner is not None and pd.isna(owner)